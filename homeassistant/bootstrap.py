@@ -83,11 +83,12 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    startup_trace,
     template,
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
 from .setup import (
@@ -231,6 +232,10 @@ SETUP_ORDER = (
     ("debugger", DEBUGGER_INTEGRATIONS),
 )
 
+IMPORT_GRAPH_STORAGE_KEY = "core.import_graph"
+IMPORT_GRAPH_STORAGE_VERSION = 1
+IMPORT_GRAPH_SAVE_DELAY = 60
+
 #
 # Storage keys we are likely to load during startup
 # in order of when we expect to load them.
@@ -279,6 +284,9 @@ async def async_setup_hass(
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
 
+        if runtime_config.trace_startup:
+            startup_trace.async_enable(hass)
+
         return hass
 
     async def stop_hass(hass: core.HomeAssistant) -> None:
@@ -434,6 +442,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -965,6 +974,17 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_prefetch_imports(
+    hass: core.HomeAssistant,
+    store: Store[dict[str, list[str]]],
+    integration_cache: dict[str, loader.Integration],
+) -> None:
+    """Prefetch the imports of the integrations from the stored import graph."""
+    if not (import_graph := await store.async_load()):
+        return
+    await loader.async_prefetch_imports(hass, integration_cache.values(), import_graph)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -976,6 +996,17 @@ async def _async_set_up_integrations(
         hass, config
     )
 
+    # Import the integrations and the platforms they imported on the
+    # previous start in a thread pool while they are being set up.
+    import_graph_store = Store[dict[str, list[str]]](
+        hass, IMPORT_GRAPH_STORAGE_VERSION, IMPORT_GRAPH_STORAGE_KEY, private=True
+    )
+    hass.async_create_background_task(
+        _async_prefetch_imports(hass, import_graph_store, integration_cache),
+        "prefetch imports",
+        eager_start=True,
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1068,6 +1099,12 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    await startup_trace.async_finish(hass)
+
+    import_graph_store.async_delay_save(
+        partial(loader.async_get_import_graph, hass), IMPORT_GRAPH_SAVE_DELAY
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
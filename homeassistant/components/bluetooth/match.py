@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from fnmatch import translate
 from functools import lru_cache
 import re
-from typing import TYPE_CHECKING, Final, TypedDict
+from typing import Final, TypedDict
 
 from lru import LRU
 
@@ -16,10 +16,6 @@ from homeassistant.loader import BluetoothMatcher, BluetoothMatcherOptional
 
 from .models import BluetoothCallback, BluetoothServiceInfoBleak
 
-if TYPE_CHECKING:
-    from bleak.backends.scanner import AdvertisementData
-
-
 MAX_REMEMBER_ADDRESSES: Final = 2048
 
 CALLBACK: Final = "callback"
@@ -71,19 +67,19 @@ class IntegrationMatchHistory:
 
 
 def seen_all_fields(
-    previous_match: IntegrationMatchHistory, advertisement_data: AdvertisementData
+    previous_match: IntegrationMatchHistory, service_info: BluetoothServiceInfoBleak
 ) -> bool:
     """Return if we have seen all fields."""
-    if not previous_match.manufacturer_data and advertisement_data.manufacturer_data:
+    if not previous_match.manufacturer_data and service_info.manufacturer_data:
         return False
-    if advertisement_data.service_data and (
+    if (service_data := service_info.service_data) and (
         not previous_match.service_data
-        or not previous_match.service_data.issuperset(advertisement_data.service_data)
+        or not previous_match.service_data.issuperset(service_data)
     ):
         return False
-    if advertisement_data.service_uuids and (
+    if (service_uuids := service_info.service_uuids) and (
         not previous_match.service_uuids
-        or not previous_match.service_uuids.issuperset(advertisement_data.service_uuids)
+        or not previous_match.service_uuids.issuperset(service_uuids)
     ):
         return False
     return True
@@ -118,14 +114,19 @@ class IntegrationMatcher:
         self._matched_connectable.pop(address, None)
 
     def match_domains(self, service_info: BluetoothServiceInfoBleak) -> set[str]:
-        """Return the domains that are matched."""
-        device = service_info.device
-        advertisement_data = service_info.advertisement
-        connectable = service_info.connectable
-        matched = self._matched_connectable if connectable else self._matched
+        """Return the domains that are matched.
+
+        The fields are read from the service info rather than its
+        advertisement, which would otherwise be created for every
+        advertisement that changed.
+        """
+        address = service_info.address
+        matched = (
+            self._matched_connectable if service_info.connectable else self._matched
+        )
         matched_domains: set[str] = set()
-        if (previous_match := matched.get(device.address)) and seen_all_fields(
-            previous_match, advertisement_data
+        if (previous_match := matched.get(address)) and seen_all_fields(
+            previous_match, service_info
         ):
             # We have seen all fields so we can skip the rest of the matchers
             return matched_domains
@@ -135,16 +136,14 @@ class IntegrationMatcher:
         if not matched_domains:
             return matched_domains
         if previous_match:
-            previous_match.manufacturer_data |= bool(
-                advertisement_data.manufacturer_data
-            )
-            previous_match.service_data |= set(advertisement_data.service_data)
-            previous_match.service_uuids |= set(advertisement_data.service_uuids)
+            previous_match.manufacturer_data |= bool(service_info.manufacturer_data)
+            previous_match.service_data |= set(service_info.service_data)
+            previous_match.service_uuids |= set(service_info.service_uuids)
         else:
-            matched[device.address] = IntegrationMatchHistory(
-                manufacturer_data=bool(advertisement_data.manufacturer_data),
-                service_data=set(advertisement_data.service_data),
-                service_uuids=set(advertisement_data.service_uuids),
+            matched[address] = IntegrationMatchHistory(
+                manufacturer_data=bool(service_info.manufacturer_data),
+                service_data=set(service_info.service_data),
+                service_uuids=set(service_info.service_uuids),
             )
         return matched_domains
 
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -60,6 +61,8 @@ def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
     websocket_api.async_register_command(hass, ws_get_history_during_period)
     websocket_api.async_register_command(hass, ws_stream)
+    websocket_api.async_register_command(hass, ws_columnar_stream)
+    websocket_api.async_register_command(hass, ws_columnar_stream_ack)
 
 
 def _ws_get_significant_states(
@@ -72,6 +75,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
@@ -88,6 +92,7 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
@@ -103,6 +108,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
@@ -167,12 +173,190 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
 
+def _get_columnar_states_chunk(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    after: history.ColumnarStatesPosition | None,
+) -> tuple[dict[str, dict[str, list[Any]]], history.ColumnarStatesPosition | None]:
+    """Read the chunk of significant states after a position."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return history.get_significant_states_columnar_chunk_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            after,
+        )
+
+
+class HistoryColumnarStream:
+    """Track a history columnar stream waiting for the client to read a chunk."""
+
+    __slots__ = ("_acked", "cancelled")
+
+    def __init__(self) -> None:
+        """Initialize the stream."""
+        self._acked = asyncio.Event()
+        self.cancelled = False
+
+    @callback
+    def __call__(self) -> None:
+        """Stop sending the states when the client unsubscribes."""
+        self.cancelled = True
+        self._acked.set()
+
+    @callback
+    def async_ack(self) -> None:
+        """Send the next chunk when the client read the previous one."""
+        self._acked.set()
+
+    async def async_wait_ack(self) -> bool:
+        """Wait until the client read the last chunk or unsubscribed.
+
+        Returns False if the client unsubscribed.
+        """
+        await self._acked.wait()
+        self._acked.clear()
+        return not self.cancelled
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/columnar_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("no_attributes", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_columnar_stream(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle history columnar stream websocket command.
+
+    The history is sent in chunks with the states of each entity
+    as parallel lists of states and timestamps instead of a list
+    of compressed states, which keeps long time periods cheap to
+    query and send. All the chunks but the last one are flagged as
+    partial, the next chunk is only read from the database after
+    the client acknowledged the previous one.
+    """
+    msg_id: int = msg["id"]
+    utc_now = dt_util.utcnow()
+
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+
+    if not start_time or start_time > utc_now:
+        connection.send_error(msg_id, "invalid_start_time", "Invalid start_time")
+        return
+
+    end_time = utc_now
+    if end_time_str := msg.get("end_time"):
+        if (
+            not (parsed_end_time := dt_util.parse_datetime(end_time_str))
+            or (end_time := min(dt_util.as_utc(parsed_end_time), utc_now)) < start_time
+        ):
+            connection.send_error(msg_id, "invalid_end_time", "Invalid end_time")
+            return
+
+    entity_ids: list[str] = msg["entity_ids"]
+    for entity_id in entity_ids:
+        if not hass.states.get(entity_id) and not valid_entity_id(entity_id):
+            connection.send_error(msg_id, "invalid_entity_ids", "Invalid entity_ids")
+            return
+
+    include_start_time_state = msg["include_start_time_state"]
+    no_attributes = msg["no_attributes"]
+    stream = HistoryColumnarStream()
+    connection.subscriptions[msg_id] = stream
+    connection.send_result(msg_id)
+
+    if not entity_ids or (
+        not include_start_time_state
+        and not entities_may_have_state_changes_after(
+            hass, entity_ids, start_time, no_attributes
+        )
+    ):
+        connection.send_message(
+            json_bytes(
+                messages.event_message(
+                    msg_id, _generate_stream_message({}, start_time, end_time)
+                )
+            )
+        )
+        return
+
+    instance = get_instance(hass)
+    after: history.ColumnarStatesPosition | None = None
+    while True:
+        # Every chunk is read by its own job so the database
+        # executor is not held while waiting for the client
+        states, after = await instance.async_add_executor_job(
+            _get_columnar_states_chunk,
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            msg["significant_changes_only"],
+            no_attributes,
+            after,
+        )
+        if stream.cancelled:
+            return
+        message = _generate_stream_message(states, start_time, end_time)
+        if after is not None:
+            message["partial"] = True
+        connection.send_message(json_bytes(messages.event_message(msg_id, message)))
+        if after is None:
+            return
+        if not await stream.async_wait_ack():
+            return
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/columnar_stream/ack",
+        vol.Required("subscription"): int,
+    }
+)
+@callback
+def ws_columnar_stream_ack(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle history columnar stream ack websocket command."""
+    if not isinstance(
+        stream := connection.subscriptions.get(msg["subscription"]),
+        HistoryColumnarStream,
+    ):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Columnar stream not found"
+        )
+        return
+    stream.async_ack()
+    connection.send_result(msg["id"])
+
+
 def _generate_stream_message(
-    states: dict[str, list[dict[str, Any]]],
+    states: dict[str, Any],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
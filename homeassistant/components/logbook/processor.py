@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import chain
 import logging
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -36,6 +38,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -81,6 +84,7 @@ from .models import (
 )
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.context import context_rows_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -180,12 +184,39 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            # Without a time window all the rows are fetched at once
+            rows = cast(
+                Sequence[Row],
+                execute_stmt_lambda_element(session, stmt, orm_rows=False),
             )
+            if not (self.entity_ids or self.device_ids):
+                return self.humanify(rows)
+            # The context rows come first so the origin of
+            # each context is known before the rows are processed
+            return self.humanify(chain(self._get_context_rows(session, rows), rows))
+
+    def _get_context_rows(self, session: Session, rows: Sequence[Row]) -> list[Row]:
+        """Get the rows the contexts of the rows originate from."""
+        context_id_bins = {
+            context_id_bin
+            for row in rows
+            if (context_id_bin := row[CONTEXT_ID_BIN_POS]) is not None
+        }
+        # Each context id is bound in both the events and states lookup
+        max_ids = get_instance(self.hass).max_bind_vars // 2
+        context_rows: list[Row] = []
+        for context_id_bins_chunk in chunked_or_all(context_id_bins, max_ids):
+            context_rows.extend(
+                execute_stmt_lambda_element(
+                    session,
+                    context_rows_stmt(list(context_id_bins_chunk)),
+                    orm_rows=False,
+                )
+            )
+        return context_rows
 
     def humanify(
-        self, rows: Generator[EventAsRow] | Sequence[Row] | Result
+        self, rows: Generator[EventAsRow] | Iterable[Row] | Result
     ) -> list[dict[str, str]]:
         """Humanify rows."""
         return list(
@@ -201,7 +232,7 @@ class EventProcessor:
 
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow] | Iterable[Row] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
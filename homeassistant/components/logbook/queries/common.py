@@ -107,21 +107,6 @@ CONTEXT_ONLY = literal(value="1", type_=sqlalchemy.String).label("context_only")
 NOT_CONTEXT_ONLY = literal(value=None, type_=sqlalchemy.String).label("context_only")
 
 
-def select_events_context_id_subquery(
-    start_day: float,
-    end_day: float,
-    event_type_ids: tuple[int, ...],
-) -> Select:
-    """Generate the select for a context_id subquery."""
-    return (
-        select(Events.context_id_bin)
-        .where((Events.time_fired_ts > start_day) & (Events.time_fired_ts < end_day))
-        .where(Events.event_type_id.in_(event_type_ids))
-        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
-        .outerjoin(EventData, (Events.data_id == EventData.data_id))
-    )
-
-
 def select_events_context_only() -> Select:
     """Generate an events query that mark them as for context_only.
 
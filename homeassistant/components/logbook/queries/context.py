@@ -0,0 +1,50 @@
+"""Context origin queries for logbook."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import lambda_stmt, union_all
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+
+def context_rows_stmt(context_id_bins: Collection[bytes]) -> StatementLambdaElement:
+    """Generate a query to find the rows for the given context ids.
+
+    The rows are marked as context_only and are only used to
+    find the origin of the context of the rows in the logbook.
+    Each context id is a point lookup on the context_id_bin
+    index of the events and states tables.
+    """
+    return lambda_stmt(
+        lambda: union_all(
+            apply_events_context_hints(
+                select_events_context_only()
+                .where(Events.context_id_bin.in_(context_id_bins))
+                .outerjoin(
+                    EventTypes, (Events.event_type_id == EventTypes.event_type_id)
+                )
+                .outerjoin(EventData, (Events.data_id == EventData.data_id))
+            ),
+            apply_states_context_hints(
+                select_states_context_only()
+                .where(States.context_id_bin.in_(context_id_bins))
+                .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+            ),
+        ).order_by("time_fired_ts")
+    )
@@ -83,7 +83,12 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
-from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
+from .util import (
+    EnsureJobAfterCooldown,
+    TopicTrie,
+    get_file_path,
+    mqtt_config_entry_enabled,
+)
 
 if TYPE_CHECKING:
     # Only import for paho-mqtt type checking here, imports are done locally
@@ -117,6 +122,11 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Topics to cache the matching subscriptions of, matching a topic against
+# the subscriptions takes time proportional to its depth so the cache only
+# needs to hold the busiest topics
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 4096
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes  # Only bytes if encoding is None
@@ -267,7 +277,6 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -377,6 +386,7 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions_trie: TopicTrie[Subscription] = TopicTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -624,8 +634,9 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or topic in self._wildcard_subscriptions_trie
         )
 
     async def async_publish(
@@ -755,6 +766,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscriptions_trie.add(subscription.topic, subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -773,6 +785,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions_trie.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -835,9 +848,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1044,18 +1056,11 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        subscriptions = self._wildcard_subscriptions_trie.match(topic)
         if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+            return [*self._simple_subscriptions[topic], *subscriptions]
         return subscriptions
 
     @callback
@@ -1086,6 +1091,10 @@ class MQTT:
         )
         subscriptions = self._matching_subscriptions(topic)
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        # Decode the payload once per encoding so all subscribers get the same
+        # payload object, which allows the value templates of the subscribers
+        # to share the parsed JSON of the payload
+        payload_by_encoding: dict[str, SubscribePayloadType] = {}
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1097,18 +1106,23 @@ class MQTT:
                 self._retained_topics[subscription].add(topic)
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
-                    _LOGGER.warning(
-                        "Can't decode payload %s on %s with encoding %s (for %s)",
-                        msg.payload[0:8192],
-                        topic,
-                        subscription.encoding,
-                        subscription.job,
-                    )
-                    continue
+            if (encoding := subscription.encoding) is not None:
+                if encoding in payload_by_encoding:
+                    payload = payload_by_encoding[encoding]
+                else:
+                    try:
+                        payload = payload_by_encoding[encoding] = msg.payload.decode(
+                            encoding
+                        )
+                    except (AttributeError, UnicodeDecodeError):
+                        _LOGGER.warning(
+                            "Can't decode payload %s on %s with encoding %s (for %s)",
+                            msg.payload[0:8192],
+                            topic,
+                            encoding,
+                            subscription.job,
+                        )
+                        continue
             subscription_topic = subscription.topic
             if subscription_topic not in msg_cache_by_subscription_topic:
                 # Only make one copy of the message
@@ -1247,13 +1261,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
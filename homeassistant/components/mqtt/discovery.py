@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections import deque
 import functools
 from itertools import chain
@@ -73,7 +72,9 @@ class MQTTDiscoveryPayload(dict[str, Any]):
 
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
-    hass.data[DATA_MQTT].discovery_already_discovered.discard(discovery_hash)
+    mqtt_data = hass.data[DATA_MQTT]
+    mqtt_data.discovery_already_discovered.discard(discovery_hash)
+    mqtt_data.discovery_payload_hashes.pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -190,7 +191,8 @@ async def async_start(  # noqa: C901
 ) -> None:
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
-    platform_setup_lock: dict[str, asyncio.Lock] = {}
+    # Payloads waiting for their platform to be set up, by platform
+    platform_setup_pending: dict[str, list[MQTTDiscoveryPayload]] = {}
     integration_discovery_messages: dict[str, int] = {}
 
     @callback
@@ -205,16 +207,18 @@ async def async_start(  # noqa: C901
             hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
         )
 
-    async def _async_component_setup(
-        component: str, discovery_payload: MQTTDiscoveryPayload
-    ) -> None:
-        """Perform component set up."""
-        async with platform_setup_lock.setdefault(component, asyncio.Lock()):
-            if component not in mqtt_data.platforms_loaded:
-                await async_forward_entry_setup_and_setup_discovery(
-                    hass, config_entry, {component}
-                )
-        _async_add_component(discovery_payload)
+    async def _async_component_setup(component: str) -> None:
+        """Perform component set up and add the components waiting for it."""
+        try:
+            await async_forward_entry_setup_and_setup_discovery(
+                hass, config_entry, {component}
+            )
+        finally:
+            discovery_payloads = platform_setup_pending.pop(component)
+        # Add all components in the same event loop iteration
+        # so their entities are added to the platform together
+        for discovery_payload in discovery_payloads:
+            _async_add_component(discovery_payload)
 
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
@@ -239,6 +243,25 @@ async def async_start(  # noqa: C901
 
         component, node_id, object_id = match.groups()
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        # The retained discovery messages are sent again on each reconnect,
+        # skip parsing and dispatching them if nothing changed
+        payload_hash = hash(payload)
+        if (
+            discovery_hash in mqtt_data.discovery_already_discovered
+            and discovery_hash not in mqtt_data.discovery_pending_discovered
+            and mqtt_data.discovery_payload_hashes.get(discovery_hash) == payload_hash
+        ):
+            _LOGGER.debug(
+                "Ignoring unchanged discovery payload for %s %s",
+                component,
+                discovery_id,
+            )
+            return
+
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -253,9 +276,10 @@ async def async_start(  # noqa: C901
         else:
             discovery_payload = MQTTDiscoveryPayload({})
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
+        if discovery_payload:
+            mqtt_data.discovery_payload_hashes[discovery_hash] = payload_hash
+        else:
+            mqtt_data.discovery_payload_hashes.pop(discovery_hash, None)
 
         if discovery_payload:
             # Attach MQTT topic to the payload, used for debug prints
@@ -322,9 +346,11 @@ async def async_start(  # noqa: C901
 
         if component not in mqtt_data.platforms_loaded and payload:
             # Load component first
-            config_entry.async_create_task(
-                hass, _async_component_setup(component, payload)
-            )
+            if (pending := platform_setup_pending.get(component)) is not None:
+                pending.append(payload)
+            else:
+                platform_setup_pending[component] = [payload]
+                config_entry.async_create_task(hass, _async_component_setup(component))
         elif already_discovered:
             # Dispatch update
             message = f"Component has already been discovered: {component} {discovery_id}, sending update"
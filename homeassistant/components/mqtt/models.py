@@ -24,6 +24,7 @@ from homeassistant.helpers.typing import (
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -254,6 +255,39 @@ class MqttValueTemplateException(TemplateError):
         return self._message
 
 
+_NOT_JSON = object()
+
+
+class _JsonPayloadCache:
+    """Cache the JSON of the last rendered payload.
+
+    The MQTT client passes the same payload object to all subscribers of
+    a message, so the value templates of all entities handling the
+    message share a single parse of the payload. The parsed JSON is only
+    exposed to templates, which cannot modify it.
+    """
+
+    __slots__ = ("_payload", "_value_json")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._payload: ReceivePayloadType | None = None
+        self._value_json: Any = _NOT_JSON
+
+    def get(self, payload: ReceivePayloadType) -> Any:
+        """Return the payload parsed as JSON or _NOT_JSON if it is not JSON."""
+        if payload is not self._payload:
+            try:
+                self._value_json = json_loads(payload)
+            except JSON_DECODE_EXCEPTIONS:
+                self._value_json = _NOT_JSON
+            self._payload = payload
+        return self._value_json
+
+
+_json_payload_cache = _JsonPayloadCache()
+
+
 class MqttValueTemplate:
     """Class for rendering MQTT value template with possible json values."""
 
@@ -284,6 +318,13 @@ class MqttValueTemplate:
             return payload
 
         values: dict[str, Any] = {}
+        render_kwargs: dict[str, Any] = {"variables": values}
+        # Static templates are rendered without the payload
+        if not self._value_template.is_static:
+            if (value_json := _json_payload_cache.get(payload)) is _NOT_JSON:
+                render_kwargs["parse_value_json"] = False
+            else:
+                render_kwargs["value_json"] = value_json
 
         if variables is not None:
             values.update(variables)
@@ -310,7 +351,7 @@ class MqttValueTemplate:
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
+                        payload, **render_kwargs
                     )
                 )
             except TEMPLATE_ERRORS as exc:
@@ -336,7 +377,7 @@ class MqttValueTemplate:
         try:
             rendered_payload = (
                 self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
+                    payload, default, **render_kwargs
                 )
             )
         except TEMPLATE_ERRORS as exc:
@@ -395,6 +436,7 @@ class MqttData:
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
+    discovery_payload_hashes: dict[tuple[str, str], int] = field(default_factory=dict)
     discovery_registry_hooks: dict[tuple[str, str], CALLBACK_TYPE] = field(
         default_factory=dict
     )
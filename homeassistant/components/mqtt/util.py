@@ -145,6 +145,95 @@ class EnsureJobAfterCooldown:
             _LOGGER.exception("Error cleaning up task")
 
 
+class _TopicTrieNode[_T]:
+    """A level of a topic trie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.values: set[_T] = set()
+
+
+class TopicTrie[_T]:
+    """Index values by MQTT topic filter.
+
+    Each level of a topic filter, including the `+` and `#` wildcards,
+    is a node in the trie so the filters matching a topic are found in
+    time proportional to the number of levels of the topic instead of
+    the number of topic filters.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.values.add(value)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.values.remove(value)
+        # Prune the nodes which are no longer used
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if there are values for the exact topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of the topic filters matching a topic.
+
+        Wildcards on the first level do not match topics starting
+        with `$` as required by the MQTT specification.
+        """
+        levels = topic.split("/")
+        depth = len(levels)
+        matches: list[_T] = []
+        stack: list[tuple[_TopicTrieNode[_T], int]] = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            wildcards = index or not topic.startswith("$")
+            # `#` also matches the parent level, `sport/#` matches `sport`
+            if wildcards and (multi := children.get("#")) is not None:
+                matches.extend(multi.values)
+            if index == depth:
+                matches.extend(node.values)
+                continue
+            if (child := children.get(levels[index])) is not None:
+                stack.append((child, index + 1))
+            if wildcards and (single := children.get("+")) is not None:
+                stack.append((single, index + 1))
+        return matches
+
+
 def platforms_from_config(config: list[ConfigType]) -> set[Platform | str]:
     """Return the platforms to be set up."""
     return {key for platform in config for key in platform}
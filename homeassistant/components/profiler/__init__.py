@@ -17,7 +17,7 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
@@ -40,6 +40,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_EVENT_LISTENER_STATS = "start_event_listener_stats"
+SERVICE_STOP_EVENT_LISTENER_STATS = "stop_event_listener_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +65,8 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_EVENT_LISTENER_STATS,
+    SERVICE_STOP_EVENT_LISTENER_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -273,6 +277,42 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    @callback
+    def _async_start_event_listener_stats(call: ServiceCall) -> None:
+        if hass.bus.listener_stats_enabled:
+            raise HomeAssistantError("Event listener statistics already started")
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Event listener statistics are being recorded. Stop them to log"
+                " the statistics to [the logs](/config/logs)."
+            ),
+            title="Event listener statistics started",
+            notification_id="profile_event_listener_stats",
+        )
+        hass.bus.async_enable_listener_stats()
+
+    @callback
+    def _async_stop_event_listener_stats(call: ServiceCall) -> None:
+        if not hass.bus.listener_stats_enabled:
+            raise HomeAssistantError("Event listener statistics not running")
+
+        persistent_notification.async_dismiss(hass, "profile_event_listener_stats")
+        for stats in hass.bus.async_listener_stats():
+            _LOGGER.critical(
+                "Event listener %s (%s): %s calls, %.6fs total, p50 %.6fs, p99 %.6fs",
+                stats["name"],
+                stats["integration"],
+                stats["calls"],
+                stats["total_time"],
+                stats["p50"],
+                stats["p99"],
+            )
+        hass.bus.async_disable_listener_stats()
+
+    websocket_api.async_register_command(hass, websocket_event_listener_stats)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,6 +422,20 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_EVENT_LISTENER_STATS,
+        _async_start_event_listener_stats,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_EVENT_LISTENER_STATS,
+        _async_stop_event_listener_stats,
+    )
+
     return True
 
 
@@ -391,10 +445,29 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.bus.async_disable_listener_stats()
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "profiler/event_listener_stats"}
+)
+@callback
+def websocket_event_listener_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the recorded event listener statistics."""
+    connection.send_result(
+        msg["id"],
+        {
+            "enabled": hass.bus.listener_stats_enabled,
+            "listeners": hass.bus.async_listener_stats(),
+        },
+    )
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
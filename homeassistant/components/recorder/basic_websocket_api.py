@@ -9,6 +9,7 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
 
+from .const import DATA_STATISTICS_DURING_PERIOD_CACHE
 from .util import get_instance
 
 
@@ -45,12 +46,22 @@ def ws_info(
         is_running = False
         max_backlog = None
 
+    # The cache is created by the first statistics query
+    if statistics_cache := hass.data.get(DATA_STATISTICS_DURING_PERIOD_CACHE):
+        statistics_cache_info = {
+            "hits": statistics_cache.hits,
+            "misses": statistics_cache.misses,
+        }
+    else:
+        statistics_cache_info = {"hits": 0, "misses": 0}
+
     recorder_info = {
         "backlog": backlog,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
         "recording": recording,
+        "statistics_cache": statistics_cache_info,
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
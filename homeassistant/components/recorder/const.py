@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
@@ -13,6 +13,7 @@ from homeassistant.const import (
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,  # noqa: F401
 )
 from homeassistant.helpers.json import JSON_DUMP  # noqa: F401
+from homeassistant.util.signal_type import SignalType
 
 if TYPE_CHECKING:
     from .core import Recorder  # noqa: F401
@@ -30,6 +31,14 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# Once the backlog passes this size events are spilled to disk
+# until the database has caught up with them
+SPILL_BACKLOG_THRESHOLD = 20000
+MAX_SPILL_SIZE = 1024**3
+SPILL_DIR = "recorder_spill"
+
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -66,6 +75,10 @@ INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
 INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES = "update_statistics_issues"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
 
+SIGNAL_COMPILE_MISSING_STATISTICS_PROGRESS: SignalType[dict[str, Any]] = SignalType(
+    "recorder_compile_missing_statistics_progress"
+)
+
 INTEGRATION_PLATFORM_METHODS = {
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
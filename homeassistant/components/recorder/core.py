@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable, Iterable
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
 import logging
+import os
 import queue
 import sqlite3
 import threading
@@ -58,9 +60,12 @@ from .const import (
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
+    MAX_SPILL_SIZE,
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SPILL_BACKLOG_THRESHOLD,
+    SPILL_DIR,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
@@ -88,6 +93,7 @@ from .migration import (
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
+from .spill import SpillLog, SpillPosition, decode_events, encode_event
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -108,6 +114,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    RecordSpilledEventsTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -149,6 +156,13 @@ DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 
+# The maximum number of queued events to resolve ids for in bulk
+MAX_BACKLOG_EVENTS_PER_BATCH = 1000
+
+# How long to wait before trying to record spilled events
+# again after the database failed
+SPILL_REPLAY_RETRY_INTERVAL = 30
+
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
@@ -187,6 +201,16 @@ class Recorder(threading.Thread):
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        # Set when the queue is drained at close so the recorder thread
+        # also drops the backlog it has already taken from the queue
+        self._queue_drained = False
+        self._spill_path = hass.config.path(SPILL_DIR)
+        self._spill: SpillLog | None = None
+        self._spill_full = False
+        self._next_spill_replay = 0.0
+        # Tasks queued while spilling and the end of the spill log when
+        # they were queued, they run once the log is replayed up to there
+        self._spill_deferred_tasks: deque[tuple[SpillPosition, RecorderTask]] = deque()
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
@@ -227,6 +251,7 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.compiling_missing_statistics = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -438,6 +463,7 @@ class Recorder(threading.Thread):
         # We drain all the events in the queue and then insert
         # an empty one to ensure the next thing the recorder sees
         # is a request to shutdown.
+        self._queue_drained = True
         while True:
             try:
                 self._queue.get_nowait()
@@ -829,31 +855,244 @@ class Recorder(threading.Thread):
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
-        startup_task_or_events: list[RecorderTask | Event] = []
-        while not queue_.empty() and (task_or_event := queue_.get_nowait()):
-            startup_task_or_events.append(task_or_event)
-        self._pre_process_startup_events(startup_task_or_events)
-        for task in startup_task_or_events:
-            self._guarded_process_one_task_or_event_or_recover(task)
+        if os.path.isdir(self._spill_path) and self._open_spill_log():
+            # Events spilled before the last shutdown are recorded
+            # before the events that were queued during startup
+            _LOGGER.warning(
+                "Recording the events spilled to %s before the last shutdown",
+                self._spill_path,
+            )
+        else:
+            startup_task_or_events: list[RecorderTask | Event] = []
+            while not queue_.empty() and (task_or_event := queue_.get_nowait()):
+                startup_task_or_events.append(task_or_event)
+            self._pre_process_startup_events(startup_task_or_events)
+            for task in startup_task_or_events:
+                self._guarded_process_one_task_or_event_or_recover(task)
 
-        # Clear startup tasks since this thread runs forever
-        # and we don't want to hold them in memory
-        del startup_task_or_events
+            # Clear startup tasks since this thread runs forever
+            # and we don't want to hold them in memory
+            del startup_task_or_events
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_event_or_recover(queue_.get())
+            if self._spill is not None:
+                self._spill_or_replay_one_task_or_event()
+                continue
+            task_or_event = queue_.get()
+            # Only the recorder thread takes from the queue so if
+            # it is not empty there is a backlog of work to process.
+            # Event is never subclassed so we can use a fast type check
+            if type(task_or_event) is not Event or queue_.empty():
+                self._guarded_process_one_task_or_event_or_recover(task_or_event)
+            elif queue_.qsize() >= SPILL_BACKLOG_THRESHOLD and self._open_spill_log():
+                _LOGGER.warning(
+                    (
+                        "The recorder backlog queue reached %s events; Events will "
+                        "be spilled to %s until the database has caught up"
+                    ),
+                    queue_.qsize(),
+                    self._spill_path,
+                )
+                self._spill_event(task_or_event)
+            else:
+                self._process_event_backlog(task_or_event)
+
+        if self._spill is not None:
+            self._spill.close()
+        self._spill_deferred_tasks.clear()
+
+    def _open_spill_log(self) -> bool:
+        """Open the spill log and start spilling events to it."""
+        try:
+            self._spill = SpillLog(self._spill_path, MAX_SPILL_SIZE)
+        except OSError:
+            _LOGGER.exception("Error opening the spill log at %s", self._spill_path)
+            return False
+        self._next_spill_replay = 0.0
+        return True
+
+    def _spill_event(self, event: Event) -> None:
+        """Append an event to the spill log."""
+        assert self._spill is not None
+        if (record := encode_event(event)) is None:
+            return
+        try:
+            appended = self._spill.append(record)
+        except OSError:
+            _LOGGER.exception("Error spilling event %s", event)
+            return
+        if not appended and not self._spill_full:
+            self._spill_full = True
+            _LOGGER.error(
+                (
+                    "The recorder spill log reached the maximum size of %s bytes; "
+                    "Events will be dropped until the database has caught up"
+                ),
+                MAX_SPILL_SIZE,
+            )
+
+    def _spill_or_replay_one_task_or_event(self) -> None:
+        """Spill the next queued event or replay spilled events when idle.
+
+        Once events are spilled every new event is spilled as well so
+        they are all recorded in order. Tasks that depend on the order
+        of the events, like compiling statistics, are deferred until the
+        events queued before them have been replayed, the other tasks
+        are processed right away.
+        """
+        assert self._spill is not None
+        queue_ = self._queue
+        if queue_.empty():
+            self._spill.flush()
+            if (timeout := self._next_spill_replay - time.monotonic()) <= 0:
+                self._replay_spilled_events()
+                return
+            try:
+                task_or_event = queue_.get(timeout=timeout)
+            except queue.Empty:
+                return
+        else:
+            task_or_event = queue_.get_nowait()
+        if type(task_or_event) is Event:
+            self._spill_event(task_or_event)
+            return
+        if TYPE_CHECKING:
+            assert isinstance(task_or_event, RecorderTask)
+        if task_or_event.defer_while_spilling:
+            self._spill_deferred_tasks.append((self._spill.end, task_or_event))
+        else:
+            self._guarded_process_one_task_or_event_or_recover(task_or_event)
+
+    def _replay_spilled_events(self) -> None:
+        """Record the next batch of spilled events.
+
+        The batch is only removed from the spill log once it has been
+        committed so it is retried if the database fails again. The
+        batch ends at the next deferred task, which runs once the batch
+        has been recorded.
+        """
+        spill = self._spill
+        assert spill is not None
+        self._run_spill_deferred_tasks(spill.head)
+        deferred_tasks = self._spill_deferred_tasks
+        try:
+            records, position = spill.read(
+                MAX_BACKLOG_EVENTS_PER_BATCH,
+                deferred_tasks[0][0] if deferred_tasks else None,
+            )
+        except OSError:
+            _LOGGER.exception("Error reading the spill log at %s", spill.path)
+            self._next_spill_replay = time.monotonic() + SPILL_REPLAY_RETRY_INTERVAL
+            return
+        task = RecordSpilledEventsTask(decode_events(records))
+        self._guarded_process_one_task_or_event_or_recover(task)
+        if not task.recorded:
+            _LOGGER.warning(
+                "Error recording %s spilled events, retrying in %s seconds",
+                len(task.events),
+                SPILL_REPLAY_RETRY_INTERVAL,
+            )
+            self._next_spill_replay = time.monotonic() + SPILL_REPLAY_RETRY_INTERVAL
+            return
+        try:
+            spill.consume(position)
+            if spill.empty:
+                spill.remove()
+        except OSError:
+            _LOGGER.exception("Error updating the spill log at %s", spill.path)
+            self._next_spill_replay = time.monotonic() + SPILL_REPLAY_RETRY_INTERVAL
+            return
+        if spill.empty:
+            _LOGGER.warning("Recorded all the events spilled to %s", spill.path)
+            self._spill = None
+            self._spill_full = False
+            self._run_spill_deferred_tasks(None)
+        else:
+            self._run_spill_deferred_tasks(spill.head)
+
+    def _record_spilled_events(self, events: list[Event[Any]]) -> None:
+        """Record events read back from the spill log.
+
+        The batch is committed at once even if the commit interval is
+        zero so it is never partially recorded. Events that cannot be
+        recorded are skipped instead of failing the batch.
+        """
+        if not events or not self.enabled:
+            return
+        try:
+            self._pre_process_events(events)
+        except SQLAlchemyError:
+            raise
+        except Exception:
+            _LOGGER.exception("Error resolving ids for %s spilled events", len(events))
+        for event in events:
+            try:
+                if event.event_type == EVENT_STATE_CHANGED:
+                    self._process_state_changed_event_into_session(event)
+                else:
+                    self._process_non_state_changed_event_into_session(event)
+            except SQLAlchemyError:
+                raise
+            except Exception:
+                _LOGGER.exception("Error recording spilled event %s", event)
+        self._commit_event_session()
+
+    def _run_spill_deferred_tasks(self, position: SpillPosition | None) -> None:
+        """Run the deferred tasks queued before position, or all if None."""
+        deferred_tasks = self._spill_deferred_tasks
+        while deferred_tasks and (position is None or deferred_tasks[0][0] <= position):
+            self._guarded_process_one_task_or_event_or_recover(
+                deferred_tasks.popleft()[1]
+            )
+
+    def _process_event_backlog(self, event: Event[Any]) -> None:
+        """Process a backlog of events.
+
+        The events waiting in the queue are taken together so the
+        ids they reference can be resolved with one query per table
+        instead of one query per event.
+        """
+        queue_ = self._queue
+        backlog: list[RecorderTask | Event[Any]] = [event]
+        while len(backlog) < MAX_BACKLOG_EVENTS_PER_BATCH and not queue_.empty():
+            task_or_event = queue_.get_nowait()
+            backlog.append(task_or_event)
+            if type(task_or_event) is not Event:
+                # Tasks must run after all events queued before them
+                break
+
+        if self.enabled:
+            try:
+                self._pre_process_events(backlog)
+            except SQLAlchemyError:
+                _LOGGER.exception(
+                    "SQLAlchemyError error resolving ids for %s events", len(backlog)
+                )
+                self._reopen_event_session()
+
+        for task_or_event in backlog:
+            if self._queue_drained:
+                # Shutting down, the backlog is dropped with the rest of the queue
+                return
+            self._guarded_process_one_task_or_event_or_recover(task_or_event)
 
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event[Any]]
     ) -> None:
         """Pre process startup events."""
+        self._pre_process_events(startup_task_or_events)
+
+    def _pre_process_events(
+        self, task_or_events: Iterable[RecorderTask | Event[Any]]
+    ) -> None:
+        """Resolve the ids of the events in bulk."""
         # Prime all the state_attributes and event_data caches
         # before we start processing events
         state_change_events: list[Event[EventStateChangedData]] = []
         non_state_change_events: list[Event] = []
 
-        for task_or_event in startup_task_or_events:
+        for task_or_event in task_or_events:
             # Event is never subclassed so we can
             # use a fast type check
             if type(task_or_event) is Event:
@@ -1445,6 +1684,7 @@ class Recorder(threading.Thread):
 
     def _schedule_compile_missing_statistics(self) -> None:
         """Add tasks for missing statistics runs."""
+        self.compiling_missing_statistics = True
         self.queue_task(CompileMissingStatisticsTask())
 
     def _end_session(self) -> None:
@@ -7,15 +7,24 @@ from typing import Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .downsample import downsample_states
 from .modern import (
+    DEFAULT_COLUMNAR_CHUNK_SIZE,
+    ColumnarStatesPosition,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar_chunk_with_session as _modern_get_significant_states_columnar_chunk_with_session,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -24,9 +33,11 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "ColumnarStatesPosition",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar_chunk_with_session",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -91,8 +102,13 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    If max_points is given numeric states are downsampled
+    to about max_points states per entity.
+    """
     if not get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states as _legacy_get_significant_states,
@@ -101,7 +117,7 @@ def get_significant_states(
         _target = _legacy_get_significant_states
     else:
         _target = _modern_get_significant_states
-    return _target(
+    result = _target(
         hass,
         start_time,
         end_time,
@@ -113,6 +129,12 @@ def get_significant_states(
         no_attributes,
         compressed_state_format,
     )
+    if max_points is None:
+        return result
+    return {
+        entity_id: downsample_states(states, max_points)
+        for entity_id, states in result.items()
+    }
 
 
 def get_significant_states_with_session(
@@ -152,6 +174,56 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_states_columnar_chunk_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+    after: ColumnarStatesPosition | None = None,
+    chunk_size: int = DEFAULT_COLUMNAR_CHUNK_SIZE,
+) -> tuple[dict[str, dict[str, list[Any]]], ColumnarStatesPosition | None]:
+    """Return a chunk of the significant states during a time period."""
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_columnar_chunk_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            after,
+            chunk_size,
+        )
+    # The legacy schema does not support reading the rows in chunks
+    # so all the states are returned in a single chunk
+    keys = [COMPRESSED_STATE_STATE, COMPRESSED_STATE_LAST_UPDATED]
+    if not no_attributes:
+        keys.append(COMPRESSED_STATE_ATTRIBUTES)
+    return {
+        entity_id: {key: [state[key] for state in states] for key in keys}  # type: ignore[index]
+        for entity_id, states in get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            no_attributes,
+            True,
+        ).items()
+        if states
+    }, None
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
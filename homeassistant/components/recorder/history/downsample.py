@@ -0,0 +1,58 @@
+"""Downsample history so it can be rendered without sending every state."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from homeassistant.const import COMPRESSED_STATE_STATE
+from homeassistant.core import State
+
+from .const import STATE_KEY
+
+
+def _numeric_value(state: State | dict[str, Any]) -> float | None:
+    """Return the numeric value of a state or None if it is not numeric."""
+    if isinstance(state, dict):
+        value = state.get(COMPRESSED_STATE_STATE, state.get(STATE_KEY))
+    else:
+        value = state.state
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def downsample_states[_StateT: State | dict[str, Any]](
+    states: list[_StateT], max_points: int
+) -> list[_StateT]:
+    """Downsample a list of states to about max_points states.
+
+    The numeric states are split in buckets and only the minimum and
+    maximum of each bucket are kept so spikes are still visible. The
+    first and last states and the states that are not numeric, like
+    unavailable, are always kept. Lists without numeric states are
+    returned as is.
+    """
+    if len(states) <= max_points:
+        return states
+    values = [_numeric_value(state) for state in states]
+    last = len(states) - 1
+    numeric = [
+        idx for idx, value in enumerate(values) if value is not None and 0 < idx < last
+    ]
+    if not numeric:
+        return states
+    keep = {0, last}
+    keep.update(idx for idx, value in enumerate(values) if value is None)
+    buckets = max(1, (max_points - len(keep)) // 2)
+    bucket_size = len(numeric) / buckets
+    value_of = values.__getitem__
+    for bucket in range(buckets):
+        if bucket_idx := numeric[
+            int(bucket * bucket_size) : int((bucket + 1) * bucket_size)
+        ]:
+            keep.add(min(bucket_idx, key=value_of))  # type: ignore[arg-type]
+            keep.add(max(bucket_idx, key=value_of))  # type: ignore[arg-type]
+    return [states[idx] for idx in sorted(keep)]
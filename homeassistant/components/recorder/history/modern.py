@@ -6,7 +6,7 @@ from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from sqlalchemy import (
     CompoundSelect,
@@ -21,8 +21,13 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
@@ -37,6 +42,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -45,6 +51,8 @@ from .const import (
     STATE_KEY,
 )
 
+DEFAULT_COLUMNAR_CHUNK_SIZE = 5000
+
 _FIELD_MAP = {
     "metadata_id": 0,
     "state": 1,
@@ -90,6 +98,7 @@ def _select_from_subquery(
     no_attributes: bool,
     include_last_changed: bool,
     include_last_reported: bool,
+    include_state_id: bool = False,
 ) -> Select:
     """Return the statement to select from the union."""
     base_select = select(
@@ -101,6 +110,8 @@ def _select_from_subquery(
         base_select = base_select.add_columns(subquery.c.last_changed_ts)
     if include_last_reported:
         base_select = base_select.add_columns(subquery.c.last_reported_ts)
+    if include_state_id:
+        base_select = base_select.add_columns(subquery.c.state_id)
     if no_attributes:
         return base_select
     return base_select.add_columns(subquery.c.attributes)
@@ -145,8 +156,17 @@ def _significant_states_stmt(
     no_attributes: bool,
     include_start_time_state: bool,
     run_start_ts: float | None,
+    after_last_updated_ts: float | None = None,
+    after_state_id: int | None = None,
+    limit: int | None = None,
 ) -> Select | CompoundSelect:
-    """Query the database for significant state changes."""
+    """Query the database for significant state changes.
+
+    When limit is given the state_id is selected as well and the states
+    are ordered by it after last_updated, so reading can be continued
+    after the last state that was read by passing its last_updated
+    timestamp and state_id as after_last_updated_ts and after_state_id.
+    """
     include_last_changed = not significant_changes_only
     stmt = _stmt_and_join_attributes(no_attributes, include_last_changed, False)
     if significant_changes_only:
@@ -169,36 +189,70 @@ def _significant_states_stmt(
     )
     if end_time_ts:
         stmt = stmt.filter(States.last_updated_ts < end_time_ts)
+    if after_state_id:
+        # States updated at the same time are ordered by their state_id
+        stmt = stmt.filter(
+            (States.last_updated_ts > after_last_updated_ts)
+            | (
+                (States.last_updated_ts == after_last_updated_ts)
+                & (States.state_id > after_state_id)
+            )
+        )
+    include_state_id = bool(limit)
+    if include_state_id:
+        stmt = stmt.add_columns(States.state_id)
     if not no_attributes:
         stmt = stmt.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
     if not include_start_time_state or not run_start_ts:
-        return stmt.order_by(States.metadata_id, States.last_updated_ts)
+        if not include_state_id:
+            return stmt.order_by(States.metadata_id, States.last_updated_ts)
+        return stmt.order_by(
+            States.metadata_id, States.last_updated_ts, States.state_id
+        ).limit(limit)
+    start_time_state_stmt = _get_start_time_state_stmt(
+        run_start_ts,
+        start_time_ts,
+        single_metadata_id,
+        metadata_ids,
+        no_attributes,
+        include_last_changed,
+    )
+    if include_state_id:
+        start_time_state_stmt = start_time_state_stmt.add_columns(States.state_id)
     unioned_subquery = union_all(
         _select_from_subquery(
-            _get_start_time_state_stmt(
-                run_start_ts,
-                start_time_ts,
-                single_metadata_id,
-                metadata_ids,
-                no_attributes,
-                include_last_changed,
-            ).subquery(),
+            start_time_state_stmt.subquery(),
             no_attributes,
             include_last_changed,
             False,
+            include_state_id,
         ),
         _select_from_subquery(
-            stmt.subquery(), no_attributes, include_last_changed, False
+            stmt.subquery(),
+            no_attributes,
+            include_last_changed,
+            False,
+            include_state_id,
         ),
     ).subquery()
-    return _select_from_subquery(
+    unioned_stmt = _select_from_subquery(
         unioned_subquery,
         no_attributes,
         include_last_changed,
         False,
-    ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
+        include_state_id,
+    )
+    if not include_state_id:
+        return unioned_stmt.order_by(
+            unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts
+        )
+    return unioned_stmt.order_by(
+        unioned_subquery.c.metadata_id,
+        unioned_subquery.c.last_updated_ts,
+        unioned_subquery.c.state_id,
+    ).limit(limit)
 
 
 def get_significant_states_with_session(
@@ -229,6 +283,60 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    after_last_updated_ts: float | None = None,
+    after_state_id: int | None = None,
+    limit: int | None = None,
+) -> (
+    tuple[
+        StatementLambdaElement | Select | CompoundSelect,
+        dict[str, int | None],
+        float | None,
+    ]
+    | None
+):
+    """Return the statement to query the significant states of entity_ids.
+
+    If limit is given at most limit states are queried, continuing after
+    the state given by after_last_updated_ts and after_state_id if it is
+    given. The statement is returned with the entity_id to
+    metadata_id map and the start time timestamp the start time states
+    should be given, or None if no states have been recorded for any of
+    the entities.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -237,7 +345,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -254,6 +362,28 @@ def get_significant_states_with_session(
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    if limit:
+        # The limited statements are not lambda statements since
+        # SQLAlchemy mixes up the closure variables of lambdas
+        # with more than ten of them
+        return (
+            _significant_states_stmt(
+                start_time_ts,
+                end_time_ts,
+                single_metadata_id,
+                metadata_ids,
+                metadata_ids_in_significant_domains,
+                significant_changes_only,
+                no_attributes,
+                include_start_time_state,
+                run_start_ts,
+                after_last_updated_ts,
+                after_state_id,
+                limit,
+            ),
+            entity_id_to_metadata_id,
+            start_time_ts if include_start_time_state else None,
+        )
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
@@ -275,17 +405,174 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
+class ColumnarStatesPosition(NamedTuple):
+    """The last state of a chunk of columnar states."""
+
+    entity_id: str
+    last_updated_ts: float
+    state_id: int
+    state: str | None
+
+
+def get_significant_states_columnar_chunk_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+    after: ColumnarStatesPosition | None = None,
+    chunk_size: int = DEFAULT_COLUMNAR_CHUNK_SIZE,
+) -> tuple[dict[str, dict[str, list[Any]]], ColumnarStatesPosition | None]:
+    """Return a chunk of the significant states during a time period.
+
+    The chunk holds at most chunk_size states in a columnar layout
+    {'entity_id': {'s': [states], 'lu': [last_updated], 'a': [attributes]}}
+    so long time periods can be sent without holding all the states in
+    memory. The states of an entity may be split across several chunks.
+
+    The position of the last state is returned when there are more
+    states, the next chunk is read by passing it as after. Every chunk
+    is read by its own queries which are limited to chunk_size + 1 rows
+    and continue after the last state that was read, so no cursor is
+    kept open between chunks.
+
+    When no_attributes is set the attributes are left out and consecutive
+    duplicate states are filtered out since only the state is returned.
+    """
+    limit = chunk_size + 1
+    chunk: dict[str, dict[str, list[Any]]] = {}
+    chunk_states = 0
+    entity_id = row_entity_id = after.entity_id if after else ""
+    prev_state = after.state if after else None
+    position = after
+    read_position = after
+    states: list[Any] = []
+    last_updated: list[Any] = []
+    attributes: list[Any] = []
+    attr_cache: dict[str, dict[str, Any]] = {}
+    metadata_id_idx = _FIELD_MAP["metadata_id"]
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    while True:
+        queries: list[tuple[list[str], float | None, int | None, bool]] = [
+            (entity_ids, None, None, include_start_time_state)
+        ]
+        if read_position is not None:
+            # The states are sorted by metadata_id, last_updated and state_id,
+            # continue with the states of the entity the last state that was
+            # read belongs to and then with the entities which are sorted after it
+            entity_id_to_metadata_id = get_instance(hass).states_meta_manager.get_many(
+                entity_ids, session, False
+            )
+            after_metadata_id = cast(
+                int, entity_id_to_metadata_id[read_position.entity_id]
+            )
+            queries = [
+                (
+                    [read_position.entity_id],
+                    read_position.last_updated_ts,
+                    read_position.state_id,
+                    False,
+                ),
+                (
+                    [
+                        entity_id
+                        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+                        if metadata_id is not None and metadata_id > after_metadata_id
+                    ],
+                    None,
+                    None,
+                    include_start_time_state,
+                ),
+            ]
+        for (
+            query_entity_ids,
+            query_after_last_updated_ts,
+            query_after_state_id,
+            query_include_start_time_state,
+        ) in queries:
+            if not query_entity_ids or not (
+                query := _significant_states_query(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    query_entity_ids,
+                    query_include_start_time_state,
+                    significant_changes_only,
+                    no_attributes,
+                    query_after_last_updated_ts,
+                    query_after_state_id,
+                    limit,
+                )
+            ):
+                continue
+            stmt, entity_id_to_metadata_id, start_time_ts = query
+            metadata_id_to_entity_id = {
+                v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+            }
+            current_metadata_id: int | None = None
+            rows = 0
+            # Rows are sorted by metadata_id and last_updated so only the
+            # entity that is currently being read has to be tracked.
+            for row in execute_stmt_lambda_element(
+                session, stmt, yield_per=limit, orm_rows=False, stream=True
+            ):
+                rows += 1
+                if (metadata_id := row[metadata_id_idx]) != current_metadata_id:
+                    current_metadata_id = metadata_id
+                    row_entity_id = metadata_id_to_entity_id[metadata_id]
+                    attr_cache = {}
+                state = row[state_idx]
+                row_last_updated_ts = row[last_updated_ts_idx]
+                read_position = ColumnarStatesPosition(
+                    row_entity_id, row_last_updated_ts, row.state_id, state
+                )
+                if no_attributes and row_entity_id == entity_id and state == prev_state:
+                    continue
+                if chunk_states >= chunk_size:
+                    # There are more states, the next chunk
+                    # continues after the last state of this one
+                    assert position is not None
+                    return chunk, position
+                entity_id = row_entity_id
+                prev_state = state
+                position = read_position
+                if entity_id not in chunk:
+                    columns: dict[str, list[Any]] = {
+                        COMPRESSED_STATE_STATE: (states := []),
+                        COMPRESSED_STATE_LAST_UPDATED: (last_updated := []),
+                    }
+                    if not no_attributes:
+                        columns[COMPRESSED_STATE_ATTRIBUTES] = attributes = []
+                    chunk[entity_id] = columns
+                states.append(state)
+                last_updated.append(row_last_updated_ts or start_time_ts)
+                if not no_attributes:
+                    attributes.append(
+                        decode_attributes_from_source(
+                            getattr(row, "attributes", None), attr_cache
+                        )
+                    )
+                chunk_states += 1
+            if rows == limit:
+                # Duplicate states were filtered out so the chunk is not
+                # full yet, continue after the last state that was read
+                break
+        else:
+            return chunk, None
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
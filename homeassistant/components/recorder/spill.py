@@ -0,0 +1,349 @@
+"""Spill events to disk while the database cannot keep up with them.
+
+The spill log is an append-only log of events split into segment files.
+Each record is a length and a crc32 followed by the event encoded as
+JSON. Events are appended to the newest segment and read back in order
+from the head, segments that have been read completely are removed.
+
+The head position is stored after every batch of events that has been
+committed to the database so the events are not recorded twice if Home
+Assistant is restarted before the log has been replayed. Segments are
+synced to disk when they are flushed and the head is synced before it
+replaces the previous one, so neither is truncated by a power loss.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+import logging
+import os
+import struct
+from typing import IO, Any
+import zlib
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventStateChangedData, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, json_loads_object
+
+from .db_schema import EVENT_ORIGIN_ORDER
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SIZE = 16 * 1024**2
+SEGMENT_SUFFIX = ".log"
+HEAD_FILE = "head"
+
+# length, crc32
+_RECORD = struct.Struct("<II")
+# segment, offset
+_HEAD = struct.Struct("<QQ")
+
+type SpillPosition = tuple[int, int]
+
+
+def _encode_context(context: Context) -> list[str | None]:
+    """Encode a context."""
+    return [context.id, context.user_id, context.parent_id]
+
+
+def _decode_context(context: list[str | None]) -> Context:
+    """Decode a context."""
+    return Context(id=context[0], user_id=context[1], parent_id=context[2])
+
+
+def _encode_state(state: State | None) -> list[Any] | None:
+    """Encode a state with the timestamps the recorder needs."""
+    if state is None:
+        return None
+    state_info = state.state_info
+    return [
+        state.state,
+        state.attributes,
+        state.last_changed_timestamp,
+        state.last_updated_timestamp,
+        state.last_reported_timestamp,
+        _encode_context(state.context),
+        list(state_info["unrecorded_attributes"]) if state_info else None,
+    ]
+
+
+def _decode_state(entity_id: str, state: list[Any] | None) -> State | None:
+    """Decode a state."""
+    if state is None:
+        return None
+    (
+        state_value,
+        attributes,
+        last_changed_ts,
+        last_updated_ts,
+        last_reported_ts,
+        context,
+        unrecorded_attributes,
+    ) = state
+    return State(
+        entity_id,
+        state_value,
+        attributes,
+        last_changed=dt_util.utc_from_timestamp(last_changed_ts),
+        last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+        last_updated=dt_util.utc_from_timestamp(last_updated_ts),
+        context=_decode_context(context),
+        validate_entity_id=False,
+        state_info={"unrecorded_attributes": frozenset(unrecorded_attributes)}
+        if unrecorded_attributes is not None
+        else None,
+        last_updated_timestamp=last_updated_ts,
+    )
+
+
+def encode_event(event: Event) -> bytes | None:
+    """Encode an event for the spill log.
+
+    Returns None if the event cannot be serialized.
+    """
+    data: Any = event.data
+    if event.event_type == EVENT_STATE_CHANGED:
+        # The states are encoded with their timestamps and state info
+        # since a plain JSON round trip would not restore them
+        data = {
+            "entity_id": data["entity_id"],
+            "old_state": _encode_state(data["old_state"]),
+            "new_state": _encode_state(data["new_state"]),
+        }
+    try:
+        return json_bytes(
+            {
+                "e": event.event_type,
+                "d": data,
+                "o": event.origin.idx,
+                "t": event.time_fired_timestamp,
+                "c": _encode_context(event.context),
+            }
+        )
+    except JSON_ENCODE_EXCEPTIONS as ex:
+        _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+        return None
+
+
+def decode_event(record: bytes) -> Event[Any]:
+    """Decode an event from the spill log."""
+    event: dict[str, Any] = json_loads_object(record)
+    data: Any = event["d"]
+    if (event_type := event["e"]) == EVENT_STATE_CHANGED:
+        entity_id = data["entity_id"]
+        data = EventStateChangedData(
+            entity_id=entity_id,
+            old_state=_decode_state(entity_id, data["old_state"]),
+            new_state=_decode_state(entity_id, data["new_state"]),
+        )
+    return Event(
+        event_type,
+        data,
+        EVENT_ORIGIN_ORDER[event["o"]],
+        event["t"],
+        context=_decode_context(event["c"]),
+    )
+
+
+def decode_events(records: list[bytes]) -> list[Event[Any]]:
+    """Decode events from the spill log, skipping the ones that are invalid."""
+    events: list[Event[Any]] = []
+    for record in records:
+        try:
+            events.append(decode_event(record))
+        except Exception:
+            _LOGGER.exception(
+                "Skipping spilled event that cannot be decoded: %s", record
+            )
+    return events
+
+
+class SpillLog:
+    """Append-only log of encoded events on disk.
+
+    This class is not thread-safe and must only be
+    used from the recorder thread.
+    """
+
+    def __init__(
+        self, path: str, max_size: int, segment_size: int = SEGMENT_SIZE
+    ) -> None:
+        """Open the spill log, creating it if it does not exist."""
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self._max_size = max_size
+        self._segment_size = segment_size
+        self._segments = sorted(
+            int(name.removesuffix(SEGMENT_SUFFIX))
+            for name in os.listdir(path)
+            if name.endswith(SEGMENT_SUFFIX)
+        )
+        self._head = self._read_head()
+        for segment in self._segments:
+            if segment < self._head[0]:
+                self._remove_segment(segment)
+        self._segments = [
+            segment for segment in self._segments if segment >= self._head[0]
+        ]
+        self.size = sum(
+            os.path.getsize(self._segment_path(segment)) for segment in self._segments
+        )
+        # Never append to a segment left behind by a previous run,
+        # its last record may be incomplete.
+        self._writer: IO[bytes] | None = None
+        self._unsynced = False
+        self._write_segment = (self._segments[-1] + 1) if self._segments else 0
+        self._write_offset = 0
+
+    @property
+    def path(self) -> str:
+        """Return the path of the spill log."""
+        return self._path
+
+    @property
+    def head(self) -> SpillPosition:
+        """Return the position of the first event that has not been recorded."""
+        return self._head
+
+    @property
+    def empty(self) -> bool:
+        """Return if all the events have been read."""
+        return not self._segments or self._head == self.end
+
+    @property
+    def end(self) -> SpillPosition:
+        """Return the position after the last event."""
+        if self._writer is not None:
+            return (self._write_segment, self._write_offset)
+        if not self._segments:
+            return self._head
+        last = self._segments[-1]
+        return (last, os.path.getsize(self._segment_path(last)))
+
+    def append(self, record: bytes) -> bool:
+        """Append an encoded event, returns False if the log is full."""
+        size = _RECORD.size + len(record)
+        if self.size + size > self._max_size:
+            return False
+        if self._writer is None or self._write_offset >= self._segment_size:
+            self._open_writer()
+        assert self._writer is not None
+        self._writer.write(_RECORD.pack(len(record), zlib.crc32(record)))
+        self._writer.write(record)
+        self._unsynced = True
+        self._write_offset += size
+        self.size += size
+        return True
+
+    def flush(self) -> None:
+        """Flush the appended events and sync them to disk."""
+        if self._writer is not None and self._unsynced:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._unsynced = False
+
+    def read(
+        self, limit: int, end: SpillPosition | None = None
+    ) -> tuple[list[bytes], SpillPosition]:
+        """Read up to limit encoded events from the head, stopping at end.
+
+        Returns the events and the position after the last one,
+        which must be passed to consume once they are recorded.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+        records: list[bytes] = []
+        segment, offset = self._head
+        for segment in self._segments:
+            if segment < self._head[0]:
+                continue
+            if segment != self._head[0]:
+                offset = 0
+            with open(self._segment_path(segment), "rb") as segment_file:
+                segment_file.seek(offset)
+                while len(records) < limit and (end is None or (segment, offset) < end):
+                    header = segment_file.read(_RECORD.size)
+                    if len(header) < _RECORD.size:
+                        break
+                    length, crc = _RECORD.unpack(header)
+                    record = segment_file.read(length)
+                    if len(record) < length or zlib.crc32(record) != crc:
+                        _LOGGER.warning(
+                            "Skipping incomplete event at offset %s of %s",
+                            offset,
+                            self._segment_path(segment),
+                        )
+                        offset = os.path.getsize(self._segment_path(segment))
+                        break
+                    records.append(record)
+                    offset += _RECORD.size + length
+            if len(records) >= limit or (end is not None and (segment, offset) >= end):
+                break
+        return records, (segment, offset)
+
+    def consume(self, position: SpillPosition) -> None:
+        """Mark the events before position as recorded."""
+        self._head = position
+        for segment in list(self._segments):
+            if segment >= position[0] or segment == self._write_segment:
+                break
+            self.size -= os.path.getsize(self._segment_path(segment))
+            self._remove_segment(segment)
+            self._segments.remove(segment)
+        head_path = os.path.join(self._path, HEAD_FILE)
+        with open(f"{head_path}.tmp", "wb") as head_file:
+            head_file.write(_HEAD.pack(*position))
+            head_file.flush()
+            os.fsync(head_file.fileno())
+        os.replace(f"{head_path}.tmp", head_path)
+
+    def close(self) -> None:
+        """Close the spill log."""
+        if self._writer is not None:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+
+    def remove(self) -> None:
+        """Close and remove the spill log."""
+        self.close()
+        for segment in self._segments:
+            self._remove_segment(segment)
+        self._segments.clear()
+        with suppress(FileNotFoundError):
+            os.unlink(os.path.join(self._path, HEAD_FILE))
+        with suppress(OSError):
+            os.rmdir(self._path)
+
+    def _segment_path(self, segment: int) -> str:
+        """Return the path of a segment."""
+        return os.path.join(self._path, f"{segment:012d}{SEGMENT_SUFFIX}")
+
+    def _remove_segment(self, segment: int) -> None:
+        """Remove a segment file."""
+        with suppress(FileNotFoundError):
+            os.unlink(self._segment_path(segment))
+
+    def _open_writer(self) -> None:
+        """Start a new segment."""
+        if self._writer is not None:
+            self.flush()
+            self._writer.close()
+            self._write_segment += 1
+        self._write_offset = 0
+        # pylint: disable-next=consider-using-with
+        self._writer = open(  # noqa: SIM115
+            self._segment_path(self._write_segment), "xb"
+        )
+        self._segments.append(self._write_segment)
+
+    def _read_head(self) -> SpillPosition:
+        """Read the head position stored by the last run."""
+        try:
+            with open(os.path.join(self._path, HEAD_FILE), "rb") as head_file:
+                segment, offset = _HEAD.unpack(head_file.read(_HEAD.size))
+        except (FileNotFoundError, struct.error):
+            return (self._segments[0], 0) if self._segments else (0, 0)
+        return (segment, offset)
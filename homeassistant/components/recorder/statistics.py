@@ -11,8 +11,10 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import threading
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
+from lru import LRU
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
@@ -23,6 +25,7 @@ import voluptuous as vol
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import HomeAssistant, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
@@ -47,6 +50,7 @@ from homeassistant.util.unit_conversion import (
 )
 
 from .const import (
+    DATA_STATISTICS_DURING_PERIOD_CACHE,
     DOMAIN,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
@@ -54,6 +58,7 @@ from .const import (
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    SIGNAL_COMPILE_MISSING_STATISTICS_PROGRESS,
     SupportedDialect,
 )
 from .db_schema import (
@@ -155,8 +160,14 @@ UNIT_CLASSES = {
     for unit, converter in STATISTIC_UNIT_TO_UNIT_CONVERTER.items()
 }
 
+# The number of missing 5-minute periods compiled before
+# yielding to the events queued in the meantime
+COMPILE_MISSING_STATISTICS_CHUNK = 12
+
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 64
+
 
 def mean(values: list[float]) -> float | None:
     """Return the mean of the values.
@@ -199,6 +210,105 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+type StatisticsDuringPeriodCacheKey = tuple[
+    tuple[tuple[str, str | None], ...],
+    str,
+    datetime,
+    datetime | None,
+    frozenset[tuple[str, str]] | None,
+    frozenset[str],
+]
+
+
+def _copy_statistics_result(
+    result: dict[str, list[StatisticsRow]],
+) -> dict[str, list[StatisticsRow]]:
+    """Copy a statistics result so callers can modify the rows."""
+    return {
+        statistic_id: [row.copy() for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
+class StatisticsDuringPeriodCache:
+    """Cache for the results of statistics_during_period.
+
+    Results are cached per statistic_id and the unit of measurement of
+    its state, since the unit of the state is the default display unit.
+
+    An entry is invalidated when statistics which end after the start of
+    the changed statistics are compiled, imported or adjusted in its table,
+    since those results may include or depend on the changed statistics.
+
+    The cache is used by the database executor threads and invalidated
+    from the recorder thread after the changes are committed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._results: LRU[
+            StatisticsDuringPeriodCacheKey,
+            tuple[type[StatisticsBase], float | None, dict[str, list[StatisticsRow]]],
+        ] = LRU(STATISTICS_DURING_PERIOD_CACHE_SIZE)
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """Return the number of times the cache was invalidated.
+
+        Results must only be cached if the cache was not
+        invalidated while they were being queried.
+        """
+        return self._generation
+
+    def get(
+        self, key: StatisticsDuringPeriodCacheKey
+    ) -> dict[str, list[StatisticsRow]] | None:
+        """Return a copy of a cached result."""
+        with self._lock:
+            if (cached := self._results.get(key)) is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _copy_statistics_result(cached[2])
+
+    def set(
+        self,
+        key: StatisticsDuringPeriodCacheKey,
+        generation: int,
+        table: type[StatisticsBase],
+        end_time: datetime | None,
+        result: dict[str, list[StatisticsRow]],
+    ) -> None:
+        """Cache a copy of a result queried at generation."""
+        cached = (
+            table,
+            end_time.timestamp() if end_time else None,
+            _copy_statistics_result(result),
+        )
+        with self._lock:
+            if generation == self._generation:
+                self._results[key] = cached
+
+    def invalidate(self, table: type[StatisticsBase], start_time: datetime) -> None:
+        """Invalidate the results which end after start_time."""
+        start_ts = start_time.timestamp()
+        with self._lock:
+            self._generation += 1
+            for key, (cached_table, end_ts, _) in self._results.items():
+                if cached_table is table and (end_ts is None or end_ts > start_ts):
+                    del self._results[key]
+
+    def clear(self) -> None:
+        """Invalidate all results."""
+        with self._lock:
+            self._generation += 1
+            self._results.clear()
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -447,15 +557,18 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
-    """Compile missing statistics."""
+    """Compile missing statistics.
+
+    At most COMPILE_MISSING_STATISTICS_CHUNK periods are compiled per call
+    so the events queued in the meantime are recorded between the chunks.
+    Returns False until all the missing periods have been compiled.
+    """
     now = dt_util.utcnow()
     period_size = 5
     last_period_minutes = now.minute - now.minute % period_size
     last_period = now.replace(minute=last_period_minutes, second=0, microsecond=0)
     start = now - timedelta(days=instance.keep_days)
     start = start.replace(minute=0, second=0, microsecond=0)
-    # Commit every 12 hours of data
-    commit_interval = 60 / period_size * 12
 
     with session_scope(
         session=instance.get_session(),
@@ -469,21 +582,36 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 start, process_timestamp(last_run) + StatisticsShortTerm.duration
             )
 
-        periods_without_commit = 0
-        while start < last_period:
-            periods_without_commit += 1
+        chunk_start = start
+        chunk_end = min(
+            last_period,
+            start + COMPILE_MISSING_STATISTICS_CHUNK * StatisticsShortTerm.duration,
+        )
+        while start < chunk_end:
             end = start + timedelta(minutes=period_size)
             _LOGGER.debug("Compiling missing statistics for %s-%s", start, end)
             modified_statistic_ids = _compile_statistics(
                 instance, session, start, end >= last_period
             )
-            if periods_without_commit == commit_interval or modified_statistic_ids:
+            if modified_statistic_ids:
                 session.commit()
                 session.expunge_all()
-                periods_without_commit = 0
             start = end
 
-    return True
+    if chunk_start < start:
+        _invalidate_statistics_during_period_cache(instance.hass, chunk_start, start)
+    periods_remaining = max(0, (last_period - start) // StatisticsShortTerm.duration)
+    if chunk_start < start:
+        dispatcher_send(
+            instance.hass,
+            SIGNAL_COMPILE_MISSING_STATISTICS_PROGRESS,
+            {
+                "start": chunk_start.isoformat(),
+                "end": start.isoformat(),
+                "periods_remaining": periods_remaining,
+            },
+        )
+    return not periods_remaining
 
 
 @retryable_database_job("compile statistics")
@@ -498,6 +626,12 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     # modified_statistic_ids unbound.
     modified_statistic_ids: set[str] | None = None
 
+    if instance.compiling_missing_statistics:
+        # The missing statistics are compiled in order, including this period,
+        # compiling it now would make them skip the periods before it
+        _LOGGER.debug("Compiling missing statistics, skipping %s", start)
+        return True
+
     # Return if we already have 5-minute statistics for the requested period
     with session_scope(
         session=instance.get_session(),
@@ -509,6 +643,10 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    _invalidate_statistics_during_period_cache(
+        instance.hass, start, start + StatisticsShortTerm.duration
+    )
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -520,6 +658,18 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     return True
 
 
+def _invalidate_statistics_during_period_cache(
+    hass: HomeAssistant, start: datetime, end: datetime
+) -> None:
+    """Invalidate the cached statistics after compiling the periods start-end."""
+    cache = get_statistics_during_period_cache(hass)
+    cache.invalidate(StatisticsShortTerm, start)
+    # Hourly statistics are compiled at the end of each hour, the periods
+    # may span several hours when compiling missing statistics
+    if end.replace(minute=0, second=0, microsecond=0) > start:
+        cache.invalidate(Statistics, start.replace(minute=0, second=0, microsecond=0))
+
+
 def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
     """Return a statement that returns the first run_id at start."""
     return lambda_stmt(lambda: select(StatisticsRuns.run_id).filter_by(start=start))
@@ -747,6 +897,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_during_period_cache(instance.hass).clear()
 
 
 def update_statistics_metadata(
@@ -772,6 +923,7 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    get_statistics_during_period_cache(instance.hass).clear()
 
 
 async def async_list_statistic_ids(
@@ -1698,6 +1850,44 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _align_start_end_to_period(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[datetime, datetime | None]:
+    """Align start_time and end_time with the period."""
+    if period == "day":
+        start_time = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        start_time = start_time.replace()
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = end_local.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) + timedelta(days=1)
+    elif period == "week":
+        start_local = dt_util.as_local(start_time)
+        start_time = start_local.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=start_local.weekday())
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = (
+                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
+                - timedelta(days=end_local.weekday())
+                + timedelta(days=7)
+            )
+    elif period == "month":
+        start_time = dt_util.as_local(start_time).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_time = _find_month_end_time(dt_util.as_local(end_time))
+
+    return start_time, end_time
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1735,35 +1925,7 @@ def _statistics_during_period_with_session(
     if statistic_ids is not None:
         metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
-    # Align start_time and end_time with the period
-    if period == "day":
-        start_time = dt_util.as_local(start_time).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        start_time = start_time.replace()
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = end_local.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-    elif period == "week":
-        start_local = dt_util.as_local(start_time)
-        start_time = start_local.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=start_local.weekday())
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = (
-                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
-                - timedelta(days=end_local.weekday())
-                + timedelta(days=7)
-            )
-    elif period == "month":
-        start_time = dt_util.as_local(start_time).replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        if end_time is not None:
-            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    start_time, end_time = _align_start_end_to_period(start_time, end_time, period)
 
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
@@ -1821,8 +1983,43 @@ def statistics_during_period(
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
     """
+    if statistic_ids is None:
+        # Results for all statistic ids are not cached since
+        # the display units of the statistics are not known
+        with session_scope(hass=hass, read_only=True) as session:
+            return _statistics_during_period_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                period,
+                units,
+                types,
+            )
+
+    cache = get_statistics_during_period_cache(hass)
+    key: StatisticsDuringPeriodCacheKey = (
+        tuple(
+            (
+                statistic_id,
+                state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                if (state := hass.states.get(statistic_id))
+                else None,
+            )
+            for statistic_id in sorted(statistic_ids)
+        ),
+        period,
+        start_time,
+        end_time,
+        frozenset(units.items()) if units is not None else None,
+        frozenset(types),
+    )
+    if (cached := cache.get(key)) is not None:
+        return cached
+    generation = cache.generation
     with session_scope(hass=hass, read_only=True) as session:
-        return _statistics_during_period_with_session(
+        result = _statistics_during_period_with_session(
             hass,
             session,
             start_time,
@@ -1832,6 +2029,17 @@ def statistics_during_period(
             units,
             types,
         )
+    table: type[Statistics | StatisticsShortTerm] = (
+        Statistics if period != "5minute" else StatisticsShortTerm
+    )
+    cache.set(
+        key,
+        generation,
+        table,
+        _align_start_end_to_period(start_time, end_time, period)[1],
+        result,
+    )
+    return result
 
 
 def _get_last_statistics_stmt(
@@ -2367,6 +2575,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the statistics during period cache."""
+    return StatisticsDuringPeriodCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2425,16 +2641,20 @@ def import_statistics(
     table: type[StatisticsBase],
 ) -> bool:
     """Process an import_statistics job."""
-
+    statistics = list(statistics)
     with session_scope(
         session=instance.get_session(),
         exception_filter=filter_unique_constraint_integrity_error(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
+        _import_statistics_with_session(instance, session, metadata, statistics, table)
+
+    if statistics:
+        get_statistics_during_period_cache(instance.hass).invalidate(
+            table, min(stat["start"] for stat in statistics)
         )
+    return True
 
 
 @retryable_database_job("adjust_statistics")
@@ -2476,6 +2696,9 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    cache = get_statistics_during_period_cache(instance.hass)
+    cache.invalidate(StatisticsShortTerm, start_time)
+    cache.invalidate(Statistics, start_time.replace(minute=0))
     return True
 
 
@@ -2543,6 +2766,7 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+    get_statistics_during_period_cache(instance.hass).clear()
 
 
 @callback
@@ -6,6 +6,7 @@ from collections.abc import Collection, Iterable
 import logging
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event
@@ -32,6 +33,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._non_existent_shared_datas: LRU[str, None] = LRU(CACHE_SIZE)
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
@@ -49,12 +51,17 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        if hashes := {
-            EventData.hash_shared_data_bytes(shared_event_bytes)
-            for event in events
-            if (shared_event_bytes := self.serialize_from_event(event))
-        }:
-            self._load_from_hashes(hashes, session)
+        self.get_many(
+            {
+                (
+                    shared_event_bytes.decode("utf-8"),
+                    EventData.hash_shared_data_bytes(shared_event_bytes),
+                )
+                for event in events
+                if (shared_event_bytes := self.serialize_from_event(event))
+            },
+            session,
+        )
 
     def get(self, shared_data: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_datas to the data_id.
@@ -73,17 +80,27 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
-        missing_hashes: set[int] = set()
+        missing: dict[str, int] = {}
         for shared_data, data_hash in shared_data_data_hashs:
-            if (data_id := self._id_map.get(shared_data)) is None:
-                missing_hashes.add(data_hash)
+            if (
+                data_id := self._id_map.get(shared_data)
+            ) is None and shared_data not in self._non_existent_shared_datas:
+                missing[shared_data] = data_hash
 
             results[shared_data] = data_id
 
-        if not missing_hashes:
+        if not missing:
             return results
 
-        return results | self._load_from_hashes(missing_hashes, session)
+        results |= self._load_from_hashes(set(missing.values()), session)
+        # Remember what is not in the database so the events that
+        # reference it do not have to look it up again before it is
+        # committed
+        for shared_data in missing:
+            if results[shared_data] is None:
+                self._non_existent_shared_datas[shared_data] = None
+
+        return results
 
     def _load_from_hashes(
         self, hashes: Collection[int], session: Session
@@ -123,8 +140,18 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         """
         for shared_data, db_event_data in self._pending.items():
             self._id_map[shared_data] = db_event_data.data_id
+            self._non_existent_shared_datas.pop(cast(str, shared_data), None)
         self._pending.clear()
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._non_existent_shared_datas.clear()
+
     def evict_purged(self, data_ids: set[int]) -> None:
         """Evict purged data_ids from the cache when they are no longer used.
 
@@ -6,6 +6,7 @@ from collections.abc import Collection, Iterable
 import logging
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -37,6 +38,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._non_existent_shared_attrs: LRU[str, None] = LRU(CACHE_SIZE)
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -60,12 +62,17 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        if hashes := {
-            StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
-            for event in events
-            if (shared_attrs_bytes := self.serialize_from_event(event))
-        }:
-            self._load_from_hashes(hashes, session)
+        self.get_many(
+            {
+                (
+                    shared_attrs_bytes.decode("utf-8"),
+                    StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes),
+                )
+                for event in events
+                if (shared_attrs_bytes := self.serialize_from_event(event))
+            },
+            session,
+        )
 
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
@@ -84,17 +91,27 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
-        missing_hashes: set[int] = set()
+        missing: dict[str, int] = {}
         for shared_attrs, data_hash in shared_attrs_data_hashes:
-            if (attributes_id := self._id_map.get(shared_attrs)) is None:
-                missing_hashes.add(data_hash)
+            if (
+                attributes_id := self._id_map.get(shared_attrs)
+            ) is None and shared_attrs not in self._non_existent_shared_attrs:
+                missing[shared_attrs] = data_hash
 
             results[shared_attrs] = attributes_id
 
-        if not missing_hashes:
+        if not missing:
             return results
 
-        return results | self._load_from_hashes(missing_hashes, session)
+        results |= self._load_from_hashes(set(missing.values()), session)
+        # Remember what is not in the database so the events that
+        # reference it do not have to look it up again before it is
+        # committed
+        for shared_attrs in missing:
+            if results[shared_attrs] is None:
+                self._non_existent_shared_attrs[shared_attrs] = None
+
+        return results
 
     def _load_from_hashes(
         self, hashes: Collection[int], session: Session
@@ -134,8 +151,18 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         """
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            self._non_existent_shared_attrs.pop(cast(str, shared_attrs), None)
         self._pending.clear()
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._non_existent_shared_attrs.clear()
+
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
 
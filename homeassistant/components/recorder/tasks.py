@@ -5,12 +5,13 @@ from __future__ import annotations
 import abc
 import asyncio
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 import threading
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import Event
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
@@ -32,6 +33,9 @@ class RecorderTask:
     """ABC for recorder tasks."""
 
     commit_before = True
+    # While events are spilled to disk the task runs once the events
+    # queued before it have been recorded, instead of right away
+    defer_while_spilling = True
 
     @abc.abstractmethod
     def run(self, instance: Recorder) -> None:
@@ -117,9 +121,12 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        purge_finished = purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        )
+        # Purging removes short term statistics
+        statistics.get_statistics_during_period_cache(instance.hass).clear()
+        if purge_finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -181,7 +188,13 @@ class CompileMissingStatisticsTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Run statistics task to compile missing statistics."""
-        if statistics.compile_missing_statistics(instance):
+        finished = True
+        try:
+            finished = statistics.compile_missing_statistics(instance)
+        finally:
+            if finished:
+                instance.compiling_missing_statistics = False
+        if finished:
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(CompileMissingStatisticsTask())
@@ -258,6 +271,7 @@ class DatabaseLockTask(RecorderTask):
     database_locked: asyncio.Event
     database_unlock: threading.Event
     queue_overflow: bool
+    defer_while_spilling = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -269,6 +283,7 @@ class StopTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
 
     commit_before = False
+    defer_while_spilling = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -280,6 +295,7 @@ class KeepAliveTask(RecorderTask):
     """A keep alive to be sent."""
 
     commit_before = False
+    defer_while_spilling = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -291,6 +307,7 @@ class CommitTask(RecorderTask):
     """Commit the event session."""
 
     commit_before = False
+    defer_while_spilling = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -304,6 +321,7 @@ class AddRecorderPlatformTask(RecorderTask):
     domain: str
     platform: Any
     commit_before = False
+    defer_while_spilling = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
@@ -333,6 +351,7 @@ class AdjustLRUSizeTask(RecorderTask):
     """An object to insert into the recorder queue to adjust the LRU size."""
 
     commit_before = False
+    defer_while_spilling = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task to adjust the size."""
@@ -344,6 +363,7 @@ class RefreshEventTypesTask(RecorderTask):
     """An object to insert into the recorder queue to refresh event types."""
 
     event_types: list[EventType[Any] | str]
+    defer_while_spilling = False
 
     def run(self, instance: Recorder) -> None:
         """Refresh event types."""
@@ -351,3 +371,16 @@ class RefreshEventTypesTask(RecorderTask):
             instance.event_type_manager.get_many(
                 self.event_types, session, from_recorder=True
             )
+
+
+@dataclass(slots=True)
+class RecordSpilledEventsTask(RecorderTask):
+    """Record a batch of events read back from the spill log."""
+
+    events: list[Event[Any]] = field(repr=False)
+    recorded: bool = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._record_spilled_events(self.events)  # noqa: SLF001
+        self.recorded = True
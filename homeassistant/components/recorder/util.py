@@ -24,6 +24,7 @@ from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import OperationalError, SQLAlchemyError, StatementError
 from sqlalchemy.orm.query import Query
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.base import Executable
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
@@ -171,24 +172,28 @@ def execute(
 
 def execute_stmt_lambda_element(
     session: Session,
-    stmt: StatementLambdaElement,
+    stmt: StatementLambdaElement | Executable,
     start_time: datetime | None = None,
     end_time: datetime | None = None,
     yield_per: int = DEFAULT_YIELD_STATES_ROWS,
     orm_rows: bool = True,
+    stream: bool = False,
 ) -> Sequence[Row] | Result:
     """Execute a StatementLambdaElement.
 
     If the time window passed is greater than one day
     the execution method will switch to yield_per to
-    reduce memory pressure.
+    reduce memory pressure. If stream is set yield_per
+    is always used.
 
     It is not recommended to pass a time window
     when selecting non-ranged rows (ie selecting
     specific entities) since they are usually faster
     with .all().
     """
-    use_all = not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    use_all = not stream and (
+        not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    )
     for tryno in range(RETRIES):
         try:
             if orm_rows:
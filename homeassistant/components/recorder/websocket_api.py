@@ -13,6 +13,7 @@ from homeassistant.components.websocket_api import messages
 from homeassistant.core import HomeAssistant, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_conversion import (
@@ -34,6 +35,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .const import SIGNAL_COMPILE_MISSING_STATISTICS_PROGRESS
 from .models import StatisticPeriod
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
@@ -84,6 +86,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
+    websocket_api.async_register_command(hass, ws_subscribe_compile_missing_statistics)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_issues)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
@@ -316,6 +319,31 @@ async def ws_update_statistics_issues(
     connection.send_result(msg["id"])
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/subscribe_compile_missing_statistics",
+    }
+)
+@callback
+def ws_subscribe_compile_missing_statistics(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the progress of compiling missing statistics."""
+
+    @callback
+    def forward_progress(progress: dict[str, Any]) -> None:
+        """Forward the progress to the websocket."""
+        connection.send_message(websocket_api.event_message(msg["id"], progress))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_COMPILE_MISSING_STATISTICS_PROGRESS, forward_progress
+    )
+    connection.send_result(
+        msg["id"], {"compiling": get_instance(hass).compiling_missing_statistics}
+    )
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
@@ -19,6 +19,7 @@ from homeassistant.components.recorder import (
     history,
     statistics,
 )
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -26,12 +27,20 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -78,6 +87,249 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Recent states of sensors to compile statistics from without querying the database
+STATE_HISTORY: HassKey[SensorStateHistory] = HassKey(f"{DOMAIN}_state_history")
+# The length in seconds of the periods for which states are tracked
+TRACKED_PERIOD = StatisticsShortTerm.duration.total_seconds()
+# The maximum number of periods tracked in memory, the oldest period
+# is dropped and queried from the database when statistics are not
+# compiled for a while
+MAX_TRACKED_PERIODS = 12
+
+
+class _SensorPeriod:
+    """Aggregates of the states of a sensor during a period."""
+
+    __slots__ = (
+        "accumulated",
+        "changed",
+        "decreased",
+        "first",
+        "last",
+        "last_ts",
+        "max",
+        "min",
+        "start_state",
+        "start_ts",
+    )
+
+    def __init__(self, start_state: State | None) -> None:
+        """Initialize the aggregates."""
+        # The state the sensor had when the period started
+        self.start_state = start_state
+        self.first: tuple[float, State] | None = None
+        self.last: tuple[float, State] | None = None
+        self.start_ts = 0.0
+        self.last_ts = 0.0
+        self.min = 0.0
+        self.max = 0.0
+        self.accumulated = 0.0
+        self.changed = False
+        self.decreased = False
+
+    def add(self, state: State, timestamp: float) -> None:
+        """Add a state which is valid from timestamp."""
+        try:
+            fstate = float(state.state)
+        except (ValueError, TypeError):
+            return
+        if not math.isfinite(fstate):
+            return
+        if (last := self.last) is None:
+            self.first = self.last = (fstate, state)
+            self.start_ts = self.last_ts = timestamp
+            self.min = self.max = fstate
+            return
+        attributes = state.attributes
+        last_attributes = last[1].attributes
+        if any(
+            attributes.get(attr) != last_attributes.get(attr)
+            for attr in (ATTR_UNIT_OF_MEASUREMENT, ATTR_STATE_CLASS, ATTR_LAST_RESET)
+        ):
+            self.changed = True
+        if fstate < last[0]:
+            self.decreased = True
+        self.accumulated += last[0] * (timestamp - self.last_ts)
+        self.min = min(self.min, fstate)
+        self.max = max(self.max, fstate)
+        self.last = (fstate, state)
+        self.last_ts = timestamp
+
+    def float_states(
+        self, end_ts: float, has_sum: bool
+    ) -> list[tuple[float, State]] | None:
+        """Return float states which compile to the statistics of the period.
+
+        Returns None if the statistics must be compiled from the states in the
+        database because the unit, state class or last reset changed, or a
+        total_increasing sensor decreased and may have been reset.
+        """
+        if (first := self.first) is None or (last := self.last) is None:
+            return []
+        if self.changed:
+            return None
+        if has_sum:
+            if (
+                self.decreased
+                and last[1].attributes.get(ATTR_STATE_CLASS)
+                == SensorStateClass.TOTAL_INCREASING
+            ):
+                return None
+            # The sum only depends on the first and the last state
+            # when the sensor has not been reset during the period
+            return [first] if first is last else [first, last]
+        duration = end_ts - self.start_ts
+        accumulated = self.accumulated + last[0] * (end_ts - self.last_ts)
+        mean = accumulated / duration if duration else last[0]
+        # The states have the same time, so the time weighted average
+        # of them is the mean of the period
+        state = first[1]
+        return [(self.min, state), (self.max, state), (mean, state)]
+
+
+class SensorStateHistory:
+    """Keep aggregates of the recent states of sensors with a state class.
+
+    The statistics of a period are compiled from the aggregates when the
+    states have been tracked since the period started, the states must
+    otherwise be queried from the database, e.g. after a restart or when
+    the period was dropped because statistics were not compiled for a
+    while.
+
+    This class must only be used from the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the sensor state history."""
+        self._hass = hass
+        self._periods: dict[float, dict[str, _SensorPeriod]] = {}
+        self._complete_since = self._async_complete_since()
+
+    @callback
+    def _async_complete_since(self) -> float:
+        """Return the time from which the tracked history is complete.
+
+        The states of sensors which do not change are in the state machine
+        and the state a sensor had before its first change is the old state
+        of that change, so the history is complete from now on unless a
+        state was updated in the future.
+        """
+        return max(
+            dt_util.utcnow().timestamp(),
+            max(
+                (
+                    state.last_updated_timestamp
+                    for state in self._hass.states.async_all(DOMAIN)
+                ),
+                default=0,
+            ),
+        )
+
+    @callback
+    def async_track_state(self, event: Event[EventStateChangedData]) -> None:
+        """Add a changed state to the aggregates of its period."""
+        entity_id = event.data["entity_id"]
+        if (new_state := event.data["new_state"]) is None:
+            for period_sensors in self._periods.values():
+                period_sensors.pop(entity_id, None)
+            return
+        timestamp = new_state.last_updated_timestamp
+        if timestamp < self._complete_since:
+            return
+        period_ts = timestamp - timestamp % TRACKED_PERIOD
+        if (sensors := self._periods.get(period_ts)) is None:
+            sensors = self._periods[period_ts] = {}
+            if len(self._periods) > MAX_TRACKED_PERIODS:
+                oldest_ts = min(self._periods)
+                _LOGGER.debug("Dropping the sensor states tracked at %s", oldest_ts)
+                del self._periods[oldest_ts]
+                self._complete_since = max(
+                    self._complete_since, oldest_ts + TRACKED_PERIOD
+                )
+        if (sensor := sensors.get(entity_id)) is None:
+            # Start with the state the sensor had before the
+            # change since that state is valid until the change
+            old_state = event.data["old_state"]
+            sensor = sensors[entity_id] = _SensorPeriod(old_state)
+            if old_state is not None:
+                sensor.add(old_state, max(old_state.last_updated_timestamp, period_ts))
+        sensor.add(new_state, timestamp)
+
+    @callback
+    def async_get_history(
+        self,
+        entity_ids: list[str],
+        significant_entity_ids: list[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+    ) -> tuple[dict[str, list[tuple[float, State]]], set[str]] | None:
+        """Return the float states during start-end and forget the periods before end.
+
+        The float states compile to the same statistics as the history
+        returned from the database, entity_ids are the sensors which have
+        a sum. Sensors which did not change are left out. Also returns the
+        sensors which must be queried from the database. Returns None if
+        the states during start-end are not known.
+        """
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        if (
+            start_ts < self._complete_since
+            or start_ts % TRACKED_PERIOD
+            or end_ts - start_ts != TRACKED_PERIOD
+        ):
+            return None
+        sensors = self._periods.pop(start_ts, {})
+        for period_ts in [ts for ts in self._periods if ts < end_ts]:
+            del self._periods[period_ts]
+        self._complete_since = end_ts
+        later_periods = [self._periods[ts] for ts in sorted(self._periods)]
+
+        float_history: dict[str, list[tuple[float, State]]] = {}
+        database_entity_ids: set[str] = set()
+        for has_sum, _entity_ids in (
+            (True, entity_ids),
+            (False, significant_entity_ids),
+        ):
+            for entity_id in _entity_ids:
+                if (sensor := sensors.get(entity_id)) is not None:
+                    if (float_states := sensor.float_states(end_ts, has_sum)) is None:
+                        database_entity_ids.add(entity_id)
+                    else:
+                        float_history[entity_id] = float_states
+                    continue
+                # A sensor which changed later had the state it had
+                # when the first later period started
+                for later_sensors in later_periods:
+                    if (sensor := later_sensors.get(entity_id)) is not None:
+                        if (start_state := sensor.start_state) is not None:
+                            float_history[entity_id] = (
+                                _entity_history_to_float_and_state([start_state])
+                            )
+                        break
+        return float_history, database_entity_ids
+
+
+@callback
+def _async_track_sensor_states(hass: HomeAssistant) -> None:
+    """Start keeping the recent states of sensors with a state class in memory."""
+    if STATE_HISTORY in hass.data:
+        return
+    state_history = hass.data[STATE_HISTORY] = SensorStateHistory(hass)
+
+    @callback
+    def _async_sensor_state_class_filter(event_data: EventStateChangedData) -> bool:
+        """Filter state changes of sensors which have or had a state class."""
+        return split_entity_id(event_data["entity_id"])[0] == DOMAIN and any(
+            state is not None and ATTR_STATE_CLASS in state.attributes
+            for state in (event_data["new_state"], event_data["old_state"])
+        )
+
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        state_history.async_track_state,
+        event_filter=_async_sensor_state_class_filter,
+    )
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -402,21 +654,15 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(  # noqa: C901
+def _get_history_from_database(
     hass: HomeAssistant,
     session: Session,
     start: datetime.datetime,
     end: datetime.datetime,
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
-
-    sensor_states = _get_sensor_states(hass)
-    wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
-    entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
-    ]
+    entities_full_history: list[str],
+    entities_significant_history: list[str],
+) -> dict[str, list[State]]:
+    """Get history between start and end from the database."""
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
         history_list = history.get_full_significant_states_with_session(
@@ -427,11 +673,6 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_full_history,
             significant_changes_only=False,
         )
-    entities_significant_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
-    ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
             hass,
@@ -441,15 +682,73 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_significant_history,
         )
         history_list = {**history_list, **_history_list}
+    return history_list
+
+
+def compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end."""
+    result: list[StatisticResult] = []
+
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+    # Get history between start and end
+    entities_full_history = [
+        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+    ]
+    entities_significant_history = [
+        i.entity_id
+        for i in sensor_states
+        if "sum" not in wanted_statistics[i.entity_id]
+    ]
+    float_history: dict[str, list[tuple[float, State]]] = {}
+    if (state_history := hass.data.get(STATE_HISTORY)) is None:
+        run_callback_threadsafe(hass.loop, _async_track_sensor_states, hass).result()
+    elif (
+        tracked := run_callback_threadsafe(
+            hass.loop,
+            state_history.async_get_history,
+            entities_full_history,
+            entities_significant_history,
+            start,
+            end,
+        ).result()
+    ) is not None:
+        float_history, database_entity_ids = tracked
+        entities_full_history = [
+            entity_id
+            for entity_id in entities_full_history
+            if entity_id in database_entity_ids
+        ]
+        entities_significant_history = [
+            entity_id
+            for entity_id in entities_significant_history
+            if entity_id in database_entity_ids
+        ]
+    history_list = _get_history_from_database(
+        hass,
+        session,
+        start,
+        end,
+        entities_full_history,
+        entities_significant_history,
+    )
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
-        # If there are no recent state changes, the sensor's state may already be pruned
-        # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
-            continue
-        if not (float_states := _entity_history_to_float_and_state(entity_history)):
+        if (float_states := float_history.get(entity_id)) is None:
+            # If there are no recent state changes, the sensor's state may already
+            # be pruned from the recorder. Get the state from the state machine
+            # instead.
+            if not (entity_history := history_list.get(entity_id, [_state])):
+                continue
+            float_states = _entity_history_to_float_and_state(entity_history)
+        if not float_states:
             continue
         entities_with_float_states[entity_id] = float_states
 
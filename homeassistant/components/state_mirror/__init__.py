@@ -0,0 +1,115 @@
+"""Mirror the state machine to a memory-mapped file for local processes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import (
+    CONF_PATH,
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .const import DEFAULT_PATH, DOMAIN
+from .mirror import DEFAULT_SIZE, StateMirrorError, StateMirrorWriter, table_size
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_PATH, default=DEFAULT_PATH): cv.string,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def _create_writer(path: str, states: list[tuple[str, bytes]]) -> StateMirrorWriter:
+    """Create the state table and write the current states to it."""
+    # Leave room for the current states to be updated a few times
+    # before the table needs to be compacted
+    writer = StateMirrorWriter(path, max(DEFAULT_SIZE, 2 * table_size(states)))
+    for entity_id, state in states:
+        writer.write(entity_id, state)
+    writer.commit()
+    return writer
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the state mirror."""
+    path = hass.config.path(config[DOMAIN][CONF_PATH])
+    # Changes made while the state table is created are kept
+    # and written once it exists
+    pending: list[Event[EventStateChangedData]] = []
+    write_states: Callable[[list[Event[EventStateChangedData]]], None] = pending.extend
+
+    @callback
+    def _async_states_changed(events: list[Event[EventStateChangedData]]) -> None:
+        """Write the changed states, or keep them until the state table exists."""
+        write_states(events)
+
+    cancel_listener = hass.bus.async_listen_batched(
+        EVENT_STATE_CHANGED, _async_states_changed
+    )
+    states = [
+        (state.entity_id, state.as_dict_json) for state in hass.states.async_all()
+    ]
+    try:
+        writer = await hass.async_add_executor_job(_create_writer, path, states)
+    except (OSError, StateMirrorError) as err:
+        cancel_listener()
+        _LOGGER.error("Unable to create state table %s: %s", path, err)
+        return False
+    compact_task: asyncio.Task[None] | None = None
+
+    async def _async_compact() -> None:
+        """Compact the state table in the executor."""
+        while writer.compact_needed:
+            states = writer.start_compact()
+            try:
+                await hass.async_add_executor_job(writer.compact, states)
+            except OSError:
+                _LOGGER.exception("Error compacting state table %s", path)
+                return
+            finally:
+                writer.finish_compact()
+
+    @callback
+    def _async_write_states(events: list[Event[EventStateChangedData]]) -> None:
+        """Write the changed states to the state table."""
+        nonlocal compact_task
+        for event in events:
+            new_state = event.data["new_state"]
+            writer.write(
+                event.data["entity_id"],
+                new_state.as_dict_json if new_state is not None else None,
+            )
+        writer.commit()
+        if writer.compact_needed and (compact_task is None or compact_task.done()):
+            compact_task = hass.async_create_task(
+                _async_compact(), "state_mirror compact"
+            )
+
+    write_states = _async_write_states
+    if pending:
+        _async_write_states(pending)
+
+    async def _async_close(event: Event) -> None:
+        """Close the state table."""
+        cancel_listener()
+        if compact_task is not None:
+            await compact_task
+        await hass.async_add_executor_job(writer.close)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return True
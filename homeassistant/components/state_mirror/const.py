@@ -0,0 +1,5 @@
+"""Constants for the State Mirror integration."""
+
+DOMAIN = "state_mirror"
+
+DEFAULT_PATH = "state_mirror.bin"
@@ -0,0 +1,363 @@
+"""Memory-mapped state table that can be read by local processes.
+
+The table is a single file made of a fixed size header followed by an
+append-only log of records. Each record holds an entity_id and the JSON
+representation of its state, a record without a state marks the entity
+as removed.
+
+Readers keep their own index of the latest record of every entity and
+only scan the records that were appended since their last refresh. When
+the table is full the writer compacts it by rewriting the latest record
+of every entity, which bumps the generation so readers know to rebuild
+their index. Compacting may grow the table so it is done in the
+executor, states written in the meantime are appended once it is done.
+
+This module only uses the standard library so that processes outside of
+Home Assistant can read the table.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from contextlib import suppress
+import json
+import mmap
+import os
+import stat
+import struct
+import time
+from typing import Any, Self
+
+MAGIC = b"HASM"
+VERSION = 1
+
+DEFAULT_SIZE = 4 * 1024 * 1024
+HEADER_SIZE = 64
+
+# magic, version, generation, sequence, data end
+_HEADER = struct.Struct("<4sIQQQ")
+_GENERATION = struct.Struct("<Q")
+_GENERATION_OFFSET = 8
+_SEQUENCE_DATA_END = struct.Struct("<QQ")
+_SEQUENCE_DATA_END_OFFSET = 16
+# entity_id length, state length
+_RECORD = struct.Struct("<HI")
+
+_REFRESH_ATTEMPTS = 100
+_REFRESH_RETRY_DELAY = 0.001
+
+
+class StateMirrorError(Exception):
+    """Error to indicate the state table cannot be read."""
+
+
+def table_size(states: Iterable[tuple[str, bytes]]) -> int:
+    """Return the size of a state table holding one record per state."""
+    return HEADER_SIZE + sum(
+        _RECORD.size + len(entity_id.encode()) + len(state)
+        for entity_id, state in states
+    )
+
+
+def _remove_table(path: str) -> None:
+    """Remove an existing state table, refusing to remove any other file."""
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW | os.O_NONBLOCK)
+    except FileNotFoundError:
+        return
+    except OSError as err:
+        raise StateMirrorError(f"Refusing to replace {path}: {err}") from err
+    try:
+        if not stat.S_ISREG(os.fstat(fd).st_mode) or os.read(fd, len(MAGIC)) != MAGIC:
+            raise StateMirrorError(
+                f"Refusing to replace {path}, it is not a state table"
+            )
+    finally:
+        os.close(fd)
+    os.unlink(path)
+
+
+class StateMirrorWriter:
+    """Write states to a memory-mapped state table.
+
+    Writing only touches memory, committing makes the written
+    records visible to readers. When the table is full the
+    states are kept in memory until it has been compacted.
+    """
+
+    def __init__(self, path: str, size: int = DEFAULT_SIZE) -> None:
+        """Create a new state table.
+
+        An existing table is replaced instead of truncated so readers
+        that still have it mapped are not affected, any other file at
+        path is left alone. The table is only readable by its owner.
+
+        This method does I/O and must be run in the executor.
+        """
+        size = max(size, HEADER_SIZE)
+        _remove_table(path)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600)
+        os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        self._states: dict[str, bytes] = {}
+        self._generation = 0
+        self._sequence = 0
+        self._data_end = HEADER_SIZE
+        self._compact_needed = False
+        self._compacting = False
+        self._compact_sequence = 0
+        # Entities written while the table is full or being compacted
+        self._changed: set[str] = set()
+        _HEADER.pack_into(self._map, 0, MAGIC, VERSION, 0, 0, HEADER_SIZE)
+
+    @property
+    def sequence(self) -> int:
+        """Return the number of state changes written."""
+        return self._sequence
+
+    @property
+    def size(self) -> int:
+        """Return the size of the state table."""
+        return len(self._map)
+
+    @property
+    def compact_needed(self) -> bool:
+        """Return if the table is full and has to be compacted."""
+        return self._compact_needed and not self._compacting
+
+    def write(self, entity_id: str, state: bytes | None) -> None:
+        """Append the state of an entity, None marks the entity as removed."""
+        if state is None:
+            if self._states.pop(entity_id, None) is None:
+                return
+        else:
+            self._states[entity_id] = state
+        self._sequence += 1
+        if self._compact_needed or self._compacting:
+            self._changed.add(entity_id)
+        elif not self._append(entity_id, state or b""):
+            self._compact_needed = True
+
+    def commit(self) -> None:
+        """Make the records written since the last commit visible to readers.
+
+        Nothing is published while the table is full, the states are
+        published once it has been compacted.
+        """
+        if not self._compact_needed and not self._compacting:
+            self._publish(self._sequence)
+
+    def start_compact(self) -> list[tuple[str, bytes]]:
+        """Start compacting the table and return the states to rewrite.
+
+        Until finish_compact is called states are only written to
+        memory.
+        """
+        self._compact_needed = False
+        self._compacting = True
+        self._compact_sequence = self._sequence
+        self._changed.clear()
+        return list(self._states.items())
+
+    def compact(self, states: list[tuple[str, bytes]]) -> None:
+        """Rewrite the table with the states returned by start_compact.
+
+        The table is grown when the states would fill more than half
+        of it. The generation is odd while the table is being rewritten
+        so readers can wait for it to finish.
+
+        This method does I/O and must be run in the executor.
+        """
+        records = [(entity_id.encode(), state) for entity_id, state in states]
+        needed = HEADER_SIZE + sum(
+            _RECORD.size + len(entity_id) + len(state) for entity_id, state in records
+        )
+        if needed * 2 > len(self._map):
+            self._map.resize(max(len(self._map) * 2, needed * 2))
+        self._set_generation(self._generation + 1)
+        offset = HEADER_SIZE
+        for entity_id, state in records:
+            self._write_record(offset, entity_id, state)
+            offset += _RECORD.size + len(entity_id) + len(state)
+        self._data_end = offset
+        self._publish(self._compact_sequence)
+        self._set_generation(self._generation + 1)
+
+    def finish_compact(self) -> None:
+        """Append and commit the states written while compacting."""
+        self._compacting = False
+        changed = self._changed
+        self._changed = set()
+        for entity_id in changed:
+            if not self._append(entity_id, self._states.get(entity_id, b"")):
+                # The remaining states are rewritten by the next compaction
+                self._compact_needed = True
+                break
+        self.commit()
+
+    def close(self) -> None:
+        """Close the state table."""
+        self._map.close()
+        os.close(self._fd)
+
+    def _publish(self, sequence: int) -> None:
+        """Publish the sequence and the end of the written records."""
+        _SEQUENCE_DATA_END.pack_into(
+            self._map, _SEQUENCE_DATA_END_OFFSET, sequence, self._data_end
+        )
+
+    def _append(self, entity_id: str, state: bytes) -> bool:
+        """Append a record, return False if it does not fit in the table."""
+        entity_id_bytes = entity_id.encode()
+        record_end = self._data_end + _RECORD.size + len(entity_id_bytes) + len(state)
+        if record_end > len(self._map):
+            return False
+        self._write_record(self._data_end, entity_id_bytes, state)
+        self._data_end = record_end
+        return True
+
+    def _write_record(self, offset: int, entity_id: bytes, state: bytes) -> None:
+        """Write a record at offset."""
+        _RECORD.pack_into(self._map, offset, len(entity_id), len(state))
+        offset += _RECORD.size
+        self._map[offset : offset + len(entity_id)] = entity_id
+        offset += len(entity_id)
+        self._map[offset : offset + len(state)] = state
+
+    def _set_generation(self, generation: int) -> None:
+        """Publish a new generation."""
+        self._generation = generation
+        _GENERATION.pack_into(self._map, _GENERATION_OFFSET, generation)
+
+
+class StateMirrorReader:
+    """Read-only client of a state table written by Home Assistant.
+
+    Call refresh to pick up changes, the sequence property can be
+    polled to cheaply detect if there are any.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open the state table."""
+        self._path = path
+        self._index: dict[str, tuple[int, int]] = {}
+        self._generation = -1
+        self._offset = HEADER_SIZE
+        self._fd, self._map = self._open()
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the state table when leaving the context manager."""
+        self.close()
+
+    @property
+    def sequence(self) -> int:
+        """Return the number of state changes published by the writer."""
+        sequence: int = _SEQUENCE_DATA_END.unpack_from(
+            self._map, _SEQUENCE_DATA_END_OFFSET
+        )[0]
+        return sequence
+
+    def refresh(self) -> None:
+        """Index the records published since the last refresh."""
+        if os.stat(self._path).st_ino != os.fstat(self._fd).st_ino:
+            # The writer was restarted and replaced the table
+            self.close()
+            self._index.clear()
+            self._generation = -1
+            self._fd, self._map = self._open()
+        for _ in range(_REFRESH_ATTEMPTS):
+            generation: int = _GENERATION.unpack_from(self._map, _GENERATION_OFFSET)[0]
+            if generation % 2:
+                time.sleep(_REFRESH_RETRY_DELAY)
+                continue
+            data_end: int = _SEQUENCE_DATA_END.unpack_from(
+                self._map, _SEQUENCE_DATA_END_OFFSET
+            )[1]
+            if generation != self._generation:
+                self._index.clear()
+                self._offset = HEADER_SIZE
+            if data_end > len(self._map):
+                self._remap()
+            self._scan(data_end)
+            if _GENERATION.unpack_from(self._map, _GENERATION_OFFSET)[0] == generation:
+                self._generation = generation
+                return
+            # The table was compacted while it was being scanned
+            self._generation = -1
+        raise StateMirrorError(f"Timed out waiting for {self._path} to be compacted")
+
+    def entity_ids(self) -> list[str]:
+        """Return the entity_ids in the state table."""
+        return list(self._index)
+
+    def get(self, entity_id: str) -> memoryview | None:
+        """Return the JSON representation of the state of an entity.
+
+        The returned view points into the state table without copying
+        it and is only valid until the next refresh.
+        """
+        if (location := self._index.get(entity_id)) is None:
+            return None
+        start, length = location
+        return memoryview(self._map)[start : start + length]
+
+    def get_json(self, entity_id: str) -> dict[str, Any] | None:
+        """Return the decoded state of an entity."""
+        if (state := self.get(entity_id)) is None:
+            return None
+        with state:
+            decoded: dict[str, Any] = json.loads(state.tobytes())
+        return decoded
+
+    def close(self) -> None:
+        """Close the state table."""
+        # If views returned by get are still alive the map
+        # is closed once they are garbage collected
+        with suppress(BufferError):
+            self._map.close()
+        os.close(self._fd)
+
+    def _open(self) -> tuple[int, mmap.mmap]:
+        """Open and map the state table."""
+        fd = os.open(self._path, os.O_RDONLY)
+        try:
+            table = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as err:
+            os.close(fd)
+            raise StateMirrorError(f"{self._path} is not a state table") from err
+        header = _HEADER.unpack_from(table) if len(table) >= HEADER_SIZE else None
+        if header is None or header[:2] != (MAGIC, VERSION):
+            table.close()
+            os.close(fd)
+            raise StateMirrorError(
+                f"{self._path} is not a version {VERSION} state table"
+            )
+        return fd, table
+
+    def _remap(self) -> None:
+        """Map the table again after the writer has grown it."""
+        table = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+        with suppress(BufferError):
+            self._map.close()
+        self._map = table
+
+    def _scan(self, data_end: int) -> None:
+        """Index the records between the last scanned offset and data_end."""
+        table = self._map
+        index = self._index
+        offset = self._offset
+        while offset < data_end:
+            entity_id_length, state_length = _RECORD.unpack_from(table, offset)
+            entity_id_start = offset + _RECORD.size
+            state_start = entity_id_start + entity_id_length
+            entity_id = table[entity_id_start:state_start].decode()
+            if state_length:
+                index[entity_id] = (state_start, state_length)
+            else:
+                index.pop(entity_id, None)
+            offset = state_start + state_length
+        self._offset = offset
@@ -102,6 +102,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Joined data of all the parts, stored once the segment is complete
+    _data: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -139,8 +141,17 @@ class Segment:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        """Return reconstructed data for all parts as bytes, without init.
+
+        The parts of a complete segment no longer change, so the data is
+        only joined once and shared by all the requests for the segment.
+        """
+        if self._data is not None:
+            return self._data
+        data = b"".join([part.data for part in self.parts])
+        if self.complete:
+            self._data = data
+        return data
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
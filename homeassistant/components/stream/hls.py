@@ -64,6 +64,8 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        # Last rendered playlist, keyed by the state of the last segment
+        self.playlist_cache: tuple[tuple[int, int, bool], bytes] | None = None
 
     @property
     def name(self) -> str:
@@ -74,6 +76,7 @@ class HlsStreamOutput(StreamOutput):
         """Handle cleanup."""
         super().cleanup()
         self._segments.clear()
+        self.playlist_cache = None
 
     @property
     def target_duration(self) -> float:
@@ -232,6 +235,22 @@ class HlsPlaylistView(StreamView):
 
         return "\n".join(playlist) + "\n"
 
+    @classmethod
+    def render_bytes(cls, track: HlsStreamOutput) -> bytes:
+        """Return the encoded playlist, rendering it once per segment and part.
+
+        The playlist only changes when a segment or part is added or the
+        last segment is completed, so all the viewers woken by the same
+        part share a single render.
+        """
+        last_segment = cast(Segment, track.last_segment)
+        key = (last_segment.sequence, len(last_segment.parts), last_segment.complete)
+        if (cache := track.playlist_cache) is not None and cache[0] == key:
+            return cache[1]
+        playlist = cls.render(track).encode("utf-8")
+        track.playlist_cache = (key, playlist)
+        return playlist
+
     @staticmethod
     def bad_request(blocking: bool, target_duration: float) -> web.Response:
         """Return a HTTP Bad Request response."""
@@ -325,7 +344,7 @@ class HlsPlaylistView(StreamView):
                 return self.not_found(blocking_request, track.target_duration)
 
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=self.render_bytes(track),
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
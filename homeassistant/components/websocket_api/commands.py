@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
@@ -68,6 +69,9 @@ from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
+# Longest window subscribe_entities can coalesce state changes in
+MAX_COALESCE_MS = 10000
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -368,30 +372,116 @@ def _send_handle_get_states_response(
 
 
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
+def _entity_change_allowed(
     entity_ids: set[str] | None,
     entity_filter: Callable[[str], bool] | None,
     user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
+    entity_id: str,
+) -> bool:
+    """Return if a change of an entity should be forwarded to websocket."""
     if (entity_ids and entity_id not in entity_ids) or (
         entity_filter and not entity_filter(entity_id)
     ):
-        return
+        return False
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    return (
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
+@callback
+def _forward_entity_changes(
+    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+) -> None:
+    """Forward entity state changed events to websocket."""
+    if _entity_change_allowed(entity_ids, entity_filter, user, event.data["entity_id"]):
+        send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+
+
+class _CoalescedEntityChanges:
+    """Coalesce entity state changes and forward them once per window.
+
+    Only the state before the first and after the last change of each
+    entity within the window are kept so a connection receives at most
+    one message per window, regardless of how many states change.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_send_message",
+        "_entity_ids",
+        "_entity_filter",
+        "_user",
+        "_message_id_as_bytes",
+        "_window",
+        "_pending",
+        "_timer",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        message_id_as_bytes: bytes,
+        window: float,
+    ) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._send_message = send_message
+        self._entity_ids = entity_ids
+        self._entity_filter = entity_filter
+        self._user = user
+        self._message_id_as_bytes = message_id_as_bytes
+        self._window = window
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add_event(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state changed event to the current window."""
+        data = event.data
+        entity_id = data["entity_id"]
+        if not _entity_change_allowed(
+            self._entity_ids, self._entity_filter, self._user, entity_id
+        ):
+            return
+        if (pending := self._pending.get(entity_id)) is None:
+            self._pending[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            self._pending[entity_id] = (pending[0], data["new_state"])
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(self._window, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the changes of the window."""
+        self._timer = None
+        pending = self._pending
+        self._pending = {}
+        if message := messages.coalesced_state_diff_message(
+            self._message_id_as_bytes, pending
+        ):
+            self._send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
 
 
 @callback
@@ -399,6 +489,9 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_ms"): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_COALESCE_MS)
+        ),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -415,17 +508,38 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    if coalesce_ms := msg.get("coalesce_ms"):
+        # Opt-in for clients on slow links, the changes of each entity
+        # are merged so only the latest state is sent once per window.
+        coalescer = _CoalescedEntityChanges(
+            hass,
             connection.send_message,
             entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
-        ),
-    )
+            coalesce_ms / 1000,
+        )
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, coalescer.async_add_event)
+
+        @callback
+        def _async_unsub() -> None:
+            unsub()
+            coalescer.async_cancel()
+
+        connection.subscriptions[msg_id] = _async_unsub
+    else:
+        connection.subscriptions[msg_id] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                _forward_entity_changes,
+                connection.send_message,
+                entity_ids,
+                entity_filter,
+                connection.user,
+                message_id_as_bytes,
+            ),
+        )
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
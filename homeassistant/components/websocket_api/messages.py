@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -15,7 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -199,6 +200,13 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the diff between two states of an entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +243,53 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
+
+
+def coalesced_state_diff_message(
+    message_id_as_bytes: bytes,
+    changes: Mapping[str, tuple[State | None, State | None]],
+) -> bytes | None:
+    """Return an event message for the coalesced changes of entities.
+
+    The changes map each entity_id to its state before the first and
+    after the last state change that was coalesced. Entities which were
+    added and removed again are left out, None is returned if there is
+    nothing left to send.
+    """
+    added: dict[str, CompressedState] = {}
+    removed: list[str] = []
+    changed: dict[str, dict[str, dict[str, Any]]] = {}
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = new_state.as_compressed_state
+        elif (diff := _state_diff(old_state, new_state))[STATE_DIFF_ADDITIONS] or (
+            STATE_DIFF_REMOVALS in diff
+        ):
+            changed[entity_id] = diff
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if not event:
+        return None
+    return b"".join(
+        (
+            (
+                _message_to_json_bytes_or_none({"type": "event", "event": event})
+                or INVALID_JSON_PARTIAL_MESSAGE
+            )[:-1],
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -48,7 +48,13 @@ from .exceptions import (
     ConfigEntryNotReady,
     HomeAssistantError,
 )
-from .helpers import device_registry, entity_registry, issue_registry as ir, storage
+from .helpers import (
+    device_registry,
+    entity_registry,
+    issue_registry as ir,
+    startup_trace,
+    storage,
+)
 from .helpers.debounce import Debouncer
 from .helpers.discovery_flow import DiscoveryKey
 from .helpers.dispatcher import SignalType, async_dispatcher_send_internal
@@ -2221,19 +2227,25 @@ class ConfigEntries:
     async def _async_forward_entry_setups_locked(
         self, entry: ConfigEntry, platforms: Iterable[Platform | str]
     ) -> None:
-        await asyncio.gather(
-            *(
-                create_eager_task(
-                    self._async_forward_entry_setup(entry, platform, False),
-                    name=(
-                        f"config entry forward setup {entry.title} "
-                        f"{entry.domain} {entry.entry_id} {platform}"
-                    ),
-                    loop=self.hass.loop,
+        with startup_trace.async_trace(
+            self.hass,
+            startup_trace.SPAN_FORWARD_ENTRY_SETUPS,
+            entry.domain,
+            entry.entry_id,
+        ):
+            await asyncio.gather(
+                *(
+                    create_eager_task(
+                        self._async_forward_entry_setup(entry, platform, False),
+                        name=(
+                            f"config entry forward setup {entry.title} "
+                            f"{entry.domain} {entry.entry_id} {platform}"
+                        ),
+                        loop=self.hass.loop,
+                    )
+                    for platform in platforms
                 )
-                for platform in platforms
             )
-        )
 
     async def async_forward_entry_setup(
         self, entry: ConfigEntry, domain: Platform | str
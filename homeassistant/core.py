@@ -19,7 +19,7 @@ from collections.abc import (
 )
 import concurrent.futures
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
 import enum
 import functools
@@ -1446,6 +1446,126 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+@dataclass(slots=True)
+class _BatchedListener(Generic[_DataT]):
+    hass: HomeAssistant
+    listener_job: HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None]
+    batch_window: float | None
+    events: list[Event[_DataT]] = field(default_factory=list)
+    flush_handle: asyncio.Handle | None = None
+
+    @callback
+    def __call__(self, event: Event[_DataT]) -> None:
+        """Collect the event and schedule a flush of the batch."""
+        self.events.append(event)
+        if self.flush_handle is not None:
+            return
+        if self.batch_window:
+            self.flush_handle = self.hass.loop.call_later(
+                self.batch_window, self._async_flush
+            )
+        else:
+            self.flush_handle = self.hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Fire the listener with the collected events."""
+        self.flush_handle = None
+        events = self.events
+        self.events = []
+        try:
+            self.hass.async_run_hass_job(self.listener_job, events)
+        except Exception:
+            _LOGGER.exception("Error running job: %s", self.listener_job)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the pending flush and drop collected events."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        self.events = []
+
+    def __repr__(self) -> str:
+        """Return the representation of the listener and source module."""
+        module = inspect.getmodule(self.listener_job.target)
+        if module:
+            return f"<_BatchedListener {module.__name__}:{self.listener_job.target}>"
+        return f"<_BatchedListener {self.listener_job.target}>"
+
+
+# Number of latency buckets kept per listener, the last bucket
+# holds all calls that took longer than 2**23 microseconds.
+_LISTENER_STATS_BUCKETS = 25
+
+
+class EventListenerStats:
+    """Call statistics of an event bus listener.
+
+    Latencies are recorded in a histogram with power of two
+    microsecond buckets so recording a call is constant time.
+    """
+
+    __slots__ = ("name", "integration", "calls", "total_time", "histogram")
+
+    def __init__(self, name: str, integration: str) -> None:
+        """Initialize the statistics."""
+        self.name = name
+        self.integration = integration
+        self.calls = 0
+        self.total_time = 0.0
+        self.histogram = [0] * _LISTENER_STATS_BUCKETS
+
+    def add(self, elapsed: float) -> None:
+        """Record a call that took elapsed seconds."""
+        self.calls += 1
+        self.total_time += elapsed
+        bucket = int(elapsed * 1_000_000).bit_length()
+        self.histogram[min(bucket, _LISTENER_STATS_BUCKETS - 1)] += 1
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound in seconds of the given latency percentile."""
+        threshold = self.calls * percent / 100
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= threshold:
+                return (1 << bucket) / 1_000_000
+        return 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the statistics."""
+        return {
+            "name": self.name,
+            "integration": self.integration,
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+        }
+
+
+def _listener_stats_key(
+    job: HassJob[[Event[Any]], Coroutine[Any, Any, None] | None],
+) -> tuple[str, str]:
+    """Return the name and owning integration of an event bus listener."""
+    target: Any = job.target
+    if isinstance(target, (_OneTimeListener, _BatchedListener)):
+        target = target.listener_job.target
+    while isinstance(target, functools.partial):
+        target = target.func
+    module: str = getattr(target, "__module__", None) or "unknown"
+    qualname: str = getattr(target, "__qualname__", None) or type(target).__qualname__
+    parts = module.split(".")
+    if module.startswith("custom_components."):
+        integration = parts[1]
+    elif module.startswith("homeassistant.components."):
+        integration = parts[2]
+    else:
+        integration = parts[0]
+    return f"{module}.{qualname}", integration
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
@@ -1460,10 +1580,17 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_listener_stats",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
+        self._listener_stats: dict[tuple[str, str], EventListenerStats] | None = None
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
@@ -1555,6 +1682,7 @@ class EventBus:
         else:
             match_all_listeners = EMPTY_LIST
 
+        listener_stats = self._listener_stats
         event: Event[_DataT] | None = None
         for job, event_filter in listeners + match_all_listeners:
             if event_filter is not None:
@@ -1574,11 +1702,82 @@ class EventBus:
                     context,
                 )
 
+            if listener_stats is not None:
+                self._async_run_job_with_stats(listener_stats, job, event)
+                continue
+
             try:
                 self._hass.async_run_hass_job(job, event)
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def _async_run_job_with_stats(
+        self,
+        listener_stats: dict[tuple[str, str], EventListenerStats],
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event: Event[_DataT],
+    ) -> None:
+        """Run a listener job and record how long it took."""
+        start = time.perf_counter()
+        try:
+            self._hass.async_run_hass_job(job, event)
+        except Exception:
+            _LOGGER.exception("Error running job: %s", job)
+        elapsed = time.perf_counter() - start
+        # Keyed by name so removed listeners are not kept alive and the
+        # statistics of listeners with the same name are combined
+        key = _listener_stats_key(job)
+        if (stats := listener_stats.get(key)) is None:
+            stats = listener_stats[key] = EventListenerStats(*key)
+        stats.add(elapsed)
+
+    @callback
+    def async_enable_listener_stats(self) -> None:
+        """Start recording call statistics for all listeners.
+
+        Only the time spent calling the listener in the event loop is
+        recorded, coroutine functions are only timed until they are
+        scheduled.
+
+        This method must be run in the event loop.
+        """
+        if self._listener_stats is None:
+            self._listener_stats = {}
+
+    @callback
+    def async_disable_listener_stats(self) -> None:
+        """Stop recording call statistics and discard them.
+
+        This method must be run in the event loop.
+        """
+        self._listener_stats = None
+
+    @property
+    def listener_stats_enabled(self) -> bool:
+        """Return if call statistics are recorded for listeners."""
+        return self._listener_stats is not None
+
+    @callback
+    def async_listener_stats(self) -> list[dict[str, Any]]:
+        """Return the recorded call statistics, slowest listeners first.
+
+        Statistics of listeners with the same name and integration
+        are combined.
+
+        This method must be run in the event loop.
+        """
+        if not self._listener_stats:
+            return []
+        return [
+            stats.as_dict()
+            for stats in sorted(
+                self._listener_stats.values(),
+                key=lambda stats: stats.total_time,
+                reverse=True,
+            )
+        ]
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1642,6 +1841,59 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_batched(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+        batch_window: float | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type and receive them in batches.
+
+        Events are collected and passed to the listener as a list, in the
+        order they were fired. If batch_window is not set, the listener is
+        called once per event loop iteration in which events were fired,
+        otherwise it is called at most once every batch_window seconds.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if the
+        event should be added to the batch.
+
+        Events that are still pending when the listener is removed are
+        discarded.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        if event_type == EVENT_STATE_REPORTED and not event_filter:
+            raise HomeAssistantError(f"Event filter is required for event {event_type}")
+        batched_listener: _BatchedListener[_DataT] = _BatchedListener(
+            self._hass,
+            HassJob(listener, f"listen batched {event_type}"),
+            batch_window,
+        )
+        remove = self._async_listen_filterable_job(
+            event_type,
+            (
+                HassJob(
+                    batched_listener,
+                    f"batched listen {event_type} {listener}",
+                    job_type=HassJobType.Callback,
+                ),
+                event_filter,
+            ),
+        )
+
+        @callback
+        def _async_remove_batched_listener() -> None:
+            """Remove the batched listener."""
+            remove()
+            batched_listener.async_cancel()
+
+        return _async_remove_batched_listener
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -2064,10 +2316,135 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+@dataclass(frozen=True, slots=True)
+class StatesSnapshot:
+    """Read-only columnar snapshot of the state machine.
+
+    Each column holds one value per entity and the same row in every
+    column describes the same entity. The order of the rows is not
+    guaranteed to be stable between snapshots.
+    """
+
+    entity_ids: tuple[str, ...]
+    states: tuple[str, ...]
+    last_changed_timestamps: tuple[float, ...]
+    domain_indexes: tuple[int, ...]
+    attributes: tuple[ReadOnlyDict[str, Any], ...]
+    domains: tuple[str, ...]
+
+    def __len__(self) -> int:
+        """Return the number of entities in the snapshot."""
+        return len(self.entity_ids)
+
+    def domain_rows(self, domain: str) -> list[int]:
+        """Return the rows of the entities of a domain."""
+        try:
+            domain_index = self.domains.index(domain)
+        except ValueError:
+            return []
+        return [
+            row
+            for row, row_domain_index in enumerate(self.domain_indexes)
+            if row_domain_index == domain_index
+        ]
+
+
+class _StateColumns:
+    """Columns of the state machine that are kept up to date incrementally."""
+
+    __slots__ = (
+        "rows",
+        "entity_ids",
+        "states",
+        "last_changed_timestamps",
+        "domain_indexes",
+        "attributes",
+        "domains",
+        "domain_to_index",
+        "snapshot",
+    )
+
+    def __init__(self, states: Iterable[State]) -> None:
+        """Initialize the columns from the current states."""
+        self.rows: dict[str, int] = {}
+        self.entity_ids: list[str] = []
+        self.states: list[str] = []
+        self.last_changed_timestamps: list[float] = []
+        self.domain_indexes: list[int] = []
+        self.attributes: list[ReadOnlyDict[str, Any]] = []
+        self.domains: list[str] = []
+        self.domain_to_index: dict[str, int] = {}
+        self.snapshot: StatesSnapshot | None = None
+        for state in states:
+            self.set(state)
+
+    def _domain_index(self, domain: str) -> int:
+        """Return the index of a domain, adding it if needed."""
+        if (domain_index := self.domain_to_index.get(domain)) is None:
+            domain_index = self.domain_to_index[domain] = len(self.domains)
+            self.domains.append(domain)
+        return domain_index
+
+    def set(self, state: State) -> None:
+        """Add or update the row of a state."""
+        self.snapshot = None
+        if (row := self.rows.get(state.entity_id)) is None:
+            self.rows[state.entity_id] = len(self.entity_ids)
+            self.entity_ids.append(state.entity_id)
+            self.states.append(state.state)
+            self.last_changed_timestamps.append(state.last_changed_timestamp)
+            self.domain_indexes.append(self._domain_index(state.domain))
+            self.attributes.append(state.attributes)
+            return
+        self.states[row] = state.state
+        self.last_changed_timestamps[row] = state.last_changed_timestamp
+        self.attributes[row] = state.attributes
+
+    def remove(self, entity_id: str) -> None:
+        """Remove the row of an entity by moving the last row into its place."""
+        if (row := self.rows.pop(entity_id, None)) is None:
+            return
+        self.snapshot = None
+        last_row = len(self.entity_ids) - 1
+        columns: tuple[list[Any], ...] = (
+            self.entity_ids,
+            self.states,
+            self.last_changed_timestamps,
+            self.domain_indexes,
+            self.attributes,
+        )
+        if row != last_row:
+            for column in columns:
+                column[row] = column[last_row]
+            self.rows[self.entity_ids[row]] = row
+        for column in columns:
+            column.pop()
+
+    def as_snapshot(self) -> StatesSnapshot:
+        """Return a snapshot of the columns."""
+        if self.snapshot is None:
+            self.snapshot = StatesSnapshot(
+                tuple(self.entity_ids),
+                tuple(self.states),
+                tuple(self.last_changed_timestamps),
+                tuple(self.domain_indexes),
+                tuple(self.attributes),
+                tuple(self.domains),
+            )
+        return self.snapshot
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_columns",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2076,6 +2453,8 @@ class StateMachine:
         # up read operations
         self._states_data = self._states.data
         self._reservations: set[str] = set()
+        # _columns is only maintained once a columnar snapshot has been requested
+        self._columns: _StateColumns | None = None
         self._bus = bus
         self._loop = loop
 
@@ -2148,6 +2527,20 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_columnar_snapshot(self) -> StatesSnapshot:
+        """Return a read-only columnar snapshot of all states.
+
+        The snapshot is cached until the next state change, which
+        makes it cheap to iterate over all states in bulk without
+        creating State objects or lists of them.
+
+        This method must be run in the event loop.
+        """
+        if self._columns is None:
+            self._columns = _StateColumns(self._states_data.values())
+        return self._columns.as_snapshot()
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2189,6 +2582,9 @@ class StateMachine:
         if old_state is None:
             return False
 
+        if self._columns is not None:
+            self._columns.remove(entity_id)
+
         old_state.expire()
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
@@ -2376,6 +2772,8 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        if self._columns is not None:
+            self._columns.set(state)
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
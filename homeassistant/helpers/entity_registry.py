@@ -10,10 +10,21 @@ timer.
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Callable, Container, Hashable, KeysView, Mapping
+from collections import UserDict, defaultdict
+from collections.abc import (
+    Callable,
+    Container,
+    Hashable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    ValuesView,
+)
 from datetime import datetime, timedelta
 from enum import StrEnum
+from itertools import chain
 import logging
 import time
 from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
@@ -546,11 +557,115 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
         return data
 
 
+_STORED_ENTRY_KEYS = (
+    "aliases",
+    "area_id",
+    "categories",
+    "capabilities",
+    "config_entry_id",
+    "created_at",
+    "device_class",
+    "device_id",
+    "disabled_by",
+    "entity_category",
+    "entity_id",
+    "hidden_by",
+    "icon",
+    "id",
+    "has_entity_name",
+    "labels",
+    "modified_at",
+    "name",
+    "options",
+    "original_device_class",
+    "original_icon",
+    "original_name",
+    "platform",
+    "supported_features",
+    "translation_key",
+    "unique_id",
+    "previous_unique_id",
+    "unit_of_measurement",
+)
+_STORED_DELETED_ENTRY_KEYS = (
+    "config_entry_id",
+    "created_at",
+    "entity_id",
+    "id",
+    "modified_at",
+    "orphaned_timestamp",
+    "platform",
+    "unique_id",
+)
+_STORED_DISABLED_BY_INDEX = _STORED_ENTRY_KEYS.index("disabled_by")
+_STORED_ORPHANED_TIMESTAMP_INDEX = _STORED_DELETED_ENTRY_KEYS.index(
+    "orphaned_timestamp"
+)
+
+
+def _entry_from_storage(entity: dict[str, Any]) -> RegistryEntry:
+    """Create a registry entry from its stored data."""
+    return RegistryEntry(
+        aliases=set(entity["aliases"]),
+        area_id=entity["area_id"],
+        categories=entity["categories"],
+        capabilities=entity["capabilities"],
+        config_entry_id=entity["config_entry_id"],
+        created_at=datetime.fromisoformat(entity["created_at"]),
+        device_class=entity["device_class"],
+        device_id=entity["device_id"],
+        disabled_by=RegistryEntryDisabler(entity["disabled_by"])
+        if entity["disabled_by"]
+        else None,
+        entity_category=EntityCategory(entity["entity_category"])
+        if entity["entity_category"]
+        else None,
+        entity_id=entity["entity_id"],
+        hidden_by=RegistryEntryHider(entity["hidden_by"])
+        if entity["hidden_by"]
+        else None,
+        icon=entity["icon"],
+        id=entity["id"],
+        has_entity_name=entity["has_entity_name"],
+        labels=set(entity["labels"]),
+        modified_at=datetime.fromisoformat(entity["modified_at"]),
+        name=entity["name"],
+        options=entity["options"],
+        original_device_class=entity["original_device_class"],
+        original_icon=entity["original_icon"],
+        original_name=entity["original_name"],
+        platform=entity["platform"],
+        supported_features=entity["supported_features"],
+        translation_key=entity["translation_key"],
+        unique_id=entity["unique_id"],
+        previous_unique_id=entity["previous_unique_id"],
+        unit_of_measurement=entity["unit_of_measurement"],
+    )
+
+
+def _deleted_entry_from_storage(entity: dict[str, Any]) -> DeletedRegistryEntry:
+    """Create a deleted registry entry from its stored data."""
+    return DeletedRegistryEntry(
+        config_entry_id=entity["config_entry_id"],
+        created_at=datetime.fromisoformat(entity["created_at"]),
+        entity_id=entity["entity_id"],
+        id=entity["id"],
+        modified_at=datetime.fromisoformat(entity["modified_at"]),
+        orphaned_timestamp=entity["orphaned_timestamp"],
+        platform=entity["platform"],
+        unique_id=entity["unique_id"],
+    )
+
+
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
+    Entries loaded from storage are kept as a tuple of their stored values
+    and the RegistryEntry is only created when the entry is first accessed.
+    Iterating over the values or items creates all the entries.
+
     Maintains six additional indexes:
-    - id -> entry
+    - id -> entity_id
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
@@ -561,33 +676,139 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
-        self._entry_ids: dict[str, RegistryEntry] = {}
+        self._stored: dict[str, tuple[Any, ...]] = {}
+        self._entry_ids: dict[str, str] = {}
         self._index: dict[tuple[str, str, str], str] = {}
         self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
 
-    def _index_entry(self, key: str, entry: RegistryEntry) -> None:
-        """Index an entry."""
-        self._entry_ids[entry.id] = entry
-        self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+    def __contains__(self, key: object) -> bool:
+        """Return if the container has the key."""
+        return key in self.data or key in self._stored
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.data) + len(self._stored)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys without creating the entries."""
+        return chain(self.data, self._stored)
+
+    def __missing__(self, key: str) -> RegistryEntry:
+        """Create an entry loaded from storage."""
+        if (stored := self._stored.pop(key, None)) is None:
+            raise KeyError(key)
+        entry = self.data[key] = _entry_from_storage(
+            dict(zip(_STORED_ENTRY_KEYS, stored, strict=True))
+        )
+        return entry
+
+    def __setitem__(self, key: str, entry: RegistryEntry) -> None:
+        """Add an item."""
+        if key in self._stored:
+            # Create the entry so the base class unindexes it
+            self.__missing__(key)
+        super().__setitem__(key, entry)
+
+    def _create_all(self) -> None:
+        """Create all the entries loaded from storage."""
+        for key in list(self._stored):
+            self.__missing__(key)
+
+    def values(self) -> ValuesView[RegistryEntry]:
+        """Return the entries, creating the ones loaded from storage."""
+        if self._stored:
+            self._create_all()
+        return self.data.values()
+
+    def items(self) -> ItemsView[str, RegistryEntry]:
+        """Return the items, creating the entries loaded from storage."""
+        if self._stored:
+            self._create_all()
+        return self.data.items()
+
+    def add_stored(self, entity: dict[str, Any]) -> None:
+        """Add an entry from its stored data without creating it."""
+        key: str = entity["entity_id"]
+        if key in self:
+            del self[key]
+        self._stored[key] = tuple(
+            entity[stored_key] for stored_key in _STORED_ENTRY_KEYS
+        )
+        self._index_values(
+            key,
+            entity["id"],
+            (split_entity_id(key)[0], entity["platform"], entity["unique_id"]),
+            entity["config_entry_id"],
+            entity["device_id"],
+            entity["area_id"],
+            entity["labels"],
+        )
+
+    def as_storage_data(self) -> list[json_fragment | dict[str, Any]]:
+        """Return the data to store, without creating the stored entries."""
+        data: list[json_fragment | dict[str, Any]] = [
+            entry.as_storage_fragment for entry in self.data.values()
+        ]
+        data.extend(
+            dict(zip(_STORED_ENTRY_KEYS, stored, strict=True))
+            for stored in self._stored.values()
+        )
+        return data
+
+    def get_enabled_entity_ids(self) -> list[str]:
+        """Return the entity ids of the enabled entries without creating them."""
+        entity_ids = [key for key, entry in self.data.items() if not entry.disabled]
+        entity_ids.extend(
+            key
+            for key, stored in self._stored.items()
+            if not stored[_STORED_DISABLED_BY_INDEX]
+        )
+        return entity_ids
+
+    def _index_values(
+        self,
+        key: str,
+        entry_id: str,
+        unique_id_key: tuple[str, str, str],
+        config_entry_id: str | None,
+        device_id: str | None,
+        area_id: str | None,
+        labels: Iterable[str],
+    ) -> None:
+        """Index the values of an entry."""
+        self._entry_ids[entry_id] = key
+        self._index[unique_id_key] = key
         # python has no ordered set, so we use a dict with True values
         # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
-        if (config_entry_id := entry.config_entry_id) is not None:
+        if config_entry_id is not None:
             self._config_entry_id_index[config_entry_id][key] = True
-        if (device_id := entry.device_id) is not None:
+        if device_id is not None:
             self._device_id_index[device_id][key] = True
-        if (area_id := entry.area_id) is not None:
+        if area_id is not None:
             self._area_id_index[area_id][key] = True
-        for label in entry.labels:
+        for label in labels:
             self._labels_index[label][key] = True
 
+    def _index_entry(self, key: str, entry: RegistryEntry) -> None:
+        """Index an entry."""
+        self._index_values(
+            key,
+            entry.id,
+            (entry.domain, entry.platform, entry.unique_id),
+            entry.config_entry_id,
+            entry.device_id,
+            entry.area_id,
+            entry.labels,
+        )
+
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
     ) -> None:
         """Unindex an entry."""
-        entry = self.data[key]
+        entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
         if config_entry_id := entry.config_entry_id:
@@ -600,6 +821,10 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
 
+    def _get(self, key: str) -> RegistryEntry:
+        """Get an indexed entry, creating it if it was loaded from storage."""
+        return self.data.get(key) or self.__missing__(key)
+
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
         return self._device_id_index.keys()
@@ -610,37 +835,141 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
 
     def get_entry(self, key: str) -> RegistryEntry | None:
         """Get entry from id."""
-        return self._entry_ids.get(key)
+        if (entity_id := self._entry_ids.get(key)) is None:
+            return None
+        return self._get(entity_id)
 
     def get_entries_for_device_id(
         self, device_id: str, include_disabled_entities: bool = False
     ) -> list[RegistryEntry]:
         """Get entries for device."""
-        data = self.data
+        get = self._get
         return [
             entry
             for key in self._device_id_index.get(device_id, ())
-            if not (entry := data[key]).disabled_by or include_disabled_entities
+            if not (entry := get(key)).disabled_by or include_disabled_entities
         ]
 
     def get_entries_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[RegistryEntry]:
         """Get entries for config entry."""
-        data = self.data
+        get = self._get
         return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+            get(key) for key in self._config_entry_id_index.get(config_entry_id, ())
         ]
 
     def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
         """Get entries for area."""
-        data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        get = self._get
+        return [get(key) for key in self._area_id_index.get(area_id, ())]
 
     def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
         """Get entries for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        get = self._get
+        return [get(key) for key in self._labels_index.get(label, ())]
+
+
+class DeletedEntityRegistryItems(UserDict[tuple[str, str, str], DeletedRegistryEntry]):
+    """Container for deleted entity registry items.
+
+    Maps (domain, platform, unique_id) -> entry. Entries loaded from
+    storage are kept as a tuple of their stored values and the
+    DeletedRegistryEntry is only created when the entry is first accessed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._stored: dict[tuple[str, str, str], tuple[Any, ...]] = {}
+
+    def __contains__(self, key: object) -> bool:
+        """Return if the container has the key."""
+        return key in self.data or key in self._stored
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.data) + len(self._stored)
+
+    def __iter__(self) -> Iterator[tuple[str, str, str]]:
+        """Iterate over the keys without creating the entries."""
+        return chain(self.data, self._stored)
+
+    def __missing__(self, key: tuple[str, str, str]) -> DeletedRegistryEntry:
+        """Create an entry loaded from storage."""
+        if (stored := self._stored.pop(key, None)) is None:
+            raise KeyError(key)
+        entry = self.data[key] = _deleted_entry_from_storage(
+            dict(zip(_STORED_DELETED_ENTRY_KEYS, stored, strict=True))
+        )
+        return entry
+
+    def __setitem__(
+        self, key: tuple[str, str, str], entry: DeletedRegistryEntry
+    ) -> None:
+        """Add an item."""
+        self._stored.pop(key, None)
+        self.data[key] = entry
+
+    def __delitem__(self, key: tuple[str, str, str]) -> None:
+        """Remove an item."""
+        if self._stored.pop(key, None) is None:
+            del self.data[key]
+
+    def _create_all(self) -> None:
+        """Create all the entries loaded from storage."""
+        for key in list(self._stored):
+            self.__missing__(key)
+
+    def values(self) -> ValuesView[DeletedRegistryEntry]:
+        """Return the entries, creating the ones loaded from storage."""
+        if self._stored:
+            self._create_all()
+        return self.data.values()
+
+    def items(self) -> ItemsView[tuple[str, str, str], DeletedRegistryEntry]:
+        """Return the items, creating the entries loaded from storage."""
+        if self._stored:
+            self._create_all()
+        return self.data.items()
+
+    def add_stored(self, key: tuple[str, str, str], entity: dict[str, Any]) -> None:
+        """Add an entry from its stored data without creating it."""
+        self.data.pop(key, None)
+        self._stored[key] = tuple(
+            entity[stored_key] for stored_key in _STORED_DELETED_ENTRY_KEYS
+        )
+
+    def as_storage_data(self) -> list[json_fragment | dict[str, Any]]:
+        """Return the data to store, without creating the stored entries."""
+        data: list[json_fragment | dict[str, Any]] = [
+            entry.as_storage_fragment for entry in self.data.values()
+        ]
+        data.extend(
+            dict(zip(_STORED_DELETED_ENTRY_KEYS, stored, strict=True))
+            for stored in self._stored.values()
+        )
+        return data
+
+    def get_orphaned_keys(self, orphaned_before: float) -> list[tuple[str, str, str]]:
+        """Return the keys of the entries orphaned before a timestamp.
+
+        The entries loaded from storage are not created.
+        """
+        keys = [
+            key
+            for key, entry in self.data.items()
+            if entry.orphaned_timestamp is not None
+            and entry.orphaned_timestamp < orphaned_before
+        ]
+        keys.extend(
+            key
+            for key, stored in self._stored.items()
+            if (orphaned_timestamp := stored[_STORED_ORPHANED_TIMESTAMP_INDEX])
+            is not None
+            and orphaned_timestamp < orphaned_before
+        )
+        return keys
 
 
 def _validate_item(
@@ -700,7 +1029,7 @@ def _validate_item(
 class EntityRegistry(BaseRegistry):
     """Class to hold a registry of entities."""
 
-    deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry]
+    deleted_entities: DeletedEntityRegistryItems
     entities: EntityRegistryItems
     _entities_data: dict[str, RegistryEntry]
 
@@ -713,6 +1042,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            binary=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -729,11 +1059,15 @@ class EntityRegistry(BaseRegistry):
         """Get EntityEntry for an entity_id or entity entry id.
 
         We retrieve the RegistryEntry from the underlying dict to avoid
-        the overhead of the UserDict __getitem__.
+        the overhead of the UserDict __getitem__, entries which have not
+        been created from storage yet are retrieved from the container.
         """
-        return self._entities_data.get(entity_id_or_uuid) or self.entities.get_entry(
-            entity_id_or_uuid
-        )
+        if entry := self._entities_data.get(entity_id_or_uuid):
+            return entry
+        entities = self.entities
+        if entity_id_or_uuid in entities:
+            return entities[entity_id_or_uuid]
+        return entities.get_entry(entity_id_or_uuid)
 
     @callback
     def async_get_entity_id(
@@ -1260,7 +1594,7 @@ class EntityRegistry(BaseRegistry):
 
         data = await self._store.async_load()
         entities = EntityRegistryItems()
-        deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
+        deleted_entities = DeletedEntityRegistryItems()
 
         if data is not None:
             for entity in data["entities"]:
@@ -1289,42 +1623,7 @@ class EntityRegistry(BaseRegistry):
                     )
                     continue
 
-                entities[entity["entity_id"]] = RegistryEntry(
-                    aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
-                    categories=entity["categories"],
-                    capabilities=entity["capabilities"],
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    device_class=entity["device_class"],
-                    device_id=entity["device_id"],
-                    disabled_by=RegistryEntryDisabler(entity["disabled_by"])
-                    if entity["disabled_by"]
-                    else None,
-                    entity_category=EntityCategory(entity["entity_category"])
-                    if entity["entity_category"]
-                    else None,
-                    entity_id=entity["entity_id"],
-                    hidden_by=RegistryEntryHider(entity["hidden_by"])
-                    if entity["hidden_by"]
-                    else None,
-                    icon=entity["icon"],
-                    id=entity["id"],
-                    has_entity_name=entity["has_entity_name"],
-                    labels=set(entity["labels"]),
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    name=entity["name"],
-                    options=entity["options"],
-                    original_device_class=entity["original_device_class"],
-                    original_icon=entity["original_icon"],
-                    original_name=entity["original_name"],
-                    platform=entity["platform"],
-                    supported_features=entity["supported_features"],
-                    translation_key=entity["translation_key"],
-                    unique_id=entity["unique_id"],
-                    previous_unique_id=entity["previous_unique_id"],
-                    unit_of_measurement=entity["unit_of_measurement"],
-                )
+                entities.add_stored(entity)
             for entity in data["deleted_entities"]:
                 try:
                     domain = split_entity_id(entity["entity_id"])[0]
@@ -1342,16 +1641,7 @@ class EntityRegistry(BaseRegistry):
                     entity["platform"],
                     entity["unique_id"],
                 )
-                deleted_entities[key] = DeletedRegistryEntry(
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    entity_id=entity["entity_id"],
-                    id=entity["id"],
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    orphaned_timestamp=entity["orphaned_timestamp"],
-                    platform=entity["platform"],
-                    unique_id=entity["unique_id"],
-                )
+                deleted_entities.add_stored(key, entity)
 
         self.deleted_entities = deleted_entities
         self.entities = entities
@@ -1361,10 +1651,8 @@ class EntityRegistry(BaseRegistry):
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         return {
-            "entities": [entry.as_storage_fragment for entry in self.entities.values()],
-            "deleted_entities": [
-                entry.as_storage_fragment for entry in self.deleted_entities.values()
-            ],
+            "entities": self.entities.as_storage_data(),
+            "deleted_entities": self.deleted_entities.as_storage_data(),
         }
 
     @callback
@@ -1410,13 +1698,11 @@ class EntityRegistry(BaseRegistry):
         growing without bound.
         """
         now_time = time.time()
-        for key, deleted_entity in list(self.deleted_entities.items()):
-            if (orphaned_timestamp := deleted_entity.orphaned_timestamp) is None:
-                continue
-
-            if orphaned_timestamp + ORPHANED_ENTITY_KEEP_SECONDS < now_time:
-                self.deleted_entities.pop(key)
-                self.async_schedule_save()
+        for key in self.deleted_entities.get_orphaned_keys(
+            now_time - ORPHANED_ENTITY_KEEP_SECONDS
+        ):
+            del self.deleted_entities[key]
+            self.async_schedule_save()
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
@@ -1606,12 +1892,13 @@ def _async_setup_entity_restore(hass: HomeAssistant, registry: EntityRegistry) -
     def _write_unavailable_states(_: Event) -> None:
         """Make sure state machine contains entry for each registered entity."""
         existing = set(hass.states.async_entity_ids())
+        entities = registry.entities
 
-        for entry in registry.entities.values():
-            if entry.entity_id in existing or entry.disabled:
+        for entity_id in entities.get_enabled_entity_ids():
+            if entity_id in existing:
                 continue
 
-            entry.write_unavailable_state(hass)
+            entities[entity_id].write_unavailable_state(hass)
 
     hass.bus.async_listen(EVENT_HOMEASSISTANT_START, _write_unavailable_states)
 
@@ -1165,7 +1165,16 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
+        # Aggregates of the states of a group of entities only
+        # need to be rendered when the group changes
+        aggregate_info = (
+            template.async_render_aggregate_to_info(
+                track_template_.variables, self._info[template]
+            )
+            if event
+            else None
+        )
+        self._info[template] = info = aggregate_info or template.async_render_to_info(
             track_template_.variables
         )
 
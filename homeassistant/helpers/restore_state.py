@@ -12,13 +12,13 @@ from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 from homeassistant.util.hass_dict import HassKey
-from homeassistant.util.json import json_loads
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, json_loads
 
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes
 from .singleton import singleton
 from .storage import Store
 
@@ -28,10 +28,16 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
+# The states that changed since all the states were last saved
+DELTA_STORAGE_KEY = "core.restore_state_delta"
 
-# How long between periodically saving the current states to disk
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between saving all the states to disk, which refreshes
+# when the states that did not change were last seen
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -81,6 +87,20 @@ class StoredState:
             "last_seen": self.last_seen,
         }
 
+    def fingerprint(self) -> int | None:
+        """Return a fingerprint of the state and extra data.
+
+        The fingerprint does not include when the state was last seen.
+        Returns None if the extra data cannot be serialized.
+        """
+        if self.extra_data is None:
+            return hash(self.state.as_dict_json)
+        try:
+            extra_data = json_bytes(self.extra_data.as_dict())
+        except JSON_ENCODE_EXCEPTIONS:
+            return None
+        return hash((self.state.as_dict_json, extra_data))
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Self:
         """Initialize a stored state from a dict."""
@@ -137,8 +157,16 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.delta_store = Store[list[dict[str, Any]]](
+            hass, STORAGE_VERSION, DELTA_STORAGE_KEY, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Fingerprints of the states that are saved to disk
+        self._saved_fingerprints: dict[str, int | None] = {}
+        # The states that changed since all the states were saved
+        self._delta: dict[str, dict[str, Any]] = {}
+        self._last_compacted: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -170,6 +198,24 @@ class RestoreStateData:
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
+        try:
+            delta_states = await self.delta_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading changed states", exc_info=exc)
+            delta_states = None
+
+        for item in delta_states or ():
+            if not valid_entity_id(entity_id := item["state"]["entity_id"]):
+                continue
+            stored_state = StoredState.from_dict(item)
+            # The changed states are only newer if they were saved after
+            # all the states, which may not be the case if saving all the
+            # states was interrupted before the changed states were removed
+            if (
+                last_state := self.last_states.get(entity_id)
+            ) is None or stored_state.last_seen >= last_state.last_seen:
+                self.last_states[entity_id] = stored_state
+
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
         """Get the set of states which should be stored.
@@ -217,15 +263,63 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+        self._saved_fingerprints = {
+            stored_state.state.entity_id: stored_state.fingerprint()
+            for stored_state in stored_states
+        }
+        self._last_compacted = dt_util.utcnow()
+        if not self._delta:
+            return
+        self._delta.clear()
+        try:
+            await self.delta_store.async_remove()
+        except OSError as exc:
+            _LOGGER.error("Error removing changed states", exc_info=exc)
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since they were last saved.
+
+        Only the changed states are written, all the states are
+        saved instead once a day or when most states have changed.
+        """
+        if (
+            self._last_compacted is None
+            or dt_util.utcnow() - self._last_compacted >= STATE_COMPACT_INTERVAL
+        ):
+            await self.async_dump_states()
+            return
+        _LOGGER.debug("Dumping changed states")
+        stored_states = self.async_get_stored_states()
+        saved_fingerprints = self._saved_fingerprints
+        changed = False
+        for stored_state in stored_states:
+            entity_id = stored_state.state.entity_id
+            fingerprint = stored_state.fingerprint()
+            if (
+                fingerprint is not None
+                and saved_fingerprints.get(entity_id) == fingerprint
+            ):
+                continue
+            saved_fingerprints[entity_id] = fingerprint
+            self._delta[entity_id] = stored_state.as_dict()
+            changed = True
+        if len(self._delta) * 2 > len(stored_states):
+            await self.async_dump_states()
+            return
+        if not changed:
+            return
+        try:
+            await self.delta_store.async_save(list(self._delta.values()))
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -241,17 +335,20 @@ class RestoreStateData:
             _async_dump_states(), "RestoreStateData dump"
         )
 
-        # Dump states periodically
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
+
+        # Dump changed states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_changed_states()
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -0,0 +1,228 @@
+"""Trace the setup of integrations during startup.
+
+When Home Assistant is started with --trace-startup, spans are recorded
+for importing integrations, processing requirements, waiting for
+dependencies, async_setup, async_setup_entry, platform forwarding and
+the time spent waiting on the executor. Once startup has wrapped up the
+spans are written to startup_trace.json in the Chrome trace event
+format, which can be opened in Perfetto or chrome://tracing, and the
+critical path through the dependency graph is logged.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Generator, Iterable
+import contextlib
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.hass_dict import HassKey
+
+from .json import json_bytes
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_TRACE: HassKey[StartupTrace] = HassKey("startup_trace")
+
+TRACE_FILE = "startup_trace.json"
+
+SPAN_COMPONENT = "component"
+SPAN_IMPORT = "import"
+SPAN_REQUIREMENTS = "requirements"
+SPAN_WAIT_DEPENDENCIES = "wait_dependencies"
+SPAN_FORWARD_ENTRY_SETUPS = "forward_entry_setups"
+
+_CRITICAL_PATH_TID = 0
+
+
+@dataclass(slots=True, frozen=True)
+class TraceSpan:
+    """A span of time spent setting up an integration."""
+
+    name: str
+    integration: str
+    group: str | None
+    start: float
+    end: float
+
+
+class StartupTrace:
+    """Record the spans of the integrations being set up."""
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self.started = time.monotonic()
+        self.finished = False
+        self.spans: list[TraceSpan] = []
+        self.dependencies: defaultdict[str, set[str]] = defaultdict(set)
+
+    def add_span(
+        self,
+        name: str,
+        integration: str,
+        group: str | None,
+        start: float,
+        end: float,
+    ) -> None:
+        """Add a span."""
+        if not self.finished:
+            self.spans.append(TraceSpan(name, integration, group, start, end))
+
+    def add_dependencies(self, integration: str, dependencies: Iterable[str]) -> None:
+        """Add the integrations an integration waited for before its setup."""
+        self.dependencies[integration].update(dependencies)
+
+    def critical_path(self) -> list[TraceSpan]:
+        """Return the component spans on the critical path.
+
+        The path starts at the integration which finished setting up last
+        and follows the dependency it waited for the longest, which is the
+        one that finished last, until an integration did not wait for any.
+        """
+        components = {
+            span.integration: span for span in self.spans if span.name == SPAN_COMPONENT
+        }
+        if not components:
+            return []
+        span = max(components.values(), key=lambda span: span.end)
+        path = [span]
+        seen = {span.integration}
+        while waited_for := [
+            components[dependency]
+            for dependency in self.dependencies.get(span.integration, ())
+            if dependency in components and dependency not in seen
+        ]:
+            span = max(waited_for, key=lambda span: span.end)
+            seen.add(span.integration)
+            path.append(span)
+        path.reverse()
+        return path
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format.
+
+        Each integration and group (config entry or platform) has its own
+        thread so the spans of a thread are always nested, the critical
+        path is added as the first thread.
+        """
+        started = self.started
+        tids: dict[tuple[str, str | None], int] = {}
+        events: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "args": {"name": "Home Assistant startup"},
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": _CRITICAL_PATH_TID,
+                "args": {"name": "critical path"},
+            },
+        ]
+        previous_end = started
+        for span in self.critical_path():
+            start = max(span.start, previous_end)
+            events.append(
+                {
+                    "name": span.integration,
+                    "cat": "critical_path",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": _CRITICAL_PATH_TID,
+                    "ts": (start - started) * 1e6,
+                    "dur": (span.end - start) * 1e6,
+                }
+            )
+            previous_end = span.end
+        for span in sorted(self.spans, key=lambda span: (span.start, -span.end)):
+            key = (span.integration, span.group)
+            if (tid := tids.get(key)) is None:
+                tid = tids[key] = len(tids) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {
+                            "name": span.integration
+                            if span.group is None
+                            else f"{span.integration} ({span.group})"
+                        },
+                    }
+                )
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.integration,
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": (span.start - started) * 1e6,
+                    "dur": (span.end - span.start) * 1e6,
+                    "args": {"integration": span.integration, "group": span.group},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+@callback
+def async_enable(hass: HomeAssistant) -> None:
+    """Start tracing the setup of integrations."""
+    hass.data[DATA_STARTUP_TRACE] = StartupTrace()
+
+
+@callback
+def async_get(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace if tracing is enabled and startup is not done."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is None or trace.finished:
+        return None
+    return trace
+
+
+@contextlib.contextmanager
+def async_trace(
+    hass: HomeAssistant, name: str, integration: str, group: str | None = None
+) -> Generator[None]:
+    """Record a span if tracing is enabled."""
+    if (trace := async_get(hass)) is None:
+        yield
+        return
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        trace.add_span(name, integration, group, started, time.monotonic())
+
+
+async def async_finish(hass: HomeAssistant) -> None:
+    """Stop tracing, write the trace file and log the critical path."""
+    if (trace := async_get(hass)) is None:
+        return
+    trace.finished = True
+    path = hass.config.path(TRACE_FILE)
+    try:
+        await hass.async_add_executor_job(
+            write_utf8_file, path, json_bytes(trace.as_chrome_trace()), False, "wb"
+        )
+    except WriteError as err:
+        _LOGGER.error("Error writing startup trace to %s: %s", path, err)
+        return
+    previous_end = trace.started
+    steps: list[str] = []
+    for span in trace.critical_path():
+        steps.append(
+            f"{span.integration} ({span.end - max(span.start, previous_end):.2f}s)"
+        )
+        previous_end = span.end
+    _LOGGER.info(
+        "Wrote startup trace to %s, critical path: %s", path, " -> ".join(steps)
+    )
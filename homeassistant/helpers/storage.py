@@ -9,9 +9,12 @@ from copy import deepcopy
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
+import marshal
 import os
 from pathlib import Path
+import struct
 from typing import Any
+import zlib
 
 from propcache import cached_property
 
@@ -32,7 +35,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -49,6 +52,73 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+BINARY_SUFFIX = ".bin"
+_BINARY_MAGIC = b"HASB"
+_BINARY_VERSION = 1
+# magic, format version, marshal version, JSON size, JSON mtime, crc32
+_BINARY_HEADER = struct.Struct("<4sBBQQI")
+
+
+def _write_binary(path: str, private: bool, atomic_writes: bool) -> None:
+    """Write a binary copy of a JSON storage file.
+
+    The copy holds the size and modification time of the JSON file it
+    was made from so it is ignored once the JSON file has been changed.
+    """
+    stat = os.stat(path)
+    payload = marshal.dumps(json_util.load_json(path))
+    header = _BINARY_HEADER.pack(
+        _BINARY_MAGIC,
+        _BINARY_VERSION,
+        marshal.version,
+        stat.st_size,
+        stat.st_mtime_ns,
+        zlib.crc32(payload),
+    )
+    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
+    method(f"{path}{BINARY_SUFFIX}", header + payload, private, mode="wb")
+
+
+def _load_binary(path: str | os.PathLike[str]) -> Any:
+    """Load the binary copy of a JSON storage file.
+
+    Returns None if there is no copy or it is stale or invalid.
+    """
+    try:
+        with open(f"{path}{BINARY_SUFFIX}", "rb") as fdesc:
+            raw = fdesc.read()
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if len(raw) < _BINARY_HEADER.size:
+        return None
+    magic, version, marshal_version, size, mtime_ns, crc = _BINARY_HEADER.unpack_from(
+        raw
+    )
+    payload = memoryview(raw)[_BINARY_HEADER.size :]
+    if (
+        magic != _BINARY_MAGIC
+        or version != _BINARY_VERSION
+        or marshal_version != marshal.version
+        or size != stat.st_size
+        or mtime_ns != stat.st_mtime_ns
+        or zlib.crc32(payload) != crc
+    ):
+        _LOGGER.debug("Ignoring stale binary copy of %s", path)
+        return None
+    try:
+        return marshal.loads(payload)
+    except (EOFError, TypeError, ValueError) as err:
+        _LOGGER.debug("Error loading binary copy of %s: %s", path, err)
+        return None
+
+
+def _load_binary_or_json(path: str | os.PathLike[str]) -> Any:
+    """Load a storage file from its binary copy or else from JSON."""
+    if (data := _load_binary(path)) is not None:
+        return data
+    return json_util.load_json(path)
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -213,11 +283,17 @@ class _StoreManager:
         """Cache the keys."""
         storage_path = self._storage_path
         data_preload = self._data_preload
+        files = self._files or set()
         for key in keys:
             storage_file: Path = storage_path.joinpath(key)
+            load = (
+                _load_binary_or_json
+                if f"{key}{BINARY_SUFFIX}" in files
+                else json_util.load_json
+            )
             try:
                 if storage_file.is_file():
-                    data_preload[key] = json_util.load_json(storage_file)
+                    data_preload[key] = load(storage_file)
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.debug("Error loading %s: %s", key, ex)
 
@@ -242,8 +318,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        binary: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If binary is set, a binary copy is written next to the JSON file
+        which is loaded instead of the JSON file while it is up to date.
+        The copy is built from the JSON file, so it is only written at the
+        final write when Home Assistant stops.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -257,6 +340,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._binary = binary
+        self._binary_stale = False
+        self._unsub_binary_final_write_listener: CALLBACK_TYPE | None = None
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
 
@@ -329,7 +415,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         else:
             try:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    _load_binary_or_json if self._binary else json_util.load_json,
+                    self.path,
                 )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
@@ -541,6 +628,37 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
+                return
+
+            if not self._binary:
+                return
+            self._binary_stale = True
+            if self.hass.state is CoreState.final_write:
+                await self.hass.async_add_executor_job(self._write_binary_copy)
+                self._binary_stale = False
+            elif self._unsub_binary_final_write_listener is None:
+                self._unsub_binary_final_write_listener = (
+                    self.hass.bus.async_listen_once(
+                        EVENT_HOMEASSISTANT_FINAL_WRITE,
+                        self._async_callback_binary_final_write,
+                    )
+                )
+
+    async def _async_callback_binary_final_write(self, _event: Event) -> None:
+        """Write the binary copy because Home Assistant is in final write state."""
+        self._unsub_binary_final_write_listener = None
+        async with self._write_lock:
+            if self._binary_stale:
+                await self.hass.async_add_executor_job(self._write_binary_copy)
+                self._binary_stale = False
+
+    def _write_binary_copy(self) -> None:
+        """Write the binary copy of the JSON file."""
+        try:
+            _write_binary(self.path, self._private, self._atomic_writes)
+        except (HomeAssistantError, OSError, ValueError) as err:
+            # The JSON file is still loaded if the binary copy is stale
+            _LOGGER.warning("Error writing binary copy for %s: %s", self.key, err)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
@@ -570,6 +688,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._manager.async_invalidate(self.key)
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        if self._unsub_binary_final_write_listener is not None:
+            self._unsub_binary_final_write_listener()
+            self._unsub_binary_final_write_listener = None
+        self._binary_stale = False
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._binary:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{BINARY_SUFFIX}"
+                )
@@ -9,13 +9,17 @@ import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
+import os
 import pathlib
 import random
 import re
@@ -29,7 +33,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -44,14 +48,18 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -69,6 +77,7 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -85,8 +94,9 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .translation import async_translate_state
-from .typing import TemplateVarsType
+from .typing import UNDEFINED, TemplateVarsType, UndefinedType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -102,6 +112,11 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_FILE = "template_bytecode_cache"
+BYTECODE_CACHE_MAX_ENTRIES = 8192
+BYTECODE_CACHE_MAX_SIZE = 32 * 1024 * 1024  # 32MiB
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -490,6 +505,341 @@ class RenderInfo:
             self.filter = _false
 
 
+_AGGREGATE_SOURCE_FUNCTIONS = {"area_entities", "label_entities"}
+_AGGREGATE_GLOBALS = {"states", "expand", *_AGGREGATE_SOURCE_FUNCTIONS}
+_AGGREGATE_FILTERS = {"average", "max", "min", "sum"}
+_AGGREGATE_CONVERT_FILTERS = {"float", "int"}
+
+
+def _const_args(node: nodes.Filter) -> tuple[list[Any], dict[str, Any]] | None:
+    """Return the arguments of a filter if they are all constants."""
+    if node.dyn_args is not None or node.dyn_kwargs is not None:
+        return None
+    args: list[Any] = []
+    kwargs: dict[str, Any] = {}
+    for arg in node.args:
+        if not isinstance(arg, nodes.Const):
+            return None
+        args.append(arg.value)
+    for kwarg in cast(list[nodes.Keyword], node.kwargs):
+        if not isinstance(kwarg.value, nodes.Const):
+            return None
+        kwargs[kwarg.key] = kwarg.value.value
+    return args, kwargs
+
+
+def _strip_list_filters(node: nodes.Expr) -> nodes.Expr:
+    """Return the node below any list filters, which don't change the values."""
+    while (
+        isinstance(node, nodes.Filter)
+        and node.name == "list"
+        and node.node is not None
+        and _const_args(node) == ([], {})
+    ):
+        node = node.node
+    return node
+
+
+def _const_entity_ids(node: nodes.Expr) -> list[str] | None:
+    """Return the entity_ids of a constant string or list of strings."""
+    if isinstance(node, nodes.Const) and isinstance(node.value, str):
+        return [node.value]
+    if isinstance(node, (nodes.List, nodes.Tuple)) and all(
+        isinstance(item, nodes.Const) and isinstance(item.value, str)
+        for item in node.items
+    ):
+        return [item.value for item in node.items]  # type: ignore[attr-defined]
+    return None
+
+
+class _AggregateTemplate:
+    """A template which aggregates the states of a group of entities.
+
+    Recognised templates are a single expression such as
+    {{ expand('group.power') | map(attribute='state') | map('float', 0) | sum }}
+    and are evaluated without rendering them. The group is one of
+    states.<domain>, expand, area_entities, label_entities or a list of
+    entity_ids, the aggregate is one of sum, min, max or average and it
+    can be rounded.
+
+    The converted value of every entity is kept so a state change only
+    converts the state of the entity that changed.
+    """
+
+    __slots__ = (
+        "_source",
+        "_source_args",
+        "_convert",
+        "_convert_args",
+        "_aggregate",
+        "_aggregate_args",
+        "_round_args",
+        "_values",
+    )
+
+    def __init__(
+        self,
+        source: str,
+        source_args: list[str],
+        convert_filter: Callable[..., Any],
+        convert_args: tuple[list[Any], dict[str, Any]],
+        aggregate: str,
+        aggregate_args: tuple[list[Any], dict[str, Any]],
+        round_args: tuple[list[Any], dict[str, Any]] | None,
+    ) -> None:
+        """Initialize the aggregate template."""
+        self._source = source
+        self._source_args = source_args
+        self._convert = convert_filter
+        self._convert_args = convert_args
+        self._aggregate = aggregate
+        self._aggregate_args = aggregate_args
+        self._round_args = round_args
+        self._values: dict[str, tuple[str, Any]] = {}
+
+    @classmethod
+    def parse(cls, env: TemplateEnvironment, source: str) -> _AggregateTemplate | None:
+        """Return an aggregate template if the template is recognised."""
+        try:
+            body = env.parse(source).body
+        except jinja2.TemplateError:
+            return None
+        if (
+            len(body) != 1
+            or not isinstance(body[0], nodes.Output)
+            or len(body[0].nodes) != 1
+        ):
+            return None
+        node = body[0].nodes[0]
+
+        round_args = None
+        if isinstance(node, nodes.Filter) and node.name == "round":
+            if (round_args := _const_args(node)) is None or node.node is None:
+                return None
+            node = node.node
+
+        if (
+            not isinstance(node, nodes.Filter)
+            or node.name not in _AGGREGATE_FILTERS
+            or node.node is None
+            or (aggregate_args := _const_args(node)) is None
+            or (node.name != "average" and aggregate_args != ([], {}))
+        ):
+            return None
+        aggregate = node.name
+        node = _strip_list_filters(node.node)
+
+        # map('float', 0)
+        if (
+            not isinstance(node, nodes.Filter)
+            or node.name != "map"
+            or node.node is None
+            or (convert_args := _const_args(node)) is None
+            or not convert_args[0]
+            or convert_args[0][0] not in _AGGREGATE_CONVERT_FILTERS
+        ):
+            return None
+        convert_filter = env.filters[convert_args[0][0]]
+        convert_args = (convert_args[0][1:], convert_args[1])
+        node = _strip_list_filters(node.node)
+
+        # map('states') or map(attribute='state')
+        if (
+            not isinstance(node, nodes.Filter)
+            or node.name != "map"
+            or node.node is None
+            or (map_args := _const_args(node)) is None
+        ):
+            return None
+        group = _strip_list_filters(node.node)
+
+        if map_args == (["states"], {}):
+            # area_entities('kitchen'), 'kitchen' | area_entities or a list
+            if isinstance(group, nodes.Call):
+                if (
+                    not isinstance(group.node, nodes.Name)
+                    or group.node.name not in _AGGREGATE_SOURCE_FUNCTIONS
+                    or group.kwargs
+                    or group.dyn_args is not None
+                    or group.dyn_kwargs is not None
+                    or len(group.args) != 1
+                    or (source_args := _const_entity_ids(group.args[0])) is None
+                    or len(source_args) != 1
+                ):
+                    return None
+                return cls(
+                    group.node.name,
+                    source_args,
+                    convert_filter,
+                    convert_args,
+                    aggregate,
+                    aggregate_args,
+                    round_args,
+                )
+            if isinstance(group, nodes.Filter):
+                if (
+                    group.name not in _AGGREGATE_SOURCE_FUNCTIONS
+                    or group.node is None
+                    or _const_args(group) != ([], {})
+                    or (source_args := _const_entity_ids(group.node)) is None
+                    or len(source_args) != 1
+                ):
+                    return None
+                return cls(
+                    group.name,
+                    source_args,
+                    convert_filter,
+                    convert_args,
+                    aggregate,
+                    aggregate_args,
+                    round_args,
+                )
+            if (source_args := _const_entity_ids(group)) is None:
+                return None
+            return cls(
+                "entity_ids",
+                source_args,
+                convert_filter,
+                convert_args,
+                aggregate,
+                aggregate_args,
+                round_args,
+            )
+
+        if map_args != ([], {"attribute": "state"}):
+            return None
+        # states.sensor
+        if (
+            isinstance(group, nodes.Getattr)
+            and isinstance(group.node, nodes.Name)
+            and group.node.name == "states"
+            and valid_domain(group.attr)
+        ):
+            return cls(
+                "domain",
+                [group.attr],
+                convert_filter,
+                convert_args,
+                aggregate,
+                aggregate_args,
+                round_args,
+            )
+        # expand('group.power') or 'group.power' | expand
+        if (
+            isinstance(group, nodes.Call)
+            and isinstance(group.node, nodes.Name)
+            and group.node.name == "expand"
+            and not group.kwargs
+            and group.dyn_args is None
+            and group.dyn_kwargs is None
+            and all(_const_entity_ids(arg) is not None for arg in group.args)
+        ):
+            source_args = [
+                entity_id
+                for arg in group.args
+                for entity_id in cast(list[str], _const_entity_ids(arg))
+            ]
+        elif (
+            isinstance(group, nodes.Filter)
+            and group.name == "expand"
+            and group.node is not None
+            and _const_args(group) == ([], {})
+            and (source_args := _const_entity_ids(group.node)) is not None
+        ):
+            pass
+        else:
+            return None
+        return cls(
+            "expand",
+            source_args,
+            convert_filter,
+            convert_args,
+            aggregate,
+            aggregate_args,
+            round_args,
+        )
+
+    def _async_members(self, hass: HomeAssistant) -> list[tuple[str, str]]:
+        """Return the entity_ids and states of the group in template order."""
+        if self._source == "domain":
+            return [
+                (state.entity_id, state.state)
+                for state in hass.states.async_all(self._source_args[0])
+            ]
+        if self._source == "expand":
+            return [
+                (state.entity_id, state.state)
+                for state in expand(hass, *self._source_args)
+            ]
+        if self._source == "area_entities":
+            entity_ids = area_entities(hass, self._source_args[0])
+        elif self._source == "label_entities":
+            entity_ids = label_entities(hass, self._source_args[0])
+        else:
+            entity_ids = self._source_args
+        return [
+            (
+                entity_id,
+                state.state if (state := hass.states.get(entity_id)) else STATE_UNKNOWN,
+            )
+            for entity_id in entity_ids
+        ]
+
+    def async_evaluate(
+        self, hass: HomeAssistant, tracked_entities: collections.abc.Set[str]
+    ) -> str | None:
+        """Return the output of the template.
+
+        Returns None if the template needs to be rendered, which is the
+        case when it would fail or when entities of the group are not
+        tracked by the last render.
+        """
+        members = self._async_members(hass)
+        if self._source != "domain" and not all(
+            entity_id in tracked_entities for entity_id, _ in members
+        ):
+            return None
+        if not members:
+            # min and max render an undefined value for an empty group
+            return None
+
+        cached_values = self._values
+        self._values = {}
+        converted: list[Any] = []
+        convert_args, convert_kwargs = self._convert_args
+        try:
+            for entity_id, state in members:
+                if (cached := cached_values.get(entity_id)) is None or (
+                    cached[0] != state
+                ):
+                    cached = (
+                        state,
+                        self._convert(state, *convert_args, **convert_kwargs),
+                    )
+                self._values[entity_id] = cached
+                converted.append(cached[1])
+
+            result: Any
+            if self._aggregate == "sum":
+                result = sum(converted)
+            elif self._aggregate == "min":
+                result = min(converted)
+            elif self._aggregate == "max":
+                result = max(converted)
+            else:
+                result = average(
+                    converted, *self._aggregate_args[0], **self._aggregate_args[1]
+                )
+            if self._round_args is not None:
+                result = forgiving_round(  # type: ignore[no-untyped-call]
+                    result, *self._round_args[0], **self._round_args[1]
+                )
+        except Exception:  # noqa: BLE001
+            # The render will fail as well and report the error
+            return None
+        return str(result)
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -506,6 +856,7 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_aggregate",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -540,6 +891,7 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._aggregate: _AggregateTemplate | None | UndefinedType = UNDEFINED
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -758,6 +1110,39 @@ class Template:
         render_info._freeze()  # noqa: SLF001
         return render_info
 
+    def async_render_aggregate_to_info(
+        self, variables: TemplateVarsType, last_info: RenderInfo
+    ) -> RenderInfo | None:
+        """Evaluate an aggregate template without rendering it.
+
+        Returns None if the template is not an aggregate of the states
+        of a group of entities or if it needs to be rendered, otherwise
+        the render info of the last render with the new result.
+        """
+        if self.is_static or self.hass is None or last_info.exception is not None:
+            return None
+        if variables and not _AGGREGATE_GLOBALS.isdisjoint(variables):
+            return None
+        if self._aggregate is UNDEFINED:
+            self._aggregate = _AggregateTemplate.parse(self._env, self.template)
+        if self._aggregate is None:
+            return None
+        if (
+            render_result := self._aggregate.async_evaluate(
+                self.hass, last_info.entities
+            )
+        ) is None:
+            return None
+
+        self._renders += 1
+        render_info = copy(last_info)
+        render_result = render_result.strip()
+        if self.hass.config.legacy_templates:
+            render_info._result = render_result  # noqa: SLF001
+        else:
+            render_info._result = self._parse_result(render_result)  # noqa: SLF001
+        return render_info
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -780,10 +1165,14 @@ class Template:
         error_value: Any = _SENTINEL,
         variables: dict[str, Any] | None = None,
         parse_result: bool = False,
+        value_json: Any = _SENTINEL,
+        parse_value_json: bool = True,
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too. Callers which already
+        parsed the value can pass it as value_json, or set parse_value_json
+        to False if it is not valid JSON, to avoid parsing it again.
 
         This method must be run in the event loop.
         """
@@ -797,10 +1186,13 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:  # noqa: SIM105 - suppress is much slower
-            variables["value_json"] = json_loads(value)
-        except JSON_DECODE_EXCEPTIONS:
-            pass
+        if value_json is not _SENTINEL:
+            variables["value_json"] = value_json
+        elif parse_value_json:
+            try:  # noqa: SIM105 - suppress is much slower
+                variables["value_json"] = json_loads(value)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
 
         try:
             render_result = _render_with_context(
@@ -2787,6 +3179,107 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+class TemplateBytecodeCache:
+    """Cache of compiled template code that is persisted across restarts.
+
+    Compiled code is stored by the hash of the template source and the
+    environment that compiled it. The whole cache is discarded when Home
+    Assistant, Jinja or Python is upgraded since the code they generate
+    may change.
+    """
+
+    def __init__(self, path: str, entries: Iterable[tuple[bytes, bytes]]) -> None:
+        """Initialize the cache with entries ordered from least recently used."""
+        self.path = path
+        self._entries: LRU[bytes, bytes] = LRU(BYTECODE_CACHE_MAX_ENTRIES)
+        for key, data in entries:
+            self._entries[key] = data
+        self.dirty = False
+
+    @staticmethod
+    def key(environment: str, source: str) -> bytes:
+        """Return the key for a template source compiled by an environment."""
+        return hashlib.sha256(f"{environment}\0{source}".encode()).digest()
+
+    def get(self, key: bytes) -> CodeType | None:
+        """Return cached compiled code."""
+        if (data := self._entries.get(key)) is None:
+            return None
+        try:
+            return cast(CodeType, marshal.loads(data))
+        except (EOFError, TypeError, ValueError):
+            del self._entries[key]
+            return None
+
+    def set(self, key: bytes, code: CodeType) -> None:
+        """Cache compiled code."""
+        self._entries[key] = marshal.dumps(code)
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the most recently used entries to disk.
+
+        This method does I/O and must be run in the executor.
+        """
+        self.dirty = False
+        entries: list[tuple[bytes, bytes]] = []
+        size = 0
+        for key, data in self._entries.items():
+            if (size := size + len(key) + len(data)) > BYTECODE_CACHE_MAX_SIZE:
+                break
+            entries.append((key, data))
+        entries.reverse()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            write_utf8_file_atomic(
+                self.path,
+                marshal.dumps((_bytecode_cache_version(), entries)),
+                mode="wb",
+            )
+        except WriteError as err:
+            _LOGGER.warning("Error writing template bytecode cache: %s", err)
+
+
+def _bytecode_cache_version() -> tuple[str, str, bytes]:
+    """Return the versions the cached bytecode is valid for."""
+    return (__version__, jinja2.__version__, MAGIC_NUMBER)
+
+
+def _load_bytecode_cache(path: str) -> TemplateBytecodeCache:
+    """Load the template bytecode cache from disk."""
+    try:
+        with open(path, "rb") as cache_file:
+            cache_version, entries = marshal.load(cache_file)
+    except FileNotFoundError:
+        return TemplateBytecodeCache(path, ())
+    except (EOFError, OSError, TypeError, ValueError) as err:
+        _LOGGER.warning("Discarding invalid template bytecode cache: %s", err)
+        return TemplateBytecodeCache(path, ())
+    if cache_version != _bytecode_cache_version():
+        _LOGGER.debug("Discarding template bytecode cache of version %s", cache_version)
+        return TemplateBytecodeCache(path, ())
+    return TemplateBytecodeCache(path, entries)
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the template bytecode cache and save it when it changes.
+
+    The cache is saved once Home Assistant has started, since most
+    templates are compiled during startup, and when it is stopped.
+    """
+    bytecode_cache = await hass.async_add_executor_job(
+        _load_bytecode_cache, hass.config.path(STORAGE_DIR, BYTECODE_CACHE_FILE)
+    )
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+    async def _async_save(_: Event) -> None:
+        if bytecode_cache.dirty:
+            await hass.async_add_executor_job(bytecode_cache.save)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save)
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2854,6 +3347,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # The available filters and tests change the compiled code
+        self.bytecode_cache_environment = (
+            "limited" if limited else "strict" if strict else "default"
+        )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3209,7 +3706,18 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        compiled: CodeType | None = None
+        if (
+            self.hass is not None
+            and isinstance(source, str)
+            and (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is not None
+        ):
+            key = bytecode_cache.key(self.bytecode_cache_environment, source)
+            if (compiled := bytecode_cache.get(key)) is None:
+                compiled = super().compile(source)
+                bytecode_cache.set(key, compiled)
+        if compiled is None:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
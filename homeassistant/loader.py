@@ -7,7 +7,8 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
@@ -132,6 +133,9 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_IMPORT_PREFETCH: HassKey[dict[str, Future[None]]] = HassKey("import_prefetch")
+# Imports hold the GIL, more threads would only slow down the event loop
+MAX_IMPORT_PREFETCH_WORKERS = 2
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -270,6 +274,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_PREFETCH] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -769,6 +774,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_prefetch = hass.data[DATA_IMPORT_PREFETCH]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -986,6 +992,9 @@ class Integration:
         if self._component_future:
             return await self._component_future
 
+        if self._import_prefetch:
+            await self._async_wait_for_prefetch()
+
         if debug := _LOGGER.isEnabledFor(logging.DEBUG):
             start = time.perf_counter()
 
@@ -1108,6 +1117,9 @@ class Integration:
         self, platform_names: Iterable[Platform | str]
     ) -> dict[str, ModuleType]:
         """Return a platforms for an integration."""
+        if self._import_prefetch:
+            await self._async_wait_for_prefetch()
+
         domain = self.domain
         platforms: dict[str, ModuleType] = {}
 
@@ -1200,6 +1212,20 @@ class Integration:
 
         return platforms
 
+    async def _async_wait_for_prefetch(self) -> None:
+        """Wait for the imports of the integration if they are being prefetched.
+
+        A prefetch that has not started yet is cancelled, otherwise the
+        event loop could block on the import lock of a module which is
+        being imported in a prefetch thread. The prefetches of the
+        dependencies are waited for as well since the integration
+        imports their modules.
+        """
+        prefetch = self._import_prefetch
+        for domain in (self.domain, *(self._all_dependencies or ())):
+            if (future := prefetch.get(domain)) is not None and not future.cancel():
+                await asyncio.wrap_future(future)
+
     def _get_platform_cached_or_raise(self, platform_name: str) -> ModuleType | None:
         """Return a platform for an integration from cache."""
         full_name = f"{self.domain}.{platform_name}"
@@ -1360,6 +1386,104 @@ async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration
     raise int_or_exc
 
 
+@callback
+def async_get_import_graph(hass: HomeAssistant) -> dict[str, list[str]]:
+    """Return the platforms imported for each imported integration."""
+    graph: dict[str, list[str]] = {}
+    platforms: list[tuple[str, str]] = []
+    for name in hass.data[DATA_COMPONENTS]:
+        domain, _, platform_name = name.partition(".")
+        if platform_name:
+            platforms.append((domain, platform_name))
+        else:
+            graph[domain] = []
+    for domain, platform_name in platforms:
+        if domain in graph:
+            graph[domain].append(platform_name)
+    return graph
+
+
+def _prefetch_imports(pkg_path: str, platform_names: Iterable[str]) -> None:
+    """Import an integration and its platforms."""
+    try:
+        importlib.import_module(pkg_path)
+        for platform_name in platform_names:
+            importlib.import_module(f"{pkg_path}.{platform_name}")
+    except Exception as ex:  # noqa: BLE001
+        # The error will be raised again when the integration or
+        # platform is imported for its setup.
+        _LOGGER.debug("Error prefetching imports of %s: %s", pkg_path, ex)
+
+
+async def async_prefetch_imports(
+    hass: HomeAssistant,
+    integrations: Iterable[Integration],
+    import_graph: Mapping[str, Iterable[str]],
+) -> None:
+    """Import integrations and their platforms concurrently ahead of their setup.
+
+    Only the integrations in the import graph, which holds the platforms
+    each integration imported on the previous start, are imported. They
+    are imported in dependency order since an integration always has
+    more dependencies than each of its dependencies.
+
+    The modules of the dependencies are imported along with an integration,
+    so integrations which are, or depend on, an integration that must be
+    imported in the event loop are not prefetched.
+    """
+    integrations_by_domain = {
+        integration.domain: integration for integration in integrations
+    }
+    dependencies: dict[str, set[str]] = {}
+    for domain, integration in integrations_by_domain.items():
+        if (
+            domain not in import_graph
+            or integration.pkg_path in sys.modules
+            or not integration.all_dependencies_resolved
+        ):
+            continue
+        try:
+            all_dependencies = integration.all_dependencies
+        except RuntimeError:
+            # The dependencies could not be resolved
+            continue
+        if all(
+            (dependency := integrations_by_domain.get(dependency_domain)) is not None
+            and dependency.import_executor
+            for dependency_domain in (domain, *all_dependencies)
+        ):
+            dependencies[domain] = all_dependencies
+    if not dependencies:
+        return
+    to_prefetch = sorted(
+        (integrations_by_domain[domain] for domain in dependencies),
+        key=lambda integration: len(dependencies[integration.domain]),
+    )
+    prefetch = hass.data[DATA_IMPORT_PREFETCH]
+    executor = ThreadPoolExecutor(
+        MAX_IMPORT_PREFETCH_WORKERS, thread_name_prefix="ImportPrefetch"
+    )
+    try:
+        for integration in to_prefetch:
+            prefetch[integration.domain] = executor.submit(
+                _prefetch_imports,
+                integration.pkg_path,
+                integration.platforms_exists(import_graph[integration.domain]),
+            )
+        await asyncio.gather(
+            *(
+                asyncio.wrap_future(future)
+                for future in prefetch.values()
+                if not future.cancelled()
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        prefetch.clear()
+        executor.shutdown(wait=False, cancel_futures=True)
+    _LOGGER.debug("Prefetched imports of %s", [itg.domain for itg in to_prefetch])
+
+
 async def async_get_integrations(
     hass: HomeAssistant, domains: Iterable[str]
 ) -> dict[str, Integration | Exception]:
@@ -7,16 +7,22 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant import core, loader
+from homeassistant.config_entries import ConfigEntries
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, EVENT_STATE_CHANGED
+from homeassistant.helpers import storage
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.setup import async_setup_component
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -116,6 +122,58 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_state_changed_mixed_listeners(hass):
+    """Fire 10k state changed events with plain, filtered and batched listeners."""
+    count = 0
+    batched_count = 0
+    batches = 0
+    events_to_fire = 10**4
+    entity_id = "sensor.power"
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    @core.callback
+    def event_filter(event_data):
+        """Filter event."""
+        return event_data["entity_id"] == entity_id
+
+    @core.callback
+    def batched_listener(events):
+        """Handle a batch of events."""
+        nonlocal batched_count, batches
+        batched_count += len(events)
+        batches += 1
+
+    for _ in range(10):
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter=event_filter)
+        hass.bus.async_listen_batched(EVENT_STATE_CHANGED, batched_listener)
+
+    event_data = {
+        "entity_id": entity_id,
+        "old_state": core.State(entity_id, "1"),
+        "new_state": core.State(entity_id, "2"),
+    }
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire * 20
+    assert batched_count == events_to_fire * 10
+    assert batches == 10
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +366,250 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def recorder_state_changes(hass):
+    """Record 10k state changes of 1000 entities with changing attributes.
+
+    A temporary SQLite database is used unless the BENCHMARK_DB_URL
+    environment variable is set, which allows comparing dialects.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import recorder as recorder_helper
+
+    rows = 10**4
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        hass.config_entries = ConfigEntries(hass, {})
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        db_url = os.environ.get("BENCHMARK_DB_URL", f"sqlite:///{tmp_dir}/bench.db")
+        assert await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": db_url}}
+        )
+        await hass.async_start()
+        assert await recorder_helper.async_wait_recorder(hass)
+        instance = recorder_helper.get_instance(hass)
+        await instance.async_block_till_done()
+
+        start = timer()
+
+        for idx in range(rows):
+            hass.states.async_set(
+                f"sensor.power_{idx % 1000}", str(idx), {"counter": idx}
+            )
+        await instance.async_block_till_done()
+
+        runtime = timer() - start
+        print(f"Recorded {rows / runtime:.0f} rows/s with {instance.dialect_name}")
+        # Shut down the recorder before its database is removed
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def template_compile(hass):
+    """Compile 4000 templates with a cold and a warm bytecode cache.
+
+    The warm run loads the bytecode cache saved by the cold run,
+    as happens when Home Assistant is restarted.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    count = 4000
+    sources = [
+        f"{{% if states('sensor.test_{idx}') | float(0) > {idx} %}}"
+        f"{{{{ state_attr('sensor.test_{idx}', 'friendly_name') }}}}"
+        f"{{% else %}}{{{{ (states('sensor.test_{idx}') | float(0) * 1.8 + 32)"
+        " | round(1) }}{% endif %}"
+        for idx in range(count)
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        runtimes = []
+        for run_name in ("cold", "warm"):
+            await template.async_load_bytecode_cache(hass)
+            env = template.TemplateEnvironment(hass)
+            start = timer()
+            for source in sources:
+                env.compile(source)
+            runtimes.append(timer() - start)
+            print(f"Compiled {count} templates with a {run_name} cache")
+            # Save the bytecode cache like Home Assistant does when stopping
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+            await hass.async_block_till_done()
+        print(f"Cold cache: {runtimes[0]:.3f}s, warm cache: {runtimes[1]:.3f}s")
+        return runtimes[1]
+
+
+@benchmark
+async def storage_registry_load(hass):
+    """Save and load a 50k entry registry as JSON and with a binary copy.
+
+    The registries are loaded on the critical path of startup so the
+    load time and the peak memory while loading are what matter most.
+    """
+    count = 50000
+    entities = [
+        {
+            "aliases": [],
+            "area_id": None,
+            "capabilities": {"state_class": "measurement"},
+            "config_entry_id": f"{idx // 100:026x}",
+            "created_at": "2024-10-01T12:00:00.000000+00:00",
+            "device_class": None,
+            "device_id": f"{idx // 5:032x}",
+            "disabled_by": None,
+            "entity_category": None,
+            "entity_id": f"sensor.benchmark_{idx}",
+            "hidden_by": None,
+            "icon": None,
+            "id": f"{idx:032x}",
+            "labels": [],
+            "modified_at": "2024-10-01T12:00:00.000000+00:00",
+            "name": None,
+            "options": {"sensor": {"suggested_display_precision": 1}},
+            "original_device_class": "temperature",
+            "original_icon": None,
+            "original_name": f"Benchmark {idx}",
+            "platform": "benchmark",
+            "supported_features": 0,
+            "translation_key": None,
+            "unique_id": f"benchmark-{idx}",
+            "unit_of_measurement": "°C",
+        }
+        for idx in range(count)
+    ]
+    data = {"entities": entities, "deleted_entities": []}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        for binary in (False, True):
+            key = f"benchmark.{'binary' if binary else 'json'}"
+            store = storage.Store(hass, 1, key, atomic_writes=True, binary=binary)
+            start = timer()
+            await store.async_save(data)
+            save_time = timer() - start
+            # The binary copy is written at the final write
+            start = timer()
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+            await hass.async_block_till_done()
+            final_write_time = timer() - start
+
+            store = storage.Store(hass, 1, key, binary=binary)
+            start = timer()
+            assert await store.async_load() == data
+            load_time = timer() - start
+
+            # Tracing slows down the allocations so it is done separately
+            tracemalloc.start()
+            await store.async_load()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"{'Binary' if binary else 'JSON'}: saved {count} entries in "
+                f"{save_time:.3f}s, final write in {final_write_time:.3f}s, loaded "
+                f"in {load_time:.3f}s with a peak of {peak / 1024**2:.1f} MiB"
+            )
+    return load_time
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match MQTT messages against 10k mixed subscriptions.
+
+    Like the MQTT client, the subscriptions without wildcards are looked up
+    by topic and the ones with wildcards are matched with a topic trie.
+    """
+    # pylint: disable-next=import-outside-toplevel,hass-component-root-import
+    from homeassistant.components.mqtt.util import TopicTrie
+
+    devices = 2500
+    simple_subscriptions: dict[str, set[str]] = {}
+    wildcard_subscriptions: TopicTrie[str] = TopicTrie()
+    for idx in range(devices):
+        for topic in (
+            f"zigbee2mqtt/device_{idx}",
+            f"zigbee2mqtt/device_{idx}/availability",
+            f"tele/tasmota_{idx}/STATE",
+        ):
+            simple_subscriptions.setdefault(topic, set()).add(topic)
+        wildcard_subscriptions.add(f"stat/tasmota_{idx}/+", f"stat/tasmota_{idx}/+")
+    for topic_filter in ("homeassistant/#", "zigbee2mqtt/+/availability", "tele/#"):
+        wildcard_subscriptions.add(topic_filter, topic_filter)
+    topics = [
+        topic
+        for idx in range(devices)
+        for topic in (
+            f"zigbee2mqtt/device_{idx}",
+            f"stat/tasmota_{idx}/POWER",
+            f"homeassistant/sensor/device_{idx}/config",
+            f"unknown/device_{idx}/state",
+        )
+    ]
+    count = 10**6
+    matched = 0
+
+    start = timer()
+    for idx in range(count):
+        topic = topics[idx % len(topics)]
+        subscriptions = wildcard_subscriptions.match(topic)
+        if topic in simple_subscriptions:
+            subscriptions = [*simple_subscriptions[topic], *subscriptions]
+        matched += len(subscriptions)
+    runtime = timer() - start
+    print(f"Matched {count / runtime:.0f} messages/s, {matched} subscriptions")
+    return runtime
+
+
+@benchmark
+async def bluetooth_match_domains(hass):
+    """Match changed advertisements of 400 beacons against the integrations.
+
+    The advertisements which did not change are dropped before they are
+    matched, so every advertisement here has new data.
+    """
+    # pylint: disable=import-outside-toplevel
+    from bleak.backends.device import BLEDevice
+
+    from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+    from homeassistant.components.bluetooth.match import IntegrationMatcher
+    from homeassistant.generated.bluetooth import BLUETOOTH
+
+    matcher = IntegrationMatcher(list(BLUETOOTH))
+    matcher.async_setup()
+    devices = [
+        BLEDevice(f"AA:BB:CC:DD:{idx // 256:02X}:{idx % 256:02X}", None, {}, -60)
+        for idx in range(400)
+    ]
+    count = 500
+    service_infos = [
+        BluetoothServiceInfoBleak(
+            name=f"beacon{idx}",
+            address=device.address,
+            rssi=-60,
+            manufacturer_data={76: bytes((2, 21, *bytes(20), seq % 256))}
+            if idx % 2
+            else {89: bytes((seq % 256, 1, 2, 3))},
+            service_data={"0000feaa-0000-1000-8000-00805f9b34fb": bytes((seq % 256,))}
+            if idx % 3 == 0
+            else {},
+            service_uuids=[],
+            source="local",
+            device=device,
+            advertisement=None,
+            connectable=False,
+            time=0,
+            tx_power=None,
+        )
+        for seq in range(count)
+        for idx, device in enumerate(devices)
+    ]
+
+    start = timer()
+    for service_info in service_infos:
+        matcher.match_domains(service_info)
+    runtime = timer() - start
+    print(f"Matched {len(service_infos) / runtime:.0f} advertisements/s")
+    return runtime
@@ -29,7 +29,7 @@ from .core import (
     callback,
 )
 from .exceptions import DependencyError, HomeAssistantError
-from .helpers import issue_registry as ir, singleton, translation
+from .helpers import issue_registry as ir, singleton, startup_trace, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
@@ -162,7 +162,8 @@ async def async_setup_component(
     setup_futures[domain] = setup_future
 
     try:
-        result = await _async_setup_component(hass, domain, config)
+        with startup_trace.async_trace(hass, startup_trace.SPAN_COMPONENT, domain):
+            result = await _async_setup_component(hass, domain, config)
         setup_future.set_result(result)
         if setup_done_future := setup_done_futures.pop(domain, None):
             setup_done_future.set_result(result)
@@ -233,10 +234,17 @@ async def _async_process_dependencies(
             after_dependencies_tasks.keys(),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
+    if trace := startup_trace.async_get(hass):
+        trace.add_dependencies(
+            integration.domain, [*dependencies_tasks, *after_dependencies_tasks]
         )
+    with startup_trace.async_trace(
+        hass, startup_trace.SPAN_WAIT_DEPENDENCIES, integration.domain
+    ):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -331,7 +339,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with startup_trace.async_trace(hass, startup_trace.SPAN_IMPORT, domain):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -571,10 +580,13 @@ async def async_process_deps_reqs(
     if failed_deps := await _async_process_dependencies(hass, config, integration):
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with startup_trace.async_trace(
+        hass, startup_trace.SPAN_REQUIREMENTS, integration.domain
+    ):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -709,8 +721,11 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
     try:
         yield
     finally:
-        time_taken = time.monotonic() - started
+        finished = time.monotonic()
+        time_taken = finished - started
         integration, group = running
+        if trace := startup_trace.async_get(hass):
+            trace.add_span(phase, integration, group, started, finished)
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
         _LOGGER.debug(
@@ -770,8 +785,11 @@ def async_start_setup(
     try:
         yield
     finally:
-        time_taken = time.monotonic() - started
+        finished = time.monotonic()
+        time_taken = finished - started
         del setup_started[current]
+        if trace := startup_trace.async_get(hass):
+            trace.add_span(phase, integration, group, started, finished)
         group_setup_times = _setup_times(hass)[integration][group]
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
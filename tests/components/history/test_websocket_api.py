@@ -403,6 +403,55 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(20):
+        hass.states.async_set("sensor.test", str(value % 7))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 6,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.test"]] == [
+        "0",
+        "6",
+        "0",
+        "6",
+        "0",
+        "5",
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_bad_start_time(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2154,3 +2203,168 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_columnar_stream(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history columnar stream sends the states in chunks."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+    start_time = dt_util.utcnow()
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+    one_last_updated = [
+        state.last_updated.timestamp()
+        for state in websocket_api.history.get_significant_states(
+            hass, start_time, None, ["sensor.one"], significant_changes_only=False
+        )["sensor.one"][1:]
+    ]
+    two_last_updated = hass.states.get("sensor.two").last_updated_timestamp
+
+    client = await hass_ws_client()
+    get_columnar = (
+        websocket_api.history.get_significant_states_columnar_chunk_with_session
+    )
+    with patch.object(
+        websocket_api.history,
+        "get_significant_states_columnar_chunk_with_session",
+        wraps=lambda *args: get_columnar(*args, chunk_size=2),
+    ) as get_columnar_mock:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/columnar_stream",
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "start_time": start_time.isoformat(),
+                "significant_changes_only": False,
+                "no_attributes": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["type"] == "result"
+
+        # The duplicate state of sensor.one is filtered out
+        # since the attributes were not requested
+        response = await client.receive_json()
+        assert response["event"] == {
+            "start_time": pytest.approx(start_time.timestamp()),
+            "end_time": ANY,
+            "partial": True,
+            "states": {
+                "sensor.one": {
+                    "s": ["on", "off"],
+                    "lu": [
+                        pytest.approx(start_time.timestamp()),
+                        pytest.approx(one_last_updated[0]),
+                    ],
+                },
+            },
+        }
+
+        # The next chunk is only read when the client acknowledged the chunk
+        await hass.async_block_till_done()
+        assert get_columnar_mock.call_count == 1
+        await client.send_json(
+            {"id": 2, "type": "history/columnar_stream/ack", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"] == {
+            "start_time": pytest.approx(start_time.timestamp()),
+            "end_time": ANY,
+            "states": {
+                "sensor.one": {"s": ["on"], "lu": [pytest.approx(one_last_updated[2])]},
+                "sensor.two": {"s": ["off"], "lu": [pytest.approx(two_last_updated)]},
+            },
+        }
+        assert get_columnar_mock.call_count == 2
+
+        await client.send_json(
+            {"id": 3, "type": "history/columnar_stream/ack", "subscription": 99}
+        )
+        response = await client.receive_json()
+        assert response["error"]["code"] == "not_found"
+
+    await client.send_json(
+        {
+            "id": 4,
+            "type": "history/columnar_stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": start_time.isoformat(),
+            "include_start_time_state": False,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["states"] == {
+        "sensor.one": {
+            "s": ["off", "on"],
+            "lu": [
+                pytest.approx(one_last_updated[0]),
+                pytest.approx(one_last_updated[2]),
+            ],
+            "a": [{"any": "attr"}, {"any": "attr"}],
+        }
+    }
+
+
+async def test_history_columnar_stream_invalid(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history columnar stream with invalid or empty requests."""
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    client = await hass_ws_client()
+    now = dt_util.utcnow()
+
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/columnar_stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": (now + timedelta(hours=1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["error"]["code"] == "invalid_start_time"
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/columnar_stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "end_time": (now - timedelta(hours=1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["error"]["code"] == "invalid_end_time"
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/columnar_stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": (now - timedelta(hours=1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["states"] == {}
+    assert "partial" not in response["event"]
@@ -4,7 +4,7 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -1111,6 +1111,66 @@ async def test_logbook_entity_context_id(
     assert json_dict[7]["context_user_id"] == "9400facee45711eaa9308bfd3d19e474"
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_logbook_entity_context_origin_before_start_time(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the context origin of entities is found outside the time window."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    contexts = {
+        entity_id: ha.Context(id=context_id, user_id=user_id)
+        for entity_id, context_id, user_id in (
+            (
+                "light.switch",
+                "01GTDGKBCH00GW0X476W5TVBFC",
+                "9400facee45711eaa9308bfd3d19e474",
+            ),
+            (
+                "light.other",
+                "01GTDGKBCH00GW0X476W5TVBFD",
+                "b400facee45711eaa9308bfd3d19e474",
+            ),
+        )
+    }
+    for entity_id, context in contexts.items():
+        hass.states.async_set(entity_id, STATE_ON)
+        hass.bus.async_fire(
+            EVENT_CALL_SERVICE,
+            {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_off", ATTR_ENTITY_ID: entity_id},
+            context=context,
+        )
+    await async_wait_recording_done(hass)
+    start_time = dt_util.utcnow()
+    for entity_id, context in contexts.items():
+        hass.states.async_set(entity_id, STATE_OFF, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    # Look up a single context at a time
+    with patch.object(recorder.get_instance(hass), "max_bind_vars", 2):
+        response = await client.get(
+            f"/api/logbook/{start_time.isoformat()}",
+            params={"entity": "light.switch,light.other"},
+        )
+    assert response.status == HTTPStatus.OK
+    json_dict = await response.json()
+
+    assert len(json_dict) == 2
+    for entry in json_dict:
+        assert entry["state"] == STATE_OFF
+        assert entry["context_event_type"] == "call_service"
+        assert entry["context_domain"] == "light"
+        assert entry["context_service"] == "turn_off"
+        assert entry["context_user_id"] == contexts[entry["entity_id"]].user_id
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_logbook_context_id_automation_script_started_manually(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
@@ -40,6 +40,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
 from homeassistant.util.signal_type import SignalTypeFormat
@@ -570,6 +571,35 @@ async def test_non_duplicate_discovery(
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
 
 
+async def test_unchanged_discovery_payload_ignored(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an unchanged discovery payload is ignored until it is removed."""
+    await mqtt_mock_entry()
+    payload = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+    caplog.clear()
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert "Ignoring unchanged discovery payload for binary_sensor bla" in caplog.text
+    assert "Component has already been discovered" not in caplog.text
+
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+
+    caplog.clear()
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert "Ignoring unchanged discovery payload" not in caplog.text
+    assert hass.states.get("binary_sensor.beer") is not None
+
+
 async def test_removal(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
@@ -785,6 +815,45 @@ async def test_rapid_reconfigure(
     assert events[2].data["new_state"].attributes["friendly_name"] == "Wine"
 
 
+async def test_discovery_burst_added_together(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test a burst of discovered components is added to the platform at once."""
+    await mqtt_mock_entry()
+
+    with patch.object(
+        EntityPlatform,
+        "async_add_entities",
+        autospec=True,
+        side_effect=EntityPlatform.async_add_entities,
+    ) as mock_add_entities:
+        # The platform is set up for the first message of the burst
+        for idx in range(3):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/bla{idx}/config",
+                f'{{ "name": "Beer{idx}", "state_topic": "test-topic" }}',
+            )
+        await hass.async_block_till_done()
+
+        assert len(hass.states.async_entity_ids("binary_sensor")) == 3
+        assert mock_add_entities.call_count == 1
+        assert len(mock_add_entities.call_args[0][1]) == 3
+
+        # The platform is already set up
+        for idx in range(3, 5):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/bla{idx}/config",
+                f'{{ "name": "Beer{idx}", "state_topic": "test-topic" }}',
+            )
+        await hass.async_block_till_done()
+
+        assert len(hass.states.async_entity_ids("binary_sensor")) == 5
+        assert mock_add_entities.call_count == 2
+        assert len(mock_add_entities.call_args[0][1]) == 2
+
+
 async def test_duplicate_removal(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -40,6 +40,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockConfigEntry,
@@ -214,6 +215,32 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+async def test_value_template_shares_parsed_payload(hass: HomeAssistant) -> None:
+    """Test value templates rendering the same payload parse it once."""
+    payload = '{"id": 4321, "name": "beer"}'
+    tpl_id = mqtt.MqttValueTemplate(template.Template("{{ value_json.id }}", hass))
+    tpl_name = mqtt.MqttValueTemplate(template.Template("{{ value_json.name }}", hass))
+    tpl_static = mqtt.MqttValueTemplate(template.Template("static", hass))
+    with (
+        patch(
+            "homeassistant.components.mqtt.models.json_loads", wraps=json_loads
+        ) as mock_json_loads,
+        patch(
+            "homeassistant.helpers.template.json_loads", wraps=json_loads
+        ) as mock_template_json_loads,
+    ):
+        assert tpl_id.async_render_with_possible_json_value(payload) == "4321"
+        assert tpl_name.async_render_with_possible_json_value(payload) == "beer"
+        assert mock_json_loads.call_count == 1
+
+        assert tpl_name.async_render_with_possible_json_value("no json") == "no json"
+        assert mock_json_loads.call_count == 2
+
+        assert tpl_static.async_render_with_possible_json_value("23.5") == "static"
+        assert mock_json_loads.call_count == 2
+    mock_template_json_loads.assert_not_called()
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
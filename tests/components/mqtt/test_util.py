@@ -13,7 +13,7 @@ import pytest
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import MessageCallbackType
-from homeassistant.components.mqtt.util import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.util import EnsureJobAfterCooldown, TopicTrie
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant
@@ -372,3 +372,61 @@ async def test_waiting_for_client_with_disabled_entry(
 
     # returns False because entry is disabled
     assert not await mqtt.async_wait_for_mqtt_client(hass)
+
+
+@pytest.mark.parametrize(
+    ("topic", "matches"),
+    [
+        (
+            "sport/tennis/player1",
+            {
+                "sport/tennis/player1",
+                "sport/+/player1",
+                "sport/#",
+                "+/tennis/#",
+                "#",
+            },
+        ),
+        ("sport/tennis", {"sport/+", "sport/#", "+/tennis/#", "#"}),
+        ("sport", {"sport/#", "#"}),
+        ("sport/", {"sport/+", "sport/#", "#"}),
+        ("other/tennis/player1", {"#", "+/tennis/#"}),
+        ("$SYS/monitor/clients", {"$SYS/#"}),
+    ],
+)
+def test_topic_trie_match(topic: str, matches: set[str]) -> None:
+    """Test matching topics against the topic filters in a topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in (
+        "sport/tennis/player1",
+        "sport/+/player1",
+        "sport/+",
+        "sport/#",
+        "+/tennis/#",
+        "#",
+        "$SYS/#",
+    ):
+        trie.add(topic_filter, topic_filter)
+    assert sorted(trie.match(topic)) == sorted(matches)
+
+
+def test_topic_trie_add_remove() -> None:
+    """Test adding and removing values from a topic trie."""
+    trie: TopicTrie[int] = TopicTrie()
+    trie.add("sport/+/player1", 1)
+    trie.add("sport/+/player1", 2)
+    trie.add("sport/#", 3)
+    assert "sport/+/player1" in trie
+    assert "sport/+" not in trie
+    assert sorted(trie.match("sport/tennis/player1")) == [1, 2, 3]
+
+    trie.remove("sport/+/player1", 1)
+    assert sorted(trie.match("sport/tennis/player1")) == [2, 3]
+    trie.remove("sport/+/player1", 2)
+    assert "sport/+/player1" not in trie
+    assert trie.match("sport/tennis/player1") == [3]
+    with pytest.raises(KeyError):
+        trie.remove("sport/+/player1", 2)
+    trie.remove("sport/#", 3)
+    assert trie.match("sport/tennis/player1") == []
+    assert "sport/#" not in trie
@@ -25,18 +25,21 @@ from homeassistant.components.profiler import (
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_START,
+    SERVICE_START_EVENT_LISTENER_STATS,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_EVENT_LISTENER_STATS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -270,6 +273,75 @@ async def test_log_scheduled(
     await hass.async_block_till_done()
 
 
+async def test_event_listener_stats(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test recording and logging event listener statistics."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    @callback
+    def _dummy_test_listener(event):
+        """Mock listener."""
+
+    hass.bus.async_listen("profiler_test_event", _dummy_test_listener)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "profiler/event_listener_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"enabled": False, "listeners": []}
+
+    with pytest.raises(HomeAssistantError, match="not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_EVENT_LISTENER_STATS, {}, blocking=True
+        )
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_EVENT_LISTENER_STATS, {}, blocking=True
+    )
+    assert hass.bus.listener_stats_enabled
+
+    with pytest.raises(HomeAssistantError, match="already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_EVENT_LISTENER_STATS, {}, blocking=True
+        )
+
+    hass.bus.async_fire("profiler_test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "profiler/event_listener_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["enabled"] is True
+    listener_stats = next(
+        stats
+        for stats in response["result"]["listeners"]
+        if stats["name"].endswith("_dummy_test_listener")
+    )
+    assert listener_stats["integration"] == "tests"
+    assert listener_stats["calls"] == 1
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_EVENT_LISTENER_STATS, {}, blocking=True
+    )
+    assert not hass.bus.listener_stats_enabled
+    assert "_dummy_test_listener (tests): 1 calls" in caplog.text
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_EVENT_LISTENER_STATS, {}, blocking=True
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not hass.bus.listener_stats_enabled
+
+
 async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
     """Test logging lru stats."""
 
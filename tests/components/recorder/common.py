@@ -117,6 +117,13 @@ async def async_wait_recording_done(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
 
+async def async_wait_missing_statistics_compiled(hass: HomeAssistant) -> None:
+    """Async wait until the missing statistics have been compiled."""
+    await async_wait_recording_done(hass)
+    while get_instance(hass).compiling_missing_statistics:
+        await async_wait_recording_done(hass)
+
+
 async def async_wait_purge_done(
     hass: HomeAssistant, max_number: int | None = None
 ) -> None:
@@ -5,7 +5,7 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -18,6 +18,8 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history import modern
+from homeassistant.components.recorder.history.downsample import downsample_states
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
@@ -1014,3 +1016,122 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+def test_downsample_states() -> None:
+    """Test downsampling keeps the extremes and the non numeric states."""
+    states = [{"s": str(value)} for value in (1, 5, 2, 3, 9, 4, 0, 2, 1, 7)]
+    assert downsample_states(states, 10) is states
+    assert downsample_states(states, 6) == [
+        {"s": "1"},
+        {"s": "2"},
+        {"s": "9"},
+        {"s": "4"},
+        {"s": "0"},
+        {"s": "7"},
+    ]
+
+    states[4] = {"s": "unavailable"}
+    assert downsample_states(states, 5) == [
+        {"s": "1"},
+        {"s": "5"},
+        {"s": "unavailable"},
+        {"s": "0"},
+        {"s": "7"},
+    ]
+
+    states = [{"state": "on"}, {"state": "off"}] * 5
+    assert downsample_states(states, 2) is states
+
+
+async def test_get_significant_states_max_points(hass: HomeAssistant) -> None:
+    """Test numeric states are downsampled when max_points is given."""
+    start = dt_util.utcnow()
+    for value in range(20):
+        hass.states.async_set("sensor.numeric", str(value % 7))
+        hass.states.async_set("sensor.text", f"text {value}")
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        start,
+        entity_ids=["sensor.numeric", "sensor.text"],
+        minimal_response=True,
+        compressed_state_format=True,
+        max_points=6,
+    )
+    assert [state["s"] for state in hist["sensor.numeric"]] == [
+        "0",
+        "6",
+        "0",
+        "6",
+        "0",
+        "5",
+    ]
+    assert len(hist["sensor.text"]) == 20
+
+
+@pytest.mark.parametrize(
+    ("no_attributes", "sensor_three_states"),
+    [(False, ["on"] * 6 + ["off"]), (True, ["on", "off"])],
+)
+async def test_get_significant_states_columnar_chunks(
+    hass: HomeAssistant, no_attributes: bool, sensor_three_states: list[str]
+) -> None:
+    """Test the columnar chunks are read by queries limited to the chunk size."""
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    with freeze_time(point) as freezer:
+        # A chunk boundary falls between states updated at the same time
+        for value in range(5):
+            hass.states.async_set("sensor.one", str(value))
+        for value in range(6):
+            hass.states.async_set("sensor.three", "on", {"value": value})
+        freezer.move_to(point + timedelta(seconds=1))
+        for value in range(5, 8):
+            hass.states.async_set("sensor.one", str(value))
+            hass.states.async_set("sensor.two", str(value))
+        hass.states.async_set("sensor.three", "off")
+    await async_wait_recording_done(hass)
+
+    execute_stmt_lambda_element = modern.execute_stmt_lambda_element
+    fetched_rows: list[int] = []
+
+    def _execute_stmt_lambda_element(*args, **kwargs):
+        rows = list(execute_stmt_lambda_element(*args, **kwargs))
+        fetched_rows.append(len(rows))
+        return rows
+
+    states: dict[str, list[str]] = {}
+    after: history.ColumnarStatesPosition | None = None
+    with (
+        session_scope(hass=hass, read_only=True) as session,
+        patch.object(
+            modern, "execute_stmt_lambda_element", _execute_stmt_lambda_element
+        ),
+    ):
+        while True:
+            chunk, after = history.get_significant_states_columnar_chunk_with_session(
+                hass,
+                session,
+                start,
+                None,
+                ["sensor.one", "sensor.two", "sensor.three"],
+                significant_changes_only=False,
+                no_attributes=no_attributes,
+                after=after,
+                chunk_size=3,
+            )
+            assert sum(len(columns["s"]) for columns in chunk.values()) <= 3
+            for entity_id, columns in chunk.items():
+                states.setdefault(entity_id, []).extend(columns["s"])
+            if after is None:
+                break
+
+    assert states == {
+        "sensor.one": [str(value) for value in range(8)],
+        "sensor.two": ["5", "6", "7"],
+        "sensor.three": sensor_three_states,
+    }
+    assert fetched_rows
+    assert max(fetched_rows) <= 4
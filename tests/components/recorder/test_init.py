@@ -37,6 +37,7 @@ from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
+    SIGNAL_COMPILE_MISSING_STATISTICS_PROGRESS,
     SupportedDialect,
 )
 from homeassistant.components.recorder.db_schema import (
@@ -77,6 +78,7 @@ from homeassistant.helpers import (
     issue_registry as ir,
     recorder as recorder_helper,
 )
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -85,6 +87,7 @@ from homeassistant.util.json import json_loads
 from .common import (
     async_block_recorder,
     async_recorder_block_till_done,
+    async_wait_missing_statistics_compiled,
     async_wait_recording_done,
     convert_pending_states_to_meta,
     corrupt_db_file,
@@ -360,6 +363,35 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_state_backlog(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test a backlog of states has its attributes resolved in one query."""
+    instance = await async_setup_recorder_instance(hass)
+    state_attributes_manager = instance.state_attributes_manager
+
+    hass.states.async_set("test.recorder_0", "on", {"test_attr": 0})
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        state_attributes_manager,
+        "_load_from_hashes",
+        wraps=state_attributes_manager._load_from_hashes,
+    ) as load_from_hashes:
+        await async_block_recorder(hass, 0.1)
+        for idx in range(50):
+            hass.states.async_set(f"test.recorder_{idx}", "off", {"test_attr": idx})
+        await async_wait_recording_done(hass)
+
+    assert load_from_hashes.call_count == 1
+    # The attributes of test.recorder_0 are already cached
+    assert len(load_from_hashes.call_args[0][0]) == 49
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 51
+        assert session.query(StateAttributes).count() == 50
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, setup_recorder: None
 ) -> None:
@@ -1422,8 +1454,7 @@ async def test_compile_missing_statistics(
             async_hourly_stats_updated_listener,
         )
 
-        await async_wait_recording_done(hass)
-        await async_wait_recording_done(hass)
+        await async_wait_missing_statistics_compiled(hass)
 
         statistics_runs = await instance.async_add_executor_job(
             get_statistic_runs, hass
@@ -1440,6 +1471,57 @@ async def test_compile_missing_statistics(
         await hass.async_stop()
 
 
+@pytest.mark.freeze_time("2022-09-13 09:00:00+02:00")
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.parametrize("enable_missing_statistics", [True])
+@pytest.mark.usefixtures("hass_storage")  # Prevent test hass from writing to storage
+async def test_compile_missing_statistics_in_chunks(
+    async_test_recorder: RecorderInstanceGenerator, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test missing statistics are compiled in chunks and report progress."""
+    now = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+
+    def get_statistic_runs(hass: HomeAssistant) -> list:
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(session.query(StatisticsRuns))
+
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass, wait_recorder=False),
+    ):
+        await hass.async_start()
+        await async_wait_missing_statistics_compiled(hass)
+        await hass.async_stop()
+
+    # Start Home Assistant two hours later
+    progress = []
+    freezer.tick(timedelta(hours=2))
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass, wait_recorder=False) as instance,
+    ):
+        async_dispatcher_connect(
+            hass, SIGNAL_COMPILE_MISSING_STATISTICS_PROGRESS, progress.append
+        )
+        with patch.object(statistics, "COMPILE_MISSING_STATISTICS_CHUNK", 6):
+            await async_wait_missing_statistics_compiled(hass)
+
+        statistics_runs = await instance.async_add_executor_job(
+            get_statistic_runs, hass
+        )
+        assert len(statistics_runs) == 25  # 24 5-minute runs
+        assert progress == [
+            {
+                "start": (now + timedelta(minutes=30 * idx)).isoformat(),
+                "end": (now + timedelta(minutes=30 * (idx + 1))).isoformat(),
+                "periods_remaining": 18 - 6 * idx,
+            }
+            for idx in range(4)
+        ]
+        assert not instance.compiling_missing_statistics
+        await hass.async_stop()
+
+
 async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving sets old state."""
     hass.states.async_set("test.one", "s1", {})
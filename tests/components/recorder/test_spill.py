@@ -0,0 +1,336 @@
+"""Test spilling recorder events to disk."""
+
+import asyncio
+from collections.abc import Generator
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components.recorder import core
+from homeassistant.components.recorder.db_schema import Events, EventTypes, States
+from homeassistant.components.recorder.spill import SpillLog, decode_event, encode_event
+from homeassistant.components.recorder.tasks import RecorderTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+
+from .common import async_block_recorder, async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.fixture
+def spill_path(tmp_path: Path) -> Generator[Path]:
+    """Spill events to a temporary directory after a backlog of 5 events."""
+    path = tmp_path / "recorder_spill"
+    with (
+        patch.object(core, "SPILL_DIR", str(path)),
+        patch.object(core, "SPILL_BACKLOG_THRESHOLD", 5),
+    ):
+        yield path
+
+
+def _state_changed_event(entity_id: str, state: str, old_state: State | None) -> Event:
+    """Return a state_changed event."""
+    new_state = State(
+        entity_id,
+        state,
+        {"test_attr": state, "unrecorded": True},
+        context=Context(user_id="abc"),
+        state_info={"unrecorded_attributes": frozenset({"unrecorded"})},
+    )
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+        context=new_state.context,
+    )
+
+
+async def _async_wait_spill_recorded(
+    hass: HomeAssistant, instance: core.Recorder
+) -> None:
+    """Wait until the spilled events have been recorded."""
+    await async_wait_recording_done(hass)
+    while instance._spill is not None:
+        await async_wait_recording_done(hass)
+        await asyncio.sleep(0.01)
+    await async_wait_recording_done(hass)
+
+
+def test_encode_decode_event() -> None:
+    """Test events survive the round trip through the spill log encoding."""
+    event = _state_changed_event("sensor.test", "1", None)
+    event = _state_changed_event("sensor.test", "2", event.data["new_state"])
+    decoded = decode_event(encode_event(event))
+
+    assert decoded.event_type == EVENT_STATE_CHANGED
+    assert decoded.time_fired_timestamp == event.time_fired_timestamp
+    assert decoded.context == event.context
+    for key in ("old_state", "new_state"):
+        assert decoded.data[key].as_dict() == event.data[key].as_dict()
+        assert decoded.data[key].state_info == event.data[key].state_info
+        assert (
+            decoded.data[key].last_updated_timestamp
+            == event.data[key].last_updated_timestamp
+        )
+
+    event = Event("test_event", {"value": [1, 2]}, EventOrigin.remote)
+    decoded = decode_event(encode_event(event))
+    assert decoded.as_dict() == event.as_dict()
+
+
+def test_encode_unserializable_event(caplog: pytest.LogCaptureFixture) -> None:
+    """Test events that cannot be serialized are not encoded."""
+    assert encode_event(Event("test_event", {"value": object()})) is None
+    assert "Event is not JSON serializable" in caplog.text
+
+
+def test_spill_log(tmp_path: Path) -> None:
+    """Test events are read back in order across segments and restarts."""
+    path = str(tmp_path / "spill")
+    records = [f'{{"record": {idx}}}'.encode() for idx in range(10)]
+
+    spill = SpillLog(path, 1024**2, segment_size=32)
+    assert spill.empty
+    for record in records:
+        assert spill.append(record)
+    assert not spill.empty
+
+    read, position = spill.read(4)
+    assert read == records[:4]
+    spill.consume(position)
+    spill.close()
+
+    # The head is stored so a restart continues after the consumed events
+    spill = SpillLog(path, 1024**2, segment_size=32)
+    read, position = spill.read(100)
+    assert read == records[4:]
+    spill.consume(position)
+    assert spill.empty
+    spill.remove()
+    assert not (tmp_path / "spill").exists()
+
+
+def test_spill_log_read_until(tmp_path: Path) -> None:
+    """Test reading stops at the given end position."""
+    spill = SpillLog(str(tmp_path / "spill"), 1024**2, segment_size=32)
+    spill.append(b'{"record": 1}')
+    end = spill.end
+    spill.append(b'{"record": 2}')
+
+    read, position = spill.read(100, end)
+    assert read == [b'{"record": 1}']
+    assert position == end
+    spill.consume(position)
+    assert spill.head == end
+    assert spill.read(100, end)[0] == []
+    assert spill.read(100)[0] == [b'{"record": 2}']
+
+
+def test_spill_log_incomplete_record(tmp_path: Path) -> None:
+    """Test an incomplete record at the end of a segment is skipped."""
+    path = tmp_path / "spill"
+    spill = SpillLog(str(path), 1024**2)
+    spill.append(b'{"record": 1}')
+    spill.append(b'{"record": 2}')
+    spill.close()
+    segment = next(path.glob("*.log"))
+    segment.write_bytes(segment.read_bytes()[:-3])
+
+    spill = SpillLog(str(path), 1024**2)
+    spill.append(b'{"record": 3}')
+    read, position = spill.read(100)
+    assert read == [b'{"record": 1}', b'{"record": 3}']
+    spill.consume(position)
+    assert spill.empty
+
+
+def test_spill_log_flush_syncs_appended_events(tmp_path: Path) -> None:
+    """Test flushing only syncs to disk when events were appended."""
+    spill = SpillLog(str(tmp_path / "spill"), 1024**2)
+    with patch("homeassistant.components.recorder.spill.os.fsync") as mock_fsync:
+        spill.flush()
+        spill.append(b'{"record": 1}')
+        spill.flush()
+        spill.flush()
+        assert mock_fsync.call_count == 1
+        spill.append(b'{"record": 2}')
+        spill.flush()
+        assert mock_fsync.call_count == 2
+
+
+def test_spill_log_full(tmp_path: Path) -> None:
+    """Test events are not appended once the spill log is full."""
+    spill = SpillLog(str(tmp_path / "spill"), 30)
+    assert spill.append(b'{"record": 1}')
+    assert not spill.append(b'{"record": 2}')
+    assert spill.read(100)[0] == [b'{"record": 1}']
+
+
+async def test_events_spilled_during_backlog(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    spill_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test events are spilled to disk during a backlog and recorded in order."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await async_block_recorder(hass, 0.1)
+    for idx in range(20):
+        hass.states.async_set("sensor.test", str(idx), {"idx": idx})
+    hass.bus.async_fire("test_event")
+
+    await _async_wait_spill_recorded(hass, instance)
+
+    assert "Events will be spilled" in caplog.text
+    assert "Recorded all the events spilled" in caplog.text
+    assert not spill_path.exists()
+    with session_scope(hass=hass, read_only=True) as session:
+        states = session.query(States).order_by(States.state_id).all()
+        assert [state.state for state in states] == [str(idx) for idx in range(20)]
+        assert states[1].old_state_id == states[0].state_id
+        assert (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "test_event")
+            .count()
+            == 1
+        )
+
+
+async def test_spilled_events_retried_after_database_failure(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    spill_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test spilled events are recorded once the database recovers."""
+    instance = await async_setup_recorder_instance(hass)
+    commit_event_session = instance._commit_event_session
+    failures = 0
+
+    def _commit_event_session() -> None:
+        nonlocal failures
+        if instance._spill is not None and not failures:
+            failures += 1
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        commit_event_session()
+
+    with (
+        patch.object(core, "SPILL_REPLAY_RETRY_INTERVAL", 0),
+        patch.object(instance, "_commit_event_session", _commit_event_session),
+    ):
+        await async_block_recorder(hass, 0.1)
+        for idx in range(10):
+            hass.states.async_set(f"sensor.test_{idx}", "on")
+        await _async_wait_spill_recorded(hass, instance)
+
+    assert failures == 1
+    assert "Error recording 10 spilled events" in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 10
+
+
+async def test_spilled_events_recorded_after_restart(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    spill_path: Path,
+) -> None:
+    """Test events spilled before a restart are recorded first."""
+    spill = SpillLog(str(spill_path), 1024**2)
+    old_state = None
+    for state in ("1", "2"):
+        event = _state_changed_event("sensor.test", state, old_state)
+        old_state = event.data["new_state"]
+        spill.append(encode_event(event))
+    spill.close()
+
+    instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("sensor.test", "3")
+    await _async_wait_spill_recorded(hass, instance)
+
+    assert not spill_path.exists()
+    with session_scope(hass=hass, read_only=True) as session:
+        states = session.query(States).order_by(States.state_id).all()
+        assert [state.state for state in states] == ["1", "2", "3"]
+
+
+@dataclass(slots=True)
+class _CountStatesTask(RecorderTask):
+    """Count the recorded states when the task runs."""
+
+    counts: list[int]
+
+    def run(self, instance: core.Recorder) -> None:
+        """Handle the task."""
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            self.counts.append(session.query(States).count())
+
+
+async def test_tasks_run_in_order_with_spilled_events(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    spill_path: Path,
+) -> None:
+    """Test tasks queued while spilling run after the events queued before them."""
+    instance = await async_setup_recorder_instance(hass)
+    counts: list[int] = []
+
+    await async_block_recorder(hass, 0.1)
+    for idx in range(10):
+        hass.states.async_set("sensor.test", str(idx))
+    instance.queue_task(_CountStatesTask(counts))
+    for idx in range(10, 15):
+        hass.states.async_set("sensor.test", str(idx))
+    await _async_wait_spill_recorded(hass, instance)
+
+    assert counts == [10]
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 15
+
+
+async def test_invalid_spilled_events_skipped(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    spill_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test spilled events that cannot be decoded or recorded are skipped."""
+    spill = SpillLog(str(spill_path), 1024**2)
+    spill.append(b'{"e": "test_event", "d": {}, "o": "bad"}')
+    for state in ("1", "2", "3"):
+        spill.append(encode_event(_state_changed_event("sensor.test", state, None)))
+    spill.close()
+
+    process_state_changed = core.Recorder._process_state_changed_event_into_session
+
+    def _process_state_changed(self: core.Recorder, event: Event) -> None:
+        if event.data["new_state"].state == "2":
+            raise ValueError("cannot record")
+        process_state_changed(self, event)
+
+    with patch.object(
+        core.Recorder,
+        "_process_state_changed_event_into_session",
+        _process_state_changed,
+    ):
+        instance = await async_setup_recorder_instance(hass)
+        await _async_wait_spill_recorded(hass, instance)
+
+    assert "Skipping spilled event that cannot be decoded" in caplog.text
+    assert "Error recording spilled event" in caplog.text
+    assert not spill_path.exists()
+    with session_scope(hass=hass, read_only=True) as session:
+        states = session.query(States).order_by(States.state_id).all()
+        assert [state.state for state in states] == ["1", "3"]
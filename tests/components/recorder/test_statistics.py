@@ -1,6 +1,6 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
@@ -1844,6 +1844,115 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_statistics_during_period_cache(hass: HomeAssistant) -> None:
+    """Test statistics are cached until statistics overlapping them change."""
+    cache = statistics.get_statistics_during_period_cache(hass)
+    zero = dt_util.utcnow()
+    period1 = zero.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    period2 = period1 + timedelta(hours=1)
+    period3 = period2 + timedelta(hours=1)
+    statistic_id = "test:total_energy_import"
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "kWh",
+    }
+
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        (
+            {"start": period1, "state": 0, "sum": 2},
+            {"start": period2, "state": 1, "sum": 3},
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    stats = statistics_during_period(
+        hass, zero, period="hour", statistic_ids={statistic_id}, types={"sum"}
+    )
+    assert [row["sum"] for row in stats[statistic_id]] == [2, 3]
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # Modifying the returned rows does not modify the cached rows
+    stats[statistic_id][0]["sum"] = 100
+    stats = statistics_during_period(
+        hass, zero, period="hour", statistic_ids={statistic_id}, types={"sum"}
+    )
+    assert [row["sum"] for row in stats[statistic_id]] == [2, 3]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Results ending before the imported statistics are still cached
+    statistics_during_period(
+        hass, zero, period2, period="hour", statistic_ids={statistic_id}
+    )
+    async_add_external_statistics(
+        hass, external_metadata, ({"start": period3, "state": 2, "sum": 4},)
+    )
+    await async_wait_recording_done(hass)
+    statistics_during_period(
+        hass, zero, period2, period="hour", statistic_ids={statistic_id}
+    )
+    assert (cache.hits, cache.misses) == (2, 2)
+    stats = statistics_during_period(
+        hass, zero, period="hour", statistic_ids={statistic_id}, types={"sum"}
+    )
+    assert [row["sum"] for row in stats[statistic_id]] == [2, 3, 4]
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    recorder.get_instance(hass).async_adjust_statistics(statistic_id, period2, 1, "kWh")
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(
+        hass, zero, period="hour", statistic_ids={statistic_id}, types={"sum"}
+    )
+    assert [row["sum"] for row in stats[statistic_id]] == [2, 4, 5]
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    # Results for all statistic ids are not cached
+    statistics_during_period(hass, zero, period="hour")
+    statistics_during_period(hass, zero, period="hour")
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+@pytest.mark.usefixtures("recorder_mock")
+async def test_invalidate_statistics_during_period_cache(hass: HomeAssistant) -> None:
+    """Test all hours compiled from the periods are invalidated."""
+    cache = statistics.get_statistics_during_period_cache(hass)
+    hour0 = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    hour1 = hour0 + timedelta(hours=1)
+    hour2 = hour0 + timedelta(hours=2)
+    hour3 = hour0 + timedelta(hours=3)
+
+    def _statistics_during_hours(start: datetime, end: datetime) -> None:
+        statistics_during_period(hass, start, end, statistic_ids={"sensor.test"})
+
+    for hour in (hour0, hour1, hour2):
+        _statistics_during_hours(hour, hour + timedelta(hours=1))
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    # The missing statistics were compiled from 00:30 until 02:05
+    statistics._invalidate_statistics_during_period_cache(
+        hass, hour0 + timedelta(minutes=30), hour2 + timedelta(minutes=5)
+    )
+    for hour in (hour0, hour1, hour2):
+        _statistics_during_hours(hour, hour + timedelta(hours=1))
+    assert (cache.hits, cache.misses) == (0, 6)
+
+    _statistics_during_hours(hour1, hour3)
+    assert (cache.hits, cache.misses) == (0, 7)
+    # The hour is not complete, the hourly statistics are not compiled
+    statistics._invalidate_statistics_during_period_cache(
+        hass, hour2 + timedelta(minutes=5), hour2 + timedelta(minutes=10)
+    )
+    _statistics_during_hours(hour1, hour3)
+    _statistics_during_hours(hour2, hour3)
+    assert (cache.hits, cache.misses) == (2, 7)
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
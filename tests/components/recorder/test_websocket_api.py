@@ -12,6 +12,9 @@ import pytest
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.const import (
+    SIGNAL_COMPILE_MISSING_STATISTICS_PROGRESS,
+)
 from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
@@ -26,6 +29,7 @@ from homeassistant.components.recorder.websocket_api import UNIT_SCHEMA
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import recorder as recorder_helper
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
@@ -40,7 +44,7 @@ from .common import (
 )
 from .conftest import InstrumentedMigration
 
-from tests.common import async_fire_time_changed
+from tests.common import MockUser, async_fire_time_changed
 from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
 
 
@@ -1996,6 +2000,46 @@ async def test_update_statistics_issues(
     assert response["result"] is None
 
 
+async def test_subscribe_compile_missing_statistics(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscribing to the progress of compiling missing statistics."""
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {"type": "recorder/subscribe_compile_missing_statistics"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"compiling": False}
+
+    progress = {
+        "start": "2022-10-01T00:00:00+00:00",
+        "end": "2022-10-01T01:00:00+00:00",
+        "periods_remaining": 12,
+    }
+    async_dispatcher_send(hass, SIGNAL_COMPILE_MISSING_STATISTICS_PROGRESS, progress)
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert response["event"] == progress
+
+
+async def test_subscribe_compile_missing_statistics_requires_admin(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribing to the progress of compiling requires an admin."""
+    hass_admin_user.groups = []
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {"type": "recorder/subscribe_compile_missing_statistics"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "unauthorized"
+
+
 async def test_clear_statistics(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2538,6 +2582,7 @@ async def test_recorder_info(
         "migration_in_progress": False,
         "migration_is_live": False,
         "recording": True,
+        "statistics_cache": {"hits": 0, "misses": 0},
         "thread_running": True,
     }
 
@@ -36,7 +36,12 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
-from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
+from homeassistant.components.sensor.recorder import SensorStateHistory
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.setup import async_setup_component
@@ -1694,6 +1699,145 @@ async def test_compile_hourly_sum_statistics_total_no_reset(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_from_tracked_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test compiling statistics from the sensor states tracked in memory."""
+    period0 = get_start_time(dt_util.utcnow())
+    period1 = period0 + timedelta(minutes=5)
+    period2 = period0 + timedelta(minutes=10)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+
+    # The first compile starts tracking the sensor states
+    freezer.move_to(period0)
+    do_adhoc_statistics(hass, start=period0 - timedelta(hours=1))
+    await async_wait_recording_done(hass)
+
+    seq = [10, 15, 20, 10, 30, 40, 50, 60, 70]
+    await async_record_meter_states(
+        hass, freezer, period0, "sensor.test1", ENERGY_SENSOR_ATTRIBUTES, seq
+    )
+    await async_record_states(
+        hass, freezer, period0, "sensor.test2", POWER_SENSOR_ATTRIBUTES
+    )
+    freezer.move_to(period0 + timedelta(minutes=15))
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_full_significant_states_mock:
+        for start in (period0, period1, period2):
+            do_adhoc_statistics(hass, start=start)
+            await async_wait_recording_done(hass)
+        get_full_significant_states_mock.assert_not_called()
+
+    stats = statistics_during_period(hass, period0, period="5minute")
+    assert [(stat["state"], stat["sum"]) for stat in stats["sensor.test1"]] == [
+        (pytest.approx(20), pytest.approx(10)),
+        (pytest.approx(40), pytest.approx(30)),
+        (pytest.approx(70), pytest.approx(60)),
+    ]
+    assert [
+        (stat["mean"], stat["min"], stat["max"]) for stat in stats["sensor.test2"]
+    ] == [
+        (pytest.approx(13.050847), pytest.approx(-10), pytest.approx(30)),
+        (pytest.approx(30), pytest.approx(30), pytest.approx(30)),
+        (pytest.approx(30), pytest.approx(30), pytest.approx(30)),
+    ]
+
+
+async def test_tracked_states_history(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the history of tracked sensor states."""
+    period0 = get_start_time(dt_util.utcnow())
+    period1 = period0 + timedelta(minutes=5)
+    period2 = period0 + timedelta(minutes=10)
+    period3 = period0 + timedelta(minutes=15)
+    freezer.move_to(period0)
+    state_history = SensorStateHistory(hass)
+    hass.bus.async_listen(EVENT_STATE_CHANGED, state_history.async_track_state)
+
+    hass.states.async_set("sensor.test1", "10", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test2", "1", ENERGY_SENSOR_ATTRIBUTES)
+    freezer.move_to(period0 + timedelta(minutes=1))
+    hass.states.async_set("sensor.test1", "40", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test2", "4", ENERGY_SENSOR_ATTRIBUTES)
+    freezer.move_to(period0 + timedelta(minutes=4))
+    hass.states.async_set("sensor.test1", "20", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test2", "3", ENERGY_SENSOR_ATTRIBUTES)
+    state0 = hass.states.get("sensor.test2")
+    freezer.move_to(period1 + timedelta(minutes=1))
+    hass.states.async_set("sensor.test1", "5", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set(
+        "sensor.test2", "5", {**ENERGY_SENSOR_ATTRIBUTES, "unit_of_measurement": "Wh"}
+    )
+    freezer.move_to(period2 + timedelta(minutes=1))
+    hass.states.async_set("sensor.test1", "6", POWER_SENSOR_ATTRIBUTES)
+
+    # The states before the history was started are unknown
+    assert (
+        state_history.async_get_history(
+            ["sensor.test2"], ["sensor.test1"], period0 - timedelta(minutes=5), period0
+        )
+        is None
+    )
+    # The mean, min and max are compiled from the aggregates
+    # and the sum from the first and last state
+    float_history, database_entity_ids = state_history.async_get_history(
+        ["sensor.test2"], ["sensor.test1"], period0, period1
+    )
+    assert not database_entity_ids
+    assert [fstate for fstate, _ in float_history["sensor.test1"]] == [
+        10,
+        40,
+        pytest.approx((10 * 60 + 40 * 180 + 20 * 60) / 300),
+    ]
+    assert float_history["sensor.test2"][0][0] == 1
+    assert float_history["sensor.test2"][1] == (3, state0)
+
+    # The periods before the last period are forgotten
+    assert (
+        state_history.async_get_history(
+            ["sensor.test2"], ["sensor.test1"], period0, period1
+        )
+        is None
+    )
+    # Sensors which changed unit are queried from the database
+    float_history, database_entity_ids = state_history.async_get_history(
+        ["sensor.test2"], ["sensor.test1"], period1, period2
+    )
+    assert database_entity_ids == {"sensor.test2"}
+    assert [fstate for fstate, _ in float_history["sensor.test1"]] == [
+        5,
+        20,
+        pytest.approx((20 * 60 + 5 * 240) / 300),
+    ]
+
+    # A sensor which did not change has the state it had before a later change
+    freezer.move_to(period3 + timedelta(minutes=1))
+    hass.states.async_set("sensor.test2", "7", ENERGY_SENSOR_ATTRIBUTES)
+    float_history, database_entity_ids = state_history.async_get_history(
+        ["sensor.test2"], ["sensor.test1"], period2, period3
+    )
+    assert [fstate for fstate, _ in float_history["sensor.test2"]] == [5]
+
+    # The oldest period is dropped when too many periods are tracked
+    with patch("homeassistant.components.sensor.recorder.MAX_TRACKED_PERIODS", 1):
+        freezer.move_to(period3 + timedelta(minutes=6))
+        hass.states.async_set("sensor.test1", "8", POWER_SENSOR_ATTRIBUTES)
+    assert (
+        state_history.async_get_history(
+            ["sensor.test2"], ["sensor.test1"], period3, period3 + timedelta(minutes=5)
+        )
+        is None
+    )
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
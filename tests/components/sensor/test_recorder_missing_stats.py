@@ -21,6 +21,7 @@ import homeassistant.util.dt as dt_util
 
 from tests.common import async_test_home_assistant
 from tests.components.recorder.common import (
+    async_wait_missing_statistics_compiled,
     async_wait_recording_done,
     do_adhoc_statistics,
 )
@@ -61,8 +62,7 @@ async def test_compile_missing_statistics(
         await async_setup_component(hass, "sensor", {})
         get_instance(hass).recorder_and_worker_thread_ids.add(threading.get_ident())
         await hass.async_start()
-        await async_wait_recording_done(hass)
-        await async_wait_recording_done(hass)
+        await async_wait_missing_statistics_compiled(hass)
 
         hass.states.async_set("sensor.test1", "0", POWER_SENSOR_ATTRIBUTES)
         await async_wait_recording_done(hass)
@@ -106,8 +106,7 @@ async def test_compile_missing_statistics(
         hass.states.async_set("sensor.test1", "0", POWER_SENSOR_ATTRIBUTES)
         get_instance(hass).recorder_and_worker_thread_ids.add(threading.get_ident())
         await hass.async_start()
-        await async_wait_recording_done(hass)
-        await async_wait_recording_done(hass)
+        await async_wait_missing_statistics_compiled(hass)
         with session_scope(hass=hass, read_only=True) as session:
             latest = get_latest_short_term_statistics_with_session(
                 hass, session, {"sensor.test1"}, {"state", "sum", "max", "mean", "min"}
@@ -0,0 +1 @@
+"""Tests for the State Mirror integration."""
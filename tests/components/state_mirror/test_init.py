@@ -0,0 +1,128 @@
+"""Tests for the State Mirror integration."""
+
+import asyncio
+from pathlib import Path
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.state_mirror import _create_writer
+from homeassistant.components.state_mirror.const import DOMAIN
+from homeassistant.components.state_mirror.mirror import StateMirrorReader
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+
+async def test_states_are_mirrored(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test state changes are written to the state table."""
+    path = str(tmp_path / "states.bin")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 255})
+
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"path": path}})
+    await hass.async_block_till_done()
+
+    reader = StateMirrorReader(path)
+    reader.refresh()
+    assert reader.entity_ids() == ["light.kitchen"]
+    assert reader.get_json("light.kitchen")["attributes"] == {"brightness": 255}
+    sequence = reader.sequence
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("sensor.power", "12")
+    await hass.async_block_till_done()
+
+    assert reader.sequence == sequence + 2
+    reader.refresh()
+    assert sorted(reader.entity_ids()) == ["light.kitchen", "sensor.power"]
+    assert reader.get_json("light.kitchen")["state"] == "off"
+    state_json = reader.get("sensor.power")
+    assert state_json is not None
+    assert bytes(state_json) == hass.states.get("sensor.power").as_dict_json
+    state_json.release()
+
+    hass.states.async_remove("light.kitchen")
+    await hass.async_block_till_done()
+
+    reader.refresh()
+    assert reader.entity_ids() == ["sensor.power"]
+    assert reader.get("light.kitchen") is None
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.power", "13")
+    await hass.async_block_till_done()
+
+    reader.refresh()
+    assert reader.get_json("sensor.power")["state"] == "12"
+    reader.close()
+
+
+async def test_changes_during_creation_are_mirrored(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test state changes made while the state table is created are written."""
+    path = str(tmp_path / "states.bin")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("sensor.power", "12")
+    creating = threading.Event()
+    release = threading.Event()
+
+    def _blocked_create_writer(*args):
+        creating.set()
+        release.wait()
+        return _create_writer(*args)
+
+    with patch(
+        "homeassistant.components.state_mirror._create_writer",
+        _blocked_create_writer,
+    ):
+        setup_task = hass.async_create_task(
+            async_setup_component(hass, DOMAIN, {DOMAIN: {"path": path}})
+        )
+        await hass.async_add_executor_job(creating.wait)
+        hass.states.async_set("light.kitchen", "off")
+        hass.states.async_remove("sensor.power")
+        hass.states.async_set("sensor.energy", "3")
+        await asyncio.sleep(0)
+        release.set()
+        assert await setup_task
+    await hass.async_block_till_done()
+
+    with StateMirrorReader(path) as reader:
+        reader.refresh()
+        assert sorted(reader.entity_ids()) == ["light.kitchen", "sensor.energy"]
+        assert reader.get_json("light.kitchen")["state"] == "off"
+        assert reader.get_json("sensor.energy")["state"] == "3"
+
+
+async def test_table_compacted(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the state table is compacted when it is full."""
+    path = str(tmp_path / "states.bin")
+    with patch("homeassistant.components.state_mirror.DEFAULT_SIZE", 512):
+        assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"path": path}})
+    await hass.async_block_till_done()
+
+    for value in range(20):
+        hass.states.async_set("sensor.power", str(value))
+        hass.states.async_set("sensor.energy", str(value))
+        await hass.async_block_till_done()
+
+    with StateMirrorReader(path) as reader:
+        reader.refresh()
+        assert reader.get_json("sensor.power")["state"] == "19"
+        assert reader.get_json("sensor.energy")["state"] == "19"
+
+
+async def test_existing_file_not_replaced(
+    hass: HomeAssistant, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test setup fails instead of replacing a file that is not a state table."""
+    path = tmp_path / "states.bin"
+    path.write_bytes(b"important")
+
+    assert not await async_setup_component(hass, DOMAIN, {DOMAIN: {"path": str(path)}})
+    assert "Refusing to replace" in caplog.text
+    assert path.read_bytes() == b"important"
@@ -0,0 +1,120 @@
+"""Tests for the State Mirror state table."""
+
+import os
+from pathlib import Path
+import stat
+
+import pytest
+
+from homeassistant.components.state_mirror.mirror import (
+    StateMirrorError,
+    StateMirrorReader,
+    StateMirrorWriter,
+)
+
+
+def test_compaction(tmp_path: Path) -> None:
+    """Test readers follow the table when it is compacted and grown."""
+    path = str(tmp_path / "states.bin")
+    writer = StateMirrorWriter(path, 256)
+    writer.write("sensor.a", b'{"state":"0"}')
+    writer.commit()
+
+    with StateMirrorReader(path) as reader:
+        reader.refresh()
+        assert reader.get_json("sensor.a") == {"state": "0"}
+
+        for value in range(1, 50):
+            writer.write("sensor.a", f'{{"state":"{value}"}}'.encode())
+            writer.write("sensor.b", f'{{"state":"{value}"}}'.encode())
+        writer.write("sensor.c", b'{"state":"c"}')
+        writer.write("sensor.c", None)
+        writer.write("sensor.missing", None)
+        writer.commit()
+        assert writer.compact_needed
+        assert reader.sequence == 1
+
+        states = writer.start_compact()
+        assert not writer.compact_needed
+        # States written while compacting are appended when it is done
+        writer.write("sensor.d", b'{"state":"d"}')
+        writer.commit()
+        assert reader.sequence == 1
+        writer.compact(states)
+        writer.finish_compact()
+
+        assert writer.sequence == 102
+        assert reader.sequence == 102
+        reader.refresh()
+        assert sorted(reader.entity_ids()) == ["sensor.a", "sensor.b", "sensor.d"]
+        assert reader.get_json("sensor.a") == {"state": "49"}
+        assert reader.get_json("sensor.b") == {"state": "49"}
+        assert reader.get_json("sensor.d") == {"state": "d"}
+
+        writer.write("sensor.large", b'{"state":"' + b"x" * 1000 + b'"}')
+        writer.commit()
+        assert writer.compact_needed
+        writer.compact(writer.start_compact())
+        writer.finish_compact()
+        assert writer.size > 2000
+
+        reader.refresh()
+        assert len(reader.get_json("sensor.large")["state"]) == 1000
+        assert reader.get_json("sensor.a") == {"state": "49"}
+
+    writer.close()
+
+
+def test_writer_restart(tmp_path: Path) -> None:
+    """Test readers pick up a table that was replaced by a new writer."""
+    path = str(tmp_path / "states.bin")
+    writer = StateMirrorWriter(path)
+    writer.write("sensor.a", b'{"state":"old"}')
+    writer.commit()
+
+    reader = StateMirrorReader(path)
+    reader.refresh()
+    state_json = reader.get("sensor.a")
+    writer.close()
+
+    writer = StateMirrorWriter(path)
+    writer.write("sensor.b", b'{"state":"new"}')
+    writer.commit()
+
+    reader.refresh()
+    assert reader.entity_ids() == ["sensor.b"]
+    assert bytes(state_json) == b'{"state":"old"}'
+    reader.close()
+    writer.close()
+
+
+def test_writer_only_replaces_tables(tmp_path: Path) -> None:
+    """Test the writer refuses to replace files that are not state tables."""
+    path = tmp_path / "states.bin"
+    path.write_bytes(b"important")
+    with pytest.raises(StateMirrorError):
+        StateMirrorWriter(str(path))
+    assert path.read_bytes() == b"important"
+
+    link = tmp_path / "link.bin"
+    link.symlink_to(path)
+    with pytest.raises(StateMirrorError):
+        StateMirrorWriter(str(link))
+    assert path.read_bytes() == b"important"
+
+    path.unlink()
+    writer = StateMirrorWriter(str(path))
+    writer.close()
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_invalid_table(tmp_path: Path) -> None:
+    """Test opening a file that is not a state table."""
+    path = tmp_path / "states.bin"
+    path.write_bytes(b"")
+    with pytest.raises(StateMirrorError):
+        StateMirrorReader(str(path))
+
+    path.write_bytes(b"x" * 100)
+    with pytest.raises(StateMirrorError):
+        StateMirrorReader(str(path))
@@ -17,6 +17,7 @@ from homeassistant.components.stream.const import (
     NUM_PLAYLIST_SEGMENTS,
 )
 from homeassistant.components.stream.core import Orientation, Part
+from homeassistant.components.stream.hls import HlsPlaylistView
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -432,6 +433,54 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_playlist_and_segment_shared(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test the playlist and segment data are reused across requests."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    for i in range(2):
+        segment = Segment(sequence=i, duration=SEGMENT_DURATION)
+        segment.parts = [
+            Part(duration=SEGMENT_DURATION / 2, has_keyframe=True, data=FAKE_PAYLOAD)
+            for _ in range(2)
+        ]
+        hls.put(segment)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    with patch.object(
+        HlsPlaylistView, "render", wraps=HlsPlaylistView.render
+    ) as mock_render:
+        for _ in range(3):
+            resp = await hls_client.get("/playlist.m3u8")
+            assert resp.status == HTTPStatus.OK
+            assert await resp.text() == make_playlist(
+                sequence=0, segments=[make_segment(0), make_segment(1)]
+            )
+        assert mock_render.call_count == 1
+
+        segment = Segment(sequence=2, duration=SEGMENT_DURATION)
+        hls.put(segment)
+        await hass.async_block_till_done()
+        resp = await hls_client.get("/playlist.m3u8")
+        assert await resp.text() == make_playlist(
+            sequence=0, segments=[make_segment(0), make_segment(1), make_segment(2)]
+        )
+        assert mock_render.call_count == 2
+
+    segment = hls.get_segment(1)
+    assert segment.get_data() is segment.get_data()
+    segment_response = await hls_client.get("/segment/1.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert await segment_response.read() == FAKE_PAYLOAD * 2
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -27,6 +28,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +36,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -2865,6 +2868,83 @@ async def test_integration_descriptions(
     assert response["result"]
 
 
+async def test_subscribe_entities_coalesced(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities coalesces the changes within the window."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    hass.states.async_set("light.not_permitted", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {
+            "entities": {
+                "entity_ids": {
+                    "light.permitted": True,
+                    "light.removed": True,
+                    "light.added": True,
+                    "light.flapping": True,
+                }
+            }
+        }
+    )
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_ms": 250}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert set(msg["event"]["a"]) == {"light.permitted", "light.removed"}
+
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    hass.states.async_set("light.permitted", "off", {"color": "green"})
+    hass.states.async_set("light.permitted", "on", {"color": "green"})
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.flapping", "on")
+    hass.states.async_remove("light.flapping")
+    hass.states.async_set("light.not_permitted", "on")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "r": ["light.removed"],
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"color": "green"}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        },
+    }
+
+    hass.states.async_set("light.permitted", "off", {"color": "green"})
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+    # The pending changes are dropped on unsubscribe
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    await websocket_client.send_json({"id": 9, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["type"] == "pong"
+
+
 async def test_subscribe_entities_chained_state_change(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -580,6 +580,199 @@ async def test_load_bad_data(
     )
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_creates_entries_on_access(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test entries loaded from storage are only created when accessed."""
+    stored_entities = [
+        {
+            "aliases": [],
+            "area_id": None,
+            "capabilities": None,
+            "categories": {},
+            "config_entry_id": None,
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "device_class": None,
+            "device_id": "device1",
+            "disabled_by": "user" if idx else None,
+            "entity_category": None,
+            "entity_id": f"test.test{idx}",
+            "has_entity_name": False,
+            "hidden_by": None,
+            "icon": None,
+            "id": f"0000{idx}",
+            "labels": ["label1"],
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "name": None,
+            "options": None,
+            "original_device_class": None,
+            "original_icon": None,
+            "original_name": None,
+            "platform": "super_platform",
+            "previous_unique_id": None,
+            "supported_features": 0,
+            "translation_key": None,
+            "unique_id": f"unique{idx}",
+            "unit_of_measurement": None,
+        }
+        for idx in range(3)
+    ]
+    stored_deleted_entities = [
+        {
+            "config_entry_id": None,
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "entity_id": "test.deleted",
+            "id": "00009",
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "orphaned_timestamp": None,
+            "platform": "super_platform",
+            "unique_id": "deleted",
+        }
+    ]
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {
+            "entities": stored_entities,
+            "deleted_entities": stored_deleted_entities,
+        },
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    assert len(registry.entities) == 3
+    assert list(registry.entities) == ["test.test0", "test.test1", "test.test2"]
+    assert "test.test1" in registry.entities
+    assert len(registry.deleted_entities) == 1
+    assert not registry.entities.data
+    assert not registry.deleted_entities.data
+
+    assert registry.async_get_entity_id("test", "super_platform", "unique1") == (
+        "test.test1"
+    )
+    assert registry.async_get("test.test1").disabled_by is er.RegistryEntryDisabler.USER
+    assert registry.async_get("00002").entity_id == "test.test2"
+    assert set(registry.entities.data) == {"test.test1", "test.test2"}
+
+    # Saving does not create the entries which have not been accessed
+    registry.async_update_entity("test.test1", name="Updated")
+    registry.async_remove("test.test2")
+    await flush_store(registry._store)
+    data = hass_storage[er.STORAGE_KEY]["data"]
+    assert [entity["entity_id"] for entity in data["entities"]] == [
+        "test.test1",
+        "test.test0",
+    ]
+    assert data["entities"][0]["name"] == "Updated"
+    assert data["entities"][1] == stored_entities[0]
+    assert [entity["entity_id"] for entity in data["deleted_entities"]] == [
+        "test.test2",
+        "test.deleted",
+    ]
+    assert set(registry.entities.data) == {"test.test1"}
+    assert not registry.deleted_entities._stored.keys() - {
+        ("test", "super_platform", "deleted")
+    }
+    assert registry.async_get("test.test2") is None
+    assert registry.async_get("00002") is None
+
+    assert [
+        entry.entity_id for entry in er.async_entries_for_device(registry, "device1")
+    ] == ["test.test0"]
+    deleted_entry = registry.deleted_entities[("test", "super_platform", "deleted")]
+    assert deleted_entry.entity_id == "test.deleted"
+    assert len(registry.deleted_entities) == 2
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_start_and_purge_do_not_create_stored_entries(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test writing unavailable states and purging only create needed entries."""
+    hass.set_state(CoreState.not_running)
+    stored_entities = [
+        {
+            "aliases": [],
+            "area_id": None,
+            "capabilities": None,
+            "categories": {},
+            "config_entry_id": None,
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "device_class": None,
+            "device_id": None,
+            "disabled_by": "user" if object_id == "disabled" else None,
+            "entity_category": None,
+            "entity_id": f"test.{object_id}",
+            "has_entity_name": False,
+            "hidden_by": None,
+            "icon": None,
+            "id": object_id,
+            "labels": [],
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "name": None,
+            "options": None,
+            "original_device_class": None,
+            "original_icon": None,
+            "original_name": None,
+            "platform": "super_platform",
+            "previous_unique_id": None,
+            "supported_features": 0,
+            "translation_key": None,
+            "unique_id": object_id,
+            "unit_of_measurement": None,
+        }
+        for object_id in ("missing", "disabled", "existing")
+    ]
+    stored_deleted_entities = [
+        {
+            "config_entry_id": None,
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "entity_id": f"test.{unique_id}",
+            "id": unique_id,
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "orphaned_timestamp": orphaned_timestamp,
+            "platform": "super_platform",
+            "unique_id": unique_id,
+        }
+        for unique_id, orphaned_timestamp in (
+            ("expired", 0.0),
+            ("orphaned", 4102444800.0),
+            ("deleted", None),
+        )
+    ]
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {
+            "entities": stored_entities,
+            "deleted_entities": stored_deleted_entities,
+        },
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+    hass.states.async_set("test.existing", "on")
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START, {})
+    await hass.async_block_till_done()
+
+    assert hass.states.get("test.missing").state == STATE_UNAVAILABLE
+    assert hass.states.get("test.disabled") is None
+    assert hass.states.get("test.existing").state == "on"
+    assert set(registry.entities.data) == {"test.missing"}
+    assert set(registry.entities._stored) == {"test.disabled", "test.existing"}
+
+    registry.async_purge_expired_orphaned_entities()
+
+    assert set(registry.deleted_entities) == {
+        ("test", "super_platform", "orphaned"),
+        ("test", "super_platform", "deleted"),
+    }
+    assert not registry.deleted_entities.data
+
+
 def test_async_get_entity_id(entity_registry: er.EntityRegistry) -> None:
     """Test that entity_id is returned."""
     entry = entity_registry.async_get_or_create("light", "hue", "1234")
@@ -2035,6 +2035,73 @@ async def test_track_template_result_with_group(hass: HomeAssistant) -> None:
     assert specific_runs[-1] == 100.1 + 200.2 + 0 + 800.8
 
 
+async def test_track_template_result_aggregate(hass: HomeAssistant) -> None:
+    """Test aggregates of the states of a group are updated without rendering."""
+    hass.states.async_set(
+        "group.power_sensors", "on", {"entity_id": ["sensor.power_1", "sensor.power_2"]}
+    )
+    hass.states.async_set("sensor.power_1", "100.1")
+    hass.states.async_set("sensor.power_2", "200.2")
+    hass.states.async_set("sensor.power_3", "400.4")
+    template_sum = Template(
+        "{{ expand('group.power_sensors') | map(attribute='state')"
+        " | map('float', 0) | sum | round(1) }}",
+        hass,
+    )
+    specific_runs = []
+
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append(updates.pop().result)
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as mock_render:
+        info = async_track_template_result(
+            hass, [TrackTemplate(template_sum, None)], specific_run_callback
+        )
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 1
+
+        hass.states.async_set("sensor.power_1", "0")
+        await hass.async_block_till_done()
+        assert specific_runs == [200.2]
+        assert mock_render.call_count == 1
+
+        hass.states.async_set("sensor.power_2", "unavailable")
+        await hass.async_block_till_done()
+        assert specific_runs == [200.2, 0]
+        assert mock_render.call_count == 1
+
+        # A new member of the group is not tracked yet
+        hass.states.async_set(
+            "group.power_sensors",
+            "on",
+            {"entity_id": ["sensor.power_1", "sensor.power_2", "sensor.power_3"]},
+        )
+        await hass.async_block_till_done()
+        assert specific_runs == [200.2, 0, 400.4]
+        assert mock_render.call_count == 2
+        assert "sensor.power_3" in info.listeners["entities"]
+
+        hass.states.async_set("sensor.power_3", "0.4")
+        await hass.async_block_till_done()
+        assert specific_runs == [200.2, 0, 400.4, 0.4]
+        assert mock_render.call_count == 2
+
+        # Refreshing always renders the template
+        info.async_refresh()
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 3
+
+    info.async_remove()
+
+
 async def test_track_template_result_and_conditional(hass: HomeAssistant) -> None:
     """Test tracking template with an and conditional."""
     specific_runs = []
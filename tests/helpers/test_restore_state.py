@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -17,6 +18,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    DELTA_STORAGE_KEY,
+    STATE_COMPACT_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -131,14 +134,26 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    # Nothing is written if no state changed
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
 
+    assert not mock_write_data.called
+
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        await hass.async_block_till_done()
+
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -150,7 +165,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=45))
         await hass.async_block_till_done()
 
     assert not mock_write_data.called
@@ -197,6 +212,8 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -205,6 +222,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Verify still saving
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -358,6 +376,80 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changed_states(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test only the changed states are saved until the states are compacted."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for entity_id in ("input_boolean.b1", "input_boolean.b2", "input_boolean.b3"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    def _saved_states(key: str) -> dict[str, str]:
+        return {
+            item["state"]["entity_id"]: item["state"]["state"]
+            for item in json_round_trip(hass_storage[key]["data"])
+        }
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    assert _saved_states(STORAGE_KEY) == {
+        "input_boolean.b1": "on",
+        "input_boolean.b2": "on",
+        "input_boolean.b3": "on",
+    }
+    assert DELTA_STORAGE_KEY not in hass_storage
+
+    # Nothing changed
+    await data.async_dump_changed_states()
+    assert DELTA_STORAGE_KEY not in hass_storage
+
+    freezer.tick(timedelta(minutes=15))
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_changed_states()
+    assert _saved_states(DELTA_STORAGE_KEY) == {"input_boolean.b1": "off"}
+    assert _saved_states(STORAGE_KEY)["input_boolean.b1"] == "on"
+
+    await data.async_load()
+    assert data.last_states["input_boolean.b1"].state.state == "off"
+    assert data.last_states["input_boolean.b2"].state.state == "on"
+
+    # Changed states saved before all the states are ignored
+    stale = json_round_trip(hass_storage[DELTA_STORAGE_KEY]["data"][0])
+    stale["state"]["entity_id"] = "input_boolean.b2"
+    stale["last_seen"] = "1985-10-26T01:22:00+00:00"
+    hass_storage[DELTA_STORAGE_KEY]["data"].append(stale)
+    await data.async_load()
+    assert data.last_states["input_boolean.b2"].state.state == "on"
+
+    # All the states are saved once most of them changed
+    hass.states.async_set("input_boolean.b2", "off")
+    await data.async_dump_changed_states()
+    assert _saved_states(STORAGE_KEY) == {
+        "input_boolean.b1": "off",
+        "input_boolean.b2": "off",
+        "input_boolean.b3": "on",
+    }
+    assert DELTA_STORAGE_KEY not in hass_storage
+
+    # All the states are saved once a day
+    hass.states.async_set("input_boolean.b3", "off")
+    await data.async_dump_changed_states()
+    assert _saved_states(DELTA_STORAGE_KEY) == {"input_boolean.b3": "off"}
+    freezer.tick(STATE_COMPACT_INTERVAL)
+    await data.async_dump_changed_states()
+    assert _saved_states(STORAGE_KEY)["input_boolean.b3"] == "off"
+    assert DELTA_STORAGE_KEY not in hass_storage
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -0,0 +1,75 @@
+"""Tests for the startup trace helper."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import startup_trace
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockModule, mock_integration
+
+
+async def test_startup_trace(
+    hass: HomeAssistant, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the setup of integrations is traced and written on finish."""
+    hass.set_state(CoreState.not_running)
+    hass.config.config_dir = str(tmp_path)
+    startup_trace.async_enable(hass)
+    mock_integration(hass, MockModule("comp_a"))
+    mock_integration(hass, MockModule("comp_b"))
+    mock_integration(hass, MockModule("comp_c", dependencies=["comp_a", "comp_b"]))
+    mock_integration(hass, MockModule("comp_d", dependencies=["comp_c"]))
+
+    assert await async_setup_component(hass, "comp_d", {})
+
+    trace = startup_trace.async_get(hass)
+    assert trace is not None
+    assert trace.dependencies == {"comp_c": {"comp_a", "comp_b"}, "comp_d": {"comp_c"}}
+    path = [span.integration for span in trace.critical_path()]
+    assert path[1:] == ["comp_c", "comp_d"]
+    assert path[0] in ("comp_a", "comp_b")
+
+    await startup_trace.async_finish(hass)
+    assert startup_trace.async_get(hass) is None
+    assert "Wrote startup trace" in caplog.text
+    assert "critical path: " in caplog.text
+    assert "comp_c (" in caplog.text
+
+    trace_file = tmp_path / startup_trace.TRACE_FILE
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    threads = {
+        event["tid"]: event["args"]["name"]
+        for event in events
+        if event["name"] == "thread_name"
+    }
+    assert threads[0] == "critical path"
+    spans = [event for event in events if event["ph"] == "X"]
+    assert [span["name"] for span in spans if span["tid"] == 0] == path
+    comp_d = [span["name"] for span in spans if threads[span["tid"]] == "comp_d"]
+    assert comp_d == [
+        startup_trace.SPAN_COMPONENT,
+        startup_trace.SPAN_WAIT_DEPENDENCIES,
+        startup_trace.SPAN_REQUIREMENTS,
+        startup_trace.SPAN_IMPORT,
+        "setup",
+    ]
+    for span in spans:
+        assert span["ts"] >= 0
+        assert span["dur"] >= 0
+
+
+async def test_startup_trace_disabled(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test nothing is traced if tracing is not enabled."""
+    hass.set_state(CoreState.not_running)
+    hass.config.config_dir = str(tmp_path)
+    mock_integration(hass, MockModule("comp"))
+
+    assert await async_setup_component(hass, "comp", {})
+    assert startup_trace.async_get(hass) is None
+
+    await startup_trace.async_finish(hass)
+    assert not (tmp_path / startup_trace.TRACE_FILE).exists()
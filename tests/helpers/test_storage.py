@@ -1180,3 +1180,87 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_binary_round_trip(tmpdir: py.path.local) -> None:
+    """Test a binary copy is written and loaded while it is up to date."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, atomic_writes=True, binary=True
+        )
+        binary_path = f"{store.path}{storage.BINARY_SUFFIX}"
+        await store.async_save({"set": {1}, "tuple": (1, 2), "hello": "world"})
+        # The binary copy is only written at the final write
+        assert not os.path.exists(binary_path)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert os.path.isfile(binary_path)
+        expected = {"set": [1], "tuple": [1, 2], "hello": "world"}
+
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json",
+            side_effect=AssertionError("JSON should not be loaded"),
+        ):
+            assert await store.async_load() == expected
+
+        # A changed JSON file is loaded instead of the stale binary copy
+        def _edit_json() -> None:
+            with open(store.path, "rb") as fdesc:
+                data = json.loads(fdesc.read())
+            data["data"]["hello"] = "edited"
+            with open(store.path, "w", encoding="utf-8") as fdesc:
+                fdesc.write(json.dumps(data))
+
+        await hass.async_add_executor_job(_edit_json)
+        assert await store.async_load() == {**expected, "hello": "edited"}
+
+        # A corrupt binary copy is ignored
+        await store.async_save(MOCK_DATA)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        def _corrupt_binary() -> None:
+            with open(binary_path, "r+b") as fdesc:
+                fdesc.seek(-2, os.SEEK_END)
+                fdesc.write(b"\x00\x00")
+
+        await hass.async_add_executor_job(_corrupt_binary)
+        assert await store.async_load() == MOCK_DATA
+
+        await store.async_remove()
+        assert not os.path.exists(store.path)
+        assert not os.path.exists(binary_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_binary_preload(tmpdir: py.path.local) -> None:
+    """Test the store manager preloads the binary copy."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        await storage.Store(hass, MOCK_VERSION, MOCK_KEY, binary=True).async_save(
+            MOCK_DATA
+        )
+        await hass.async_stop(force=True)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json",
+            side_effect=AssertionError("JSON should not be loaded"),
+        ):
+            await store_manager.async_preload([MOCK_KEY])
+        assert store_manager.async_fetch(MOCK_KEY) == (
+            True,
+            {
+                "version": MOCK_VERSION,
+                "minor_version": 1,
+                "key": MOCK_KEY,
+                "data": MOCK_DATA,
+            },
+        )
+        await hass.async_stop(force=True)
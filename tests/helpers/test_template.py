@@ -6,13 +6,16 @@ from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
+from pathlib import Path
 import random
 from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -22,6 +25,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -1838,6 +1842,19 @@ def test_render_with_possible_json_value_valid_with_is_defined(
     assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == "world"
 
 
+def test_render_with_possible_json_value_parsed_json(hass: HomeAssistant) -> None:
+    """Render with possible JSON value with the JSON already parsed."""
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    with patch("homeassistant.helpers.template.json_loads") as mock_json_loads:
+        assert (
+            tpl.async_render_with_possible_json_value(
+                '{"hello": "world"}', value_json={"hello": "parsed"}
+            )
+            == "parsed"
+        )
+    mock_json_loads.assert_not_called()
+
+
 def test_render_with_possible_json_value_undefined_json(hass: HomeAssistant) -> None:
     """Render with possible JSON value with unknown JSON object."""
     tpl = template.Template("{{ value_json.bye|is_defined }}", hass)
@@ -5170,6 +5187,158 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_bytecode_cache(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test compiled templates are cached across restarts."""
+    hass.config.config_dir = str(tmp_path)
+    template_string = "{{ '1' | float(0) + 1 }}"
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(template_string, hass).async_render() == 2.0
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert (tmp_path / ".storage" / template.BYTECODE_CACHE_FILE).exists()
+
+    # Simulate a restart
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(jinja2.Environment, "compile") as mock_compile:
+        assert template.Template(template_string, hass).async_render() == 2.0
+    mock_compile.assert_not_called()
+
+
+async def test_bytecode_cache_version_change(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test the bytecode cache is discarded when the versions change."""
+    hass.config.config_dir = str(tmp_path)
+    await template.async_load_bytecode_cache(hass)
+    template.Template("{{ 1 + 1 }}", hass).async_render()
+    await hass.async_add_executor_job(hass.data[template._BYTECODE_CACHE].save)
+
+    hass.data.pop(template._ENVIRONMENT)
+    with patch(
+        "homeassistant.helpers.template._bytecode_cache_version",
+        return_value=("0.1", "2.0", b"0000"),
+    ):
+        await template.async_load_bytecode_cache(hass)
+    with patch.object(
+        jinja2.Environment,
+        "compile",
+        autospec=True,
+        side_effect=jinja2.Environment.compile,
+    ) as mock_compile:
+        template.Template("{{ 1 + 1 }}", hass).async_render()
+    mock_compile.assert_called_once()
+
+
+def test_bytecode_cache_size_limit(tmp_path: Path) -> None:
+    """Test the least recently used entries are not saved once the cache is full."""
+    path = str(tmp_path / template.BYTECODE_CACHE_FILE)
+    bytecode_cache = template.TemplateBytecodeCache(path, ())
+    code = compile("1", "<template>", "eval")
+    keys = [bytecode_cache.key("default", str(idx)) for idx in range(3)]
+    for key in keys:
+        bytecode_cache.set(key, code)
+    assert bytecode_cache.get(keys[0])
+    entry_size = len(keys[0]) + len(marshal.dumps(code))
+    with patch.object(template, "BYTECODE_CACHE_MAX_SIZE", 2 * entry_size):
+        bytecode_cache.save()
+
+    bytecode_cache = template._load_bytecode_cache(path)
+    assert bytecode_cache.get(keys[0])
+    assert bytecode_cache.get(keys[1]) is None
+    assert bytecode_cache.get(keys[2])
+
+
+@pytest.mark.parametrize(
+    ("template_string", "aggregate"),
+    [
+        (
+            "{{ expand('group.power') | map(attribute='state') | map('float', 0) | sum }}",
+            True,
+        ),
+        (
+            "{{ 'group.power' | expand | map(attribute='state') | map('float', 0)"
+            " | list | max }}",
+            True,
+        ),
+        ("{{ states.sensor | map(attribute='state') | map('float', 0) | min }}", True),
+        (
+            "{{ area_entities('kitchen') | map('states') | map('float', 0)"
+            " | average | round(2) }}",
+            True,
+        ),
+        (
+            "{{ 'kitchen' | area_entities | map('states') | map('int', 0)"
+            " | average(0) }}",
+            True,
+        ),
+        (
+            "{{ label_entities('power') | map('states') | map('float', 0) | sum }}",
+            True,
+        ),
+        (
+            "{{ ['sensor.power_1', 'sensor.missing'] | map('states')"
+            " | map('float', 1) | sum }}",
+            True,
+        ),
+        # The states of the group are not all numbers
+        ("{{ states.sensor | map(attribute='state') | map('float') | sum }}", True),
+        (
+            "{{ states.sensor | map(attribute='state') | map('float', 0) | list }}",
+            False,
+        ),
+        ("{{ states.sensor | map(attribute='name') | map('float', 0) | sum }}", False),
+        ("{{ states.sensor | map(attribute='state') | map('float', x) | sum }}", False),
+        (
+            "{{ states.sensor | map(attribute='state') | map('float', 0) | sum }} W",
+            False,
+        ),
+        ("{{ expand(group) | map(attribute='state') | map('float', 0) | sum }}", False),
+    ],
+)
+async def test_render_aggregate_to_info(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+    label_registry: lr.LabelRegistry,
+    template_string: str,
+    aggregate: bool,
+) -> None:
+    """Test aggregates of the states of a group render like the template."""
+    area_registry.async_create("kitchen")
+    label_registry.async_create("power")
+    for idx in range(1, 4):
+        entity_registry.async_get_or_create(
+            "sensor",
+            "test",
+            f"power_{idx}",
+            suggested_object_id=f"power_{idx}",
+        )
+        entity_registry.async_update_entity(
+            f"sensor.power_{idx}", area_id="kitchen", labels={"power"}
+        )
+        hass.states.async_set(f"sensor.power_{idx}", str(idx * 100.1))
+    hass.states.async_set(
+        "group.power", "on", {"entity_id": ["sensor.power_1", "sensor.power_3"]}
+    )
+    tpl = template.Template(template_string, hass)
+    variables = {"x": 0, "group": "group.power"}
+    info = tpl.async_render_to_info(variables)
+
+    hass.states.async_set("sensor.power_2", "1.5")
+    hass.states.async_set("sensor.power_3", "unknown")
+    aggregate_info = tpl.async_render_aggregate_to_info(variables, info)
+    info = tpl.async_render_to_info(variables)
+    if not aggregate or info.exception:
+        assert aggregate_info is None
+        return
+    assert aggregate_info is not None
+    assert aggregate_info.result() == info.result()
+    assert aggregate_info.entities == info.entities
+    assert aggregate_info.domains == info.domains
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
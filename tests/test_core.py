@@ -69,6 +69,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from .common import (
     async_capture_events,
+    async_fire_time_changed,
     async_mock_service,
     help_test_all,
     import_and_test_deprecated_constant_enum,
@@ -1169,6 +1170,209 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_batched_listener(hass: HomeAssistant) -> None:
+    """Test batched listeners receive all events of a loop iteration at once."""
+    calls: list[list[ha.Event]] = []
+
+    @ha.callback
+    def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        calls.append(events)
+
+    unsub = hass.bus.async_listen_batched("test", listener)
+
+    for idx in range(5):
+        hass.bus.async_fire("test", {"idx": idx})
+    assert calls == []
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert [event.data["idx"] for event in calls[0]] == [0, 1, 2, 3, 4]
+
+    hass.bus.async_fire("test", {"idx": 5})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert [event.data["idx"] for event in calls[1]] == [5]
+
+    hass.bus.async_fire("test", {"idx": 6})
+    unsub()
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+
+
+async def test_eventbus_batched_listener_filter(hass: HomeAssistant) -> None:
+    """Test batched listeners only collect events that pass the filter."""
+    calls: list[list[ha.Event]] = []
+
+    async def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        calls.append(events)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data["filtered"]
+
+    unsub = hass.bus.async_listen_batched("test", listener, event_filter=mock_filter)
+
+    hass.bus.async_fire("test", {"filtered": True})
+    await hass.async_block_till_done()
+    assert calls == []
+
+    hass.bus.async_fire("test", {"filtered": False})
+    hass.bus.async_fire("test", {"filtered": True})
+    hass.bus.async_fire("test", {"filtered": False})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert len(calls[0]) == 2
+
+    unsub()
+
+    def not_a_callback(event_data):
+        """Not decorated with callback."""
+        return True
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batched("test", listener, event_filter=not_a_callback)
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batched(EVENT_STATE_REPORTED, listener)
+
+
+async def test_eventbus_batched_listener_window(hass: HomeAssistant) -> None:
+    """Test batched listeners with a batch window."""
+    calls: list[list[ha.Event]] = []
+
+    @ha.callback
+    def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        calls.append(events)
+
+    unsub = hass.bus.async_listen_batched("test", listener, batch_window=5)
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert len(calls[0]) == 2
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    unsub()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=12))
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+
+async def test_eventbus_batched_listener_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an exception in a batched listener is logged."""
+
+    @ha.callback
+    def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        raise ValueError("boom")
+
+    hass.bus.async_listen_batched("test", listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert "Error running job" in caplog.text
+    assert "boom" in caplog.text
+
+
+async def test_eventbus_listener_stats(hass: HomeAssistant) -> None:
+    """Test recording call statistics for event bus listeners."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def failing_listener(event):
+        """Mock listener that raises."""
+        raise ValueError
+
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_listen("test", failing_listener)
+    assert hass.bus.listener_stats_enabled is False
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert hass.bus.async_listener_stats() == []
+
+    hass.bus.async_enable_listener_stats()
+    assert hass.bus.listener_stats_enabled is True
+    with patch("homeassistant.core.time.perf_counter", side_effect=[0, 0.003] * 6):
+        hass.bus.async_fire("test")
+        hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 6
+
+    stats = hass.bus.async_listener_stats()
+    assert stats == [
+        {
+            "name": "tests.test_core.test_eventbus_listener_stats.<locals>.listener",
+            "integration": "tests",
+            "calls": 4,
+            "total_time": pytest.approx(0.012),
+            "p50": 0.004096,
+            "p99": 0.004096,
+        },
+        {
+            "name": (
+                "tests.test_core.test_eventbus_listener_stats.<locals>.failing_listener"
+            ),
+            "integration": "tests",
+            "calls": 2,
+            "total_time": pytest.approx(0.006),
+            "p50": 0.004096,
+            "p99": 0.004096,
+        },
+    ]
+
+    # Listeners that are removed and added again share their statistics
+    remove_listener = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    remove_listener()
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert hass.bus.async_listener_stats()[0]["calls"] == 10
+
+    hass.bus.async_disable_listener_stats()
+    assert hass.bus.async_listener_stats() == []
+
+
+def test_event_listener_stats_percentile() -> None:
+    """Test the latency percentiles of event listener statistics."""
+    stats = ha.EventListenerStats("listener", "demo")
+    assert stats.percentile(50) == 0.0
+    for _ in range(98):
+        stats.add(0.00001)
+    stats.add(0.1)
+    stats.add(100)
+
+    assert stats.calls == 100
+    assert stats.percentile(50) == 0.000016
+    assert stats.percentile(99) == 0.131072
+    assert stats.percentile(100) == 16.777216
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1512,6 +1716,49 @@ async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     assert hass.states.get("light.bowl").state == "on"
 
 
+async def test_statemachine_columnar_snapshot(hass: HomeAssistant) -> None:
+    """Test the columnar snapshot follows state changes."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("switch.ac", "off")
+
+    snapshot = hass.states.async_columnar_snapshot()
+    assert snapshot is hass.states.async_columnar_snapshot()
+    assert len(snapshot) == 2
+    assert snapshot.entity_ids == ("light.bowl", "switch.ac")
+    assert snapshot.states == ("on", "off")
+    assert snapshot.attributes == ({"brightness": 100}, {})
+    assert snapshot.domains == ("light", "switch")
+    assert snapshot.domain_indexes == (0, 1)
+    light_state = hass.states.get("light.bowl")
+    assert snapshot.last_changed_timestamps[0] == light_state.last_changed_timestamp
+
+    # Reporting the same state does not invalidate the snapshot
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    assert hass.states.async_columnar_snapshot() is snapshot
+
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("light.kitchen", "on")
+    new_snapshot = hass.states.async_columnar_snapshot()
+    assert new_snapshot is not snapshot
+    assert snapshot.states == ("on", "off")
+    assert new_snapshot.entity_ids == ("light.bowl", "switch.ac", "light.kitchen")
+    assert new_snapshot.states == ("off", "off", "on")
+    assert new_snapshot.domain_rows("light") == [0, 2]
+    assert new_snapshot.domain_rows("sensor") == []
+
+    assert hass.states.async_remove("light.bowl")
+    snapshot = hass.states.async_columnar_snapshot()
+    assert snapshot.entity_ids == ("light.kitchen", "switch.ac")
+    assert snapshot.states == ("on", "off")
+    assert snapshot.domain_rows("switch") == [1]
+
+    assert hass.states.async_remove("switch.ac")
+    assert not hass.states.async_remove("switch.ac")
+    snapshot = hass.states.async_columnar_snapshot()
+    assert snapshot.entity_ids == ("light.kitchen",)
+    assert snapshot.domain_indexes == (0,)
+
+
 async def test_statemachine_last_changed_not_updated_on_same_state(
     hass: HomeAssistant,
 ) -> None:
@@ -1,6 +1,7 @@
 """Test to verify that we can load components."""
 
 import asyncio
+import concurrent.futures
 import os
 import pathlib
 import sys
@@ -2025,3 +2026,120 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_async_get_import_graph(hass: HomeAssistant) -> None:
+    """Test the import graph holds the platforms imported by each integration."""
+    integration = await loader.async_get_integration(hass, "hue")
+    await integration.async_get_component()
+    await integration.async_get_platforms(["light"])
+
+    graph = loader.async_get_import_graph(hass)
+    assert "light" in graph["hue"]
+    assert "hue" not in graph["hue"]
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_async_prefetch_imports(hass: HomeAssistant) -> None:
+    """Test prefetching the imports of an integration and its platforms."""
+    integration = await loader.async_get_integration(
+        hass, "test_package_loaded_executor"
+    )
+    assert await integration.resolve_dependencies()
+    other = await loader.async_get_integration(hass, "hue")
+    imported: list[str] = []
+    module_mock = MagicMock(__file__="__init__.py")
+    started = threading.Event()
+    release = threading.Event()
+
+    def import_module(name: str) -> Any:
+        started.set()
+        release.wait(5)
+        imported.append(name)
+        return module_mock
+
+    modules = {k: v for k, v in sys.modules.items() if k != integration.pkg_path}
+    with (
+        patch.dict("sys.modules", modules, clear=True),
+        patch("homeassistant.loader.importlib.import_module", import_module),
+    ):
+        prefetch = hass.async_create_task(
+            loader.async_prefetch_imports(
+                hass,
+                [integration, other],
+                {"test_package_loaded_executor": ["light", "switch", "missing"]},
+            )
+        )
+        await hass.async_add_executor_job(started.wait, 5)
+        get_component = hass.async_create_task(integration.async_get_component())
+        await asyncio.sleep(0)
+        assert not get_component.done()
+
+        release.set()
+        await prefetch
+        assert await get_component is module_mock
+
+    assert imported[:3] == [
+        integration.pkg_path,
+        f"{integration.pkg_path}.light",
+        f"{integration.pkg_path}.switch",
+    ]
+    assert not hass.data[loader.DATA_IMPORT_PREFETCH]
+
+
+async def test_async_prefetch_imports_not_started(hass: HomeAssistant) -> None:
+    """Test a prefetch which has not started is cancelled on import."""
+    integration = await loader.async_get_integration(hass, "hue")
+    future: concurrent.futures.Future[None] = concurrent.futures.Future()
+    hass.data[loader.DATA_IMPORT_PREFETCH]["hue"] = future
+
+    assert await integration.async_get_component() is hue
+    assert future.cancelled()
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_async_prefetch_imports_waits_for_dependencies(
+    hass: HomeAssistant,
+) -> None:
+    """Test the prefetches of the dependencies are waited for on import."""
+    integration = await loader.async_get_integration(
+        hass, "test_package_loaded_executor"
+    )
+    integration._all_dependencies_resolved = True
+    integration._all_dependencies = {"dependency"}
+    future: concurrent.futures.Future[None] = concurrent.futures.Future()
+    hass.data[loader.DATA_IMPORT_PREFETCH]["dependency"] = future
+
+    await integration.async_get_component()
+    assert future.cancelled()
+
+
+async def test_async_prefetch_imports_skips_event_loop_imports(
+    hass: HomeAssistant,
+) -> None:
+    """Test integrations imported in the event loop are not prefetched."""
+    integrations: list[loader.Integration] = []
+    for domain, manifest, dependencies in (
+        ("executor", {}, set()),
+        ("event_loop", {"import_executor": False}, set()),
+        ("depends_on_event_loop", {}, {"event_loop"}),
+        ("depends_on_unknown", {}, {"unknown"}),
+    ):
+        integration = loader.Integration(
+            hass,
+            f"homeassistant.components.{domain}",
+            None,
+            {"domain": domain, "name": domain, **manifest},  # type: ignore[typeddict-item]
+        )
+        integration._all_dependencies_resolved = True
+        integration._all_dependencies = dependencies
+        integrations.append(integration)
+
+    with patch("homeassistant.loader._prefetch_imports") as prefetch_mock:
+        await loader.async_prefetch_imports(
+            hass,
+            integrations,
+            {integration.domain: [] for integration in integrations},
+        )
+
+    prefetch_mock.assert_called_once_with("homeassistant.components.executor", [])